@@ -0,0 +1,114 @@
+"""Benchmark digest rendering with cached template fragments against f-string concatenation.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_notification_templates --users 20000 --jobs 500
+"""
+import argparse
+import random
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from database.models import Job
+from services.notification_templates import NotificationTemplates
+
+SKILLS = ["Python", "SQL", "Go", "AWS", "Docker", "Kubernetes", "React", "TypeScript",
+          "Django", "FastAPI", "PostgreSQL", "Redis", "Kafka", "Terraform", "GCP"]
+
+
+def build_jobs(count: int, rng: random.Random) -> List[Job]:
+    jobs = []
+    for i in range(count):
+        salary = rng.choice([None, rng.randrange(50, 200) * 1000])
+        jobs.append(Job(
+            id=i + 1, title=f"Software Engineer {i}", company=f"Company {i % 97}",
+            location=rng.choice([None, "Bengaluru", "Pune", "Remote"]),
+            experience_level=rng.choice(["entry", "mid", "senior"]),
+            work_type=rng.choice(["remote", "hybrid", "onsite"]),
+            salary_min=salary, salary_max=salary and salary + 40000,
+            external_url=f"https://www.linkedin.com/jobs/view/{100000 + i}",
+            updated_at=datetime(2024, 1, 1)
+        ))
+    return jobs
+
+
+def build_digests(jobs: List[Job], users: int, per_user: int, rng: random.Random) -> List[List[Dict]]:
+    return [
+        [
+            {
+                'job': job,
+                'overall_score': round(rng.uniform(30, 99), 1),
+                'matching_skills': rng.sample(SKILLS, rng.randint(1, 8))
+            }
+            for job in rng.sample(jobs, per_user)
+        ]
+        for _ in range(users)
+    ]
+
+
+def legacy_email(user_name: str, matches: List[Dict]) -> str:
+    """The previous approach: f-string concatenation of every card for every user."""
+    html_content = f"<!DOCTYPE html><html><head><style>/* ~1.5KB of CSS */</style></head><body><div class=\"container\"><p>Hi {user_name}</p>"
+    for match in matches:
+        job = match['job']
+        score = match['overall_score']
+        if score >= 80:
+            score_color, score_text = "#50C878", "Excellent Match"
+        elif score >= 60:
+            score_color, score_text = "#4A90E2", "Good Match"
+        else:
+            score_color, score_text = "#FFA500", "Moderate Match"
+        html_content += f"""
+                <div class="job-card">
+                    <div class="job-title">{job.title}</div>
+                    <div class="company">{job.company} • {job.location or 'Location not specified'}</div>
+                    <div class="match-score" style="background-color: {score_color};">{score}% {score_text}</div>
+                    <div class="job-details">
+                        <p><strong>Experience Level:</strong> {job.experience_level or 'Not specified'}</p>
+                        <p><strong>Work Type:</strong> {job.work_type or 'Not specified'}</p>
+                        <p><strong>Salary:</strong> {f'${job.salary_min:,} - ${job.salary_max:,}' if job.salary_min and job.salary_max else 'Not disclosed'}</p>
+                    </div>
+                    <div class="skills"><strong>Matching Skills:</strong> {', '.join(match.get('matching_skills', [])[:5])}</div>
+                    <a href="{job.external_url or '#'}" class="btn">View Job Details</a>
+                </div>
+            """
+    html_content += "</div></body></html>"
+    return html_content
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--per-user", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    jobs = build_jobs(args.jobs, rng)
+    digests = build_digests(jobs, args.users, args.per_user, rng)
+
+    start = time.perf_counter()
+    templates = NotificationTemplates(cache_dir=None)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i, matches in enumerate(digests):
+        templates.render_email(f"User {i}", matches)
+    cached_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i, matches in enumerate(digests):
+        legacy_email(f"User {i}", matches)
+    legacy_time = time.perf_counter() - start
+
+    print(f"users x matches:    {args.users} x {args.per_user} ({args.jobs} distinct jobs)")
+    print(f"compile:            {compile_time * 1000:.1f} ms (once per process)")
+    print(f"cached fragments:   {cached_time / args.users * 1e6:.1f} us/email")
+    print(f"f-string loop:      {legacy_time / args.users * 1e6:.1f} us/email")
+    print(f"speedup:            {legacy_time / cached_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark the offline scrape pipeline: replay -> parse -> normalize -> upsert.
+
+Generates LinkedIn guest-page fixtures (or uses recorded ones) and runs them
+through ReplaySource and ScrapeRunner against a throwaway SQLite database.
+Run from the backend directory:
+
+    python -m benchmarks.bench_scrape_pipeline --jobs 2000
+    python -m benchmarks.bench_scrape_pipeline --fixtures path/to/fixtures --query "python developer"
+    python -m benchmarks.bench_scrape_pipeline --jobs 2000 --no-dedup
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="workwale-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/bench.db"
+
+from database.database import Base, engine, SessionLocal  # noqa: E402
+from database import models  # noqa: E402,F401
+from scrapers.linkedin_source import LinkedInSource  # noqa: E402
+from scrapers.replay_source import ReplaySource, fixture_slug  # noqa: E402
+from scrapers.runner import ScrapeRunner, ScrapeTask  # noqa: E402
+
+CARD = """<li><div class="base-card job-search-card" data-entity-urn="urn:li:jobPosting:{id}">
+<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{id}?trk=bench"></a>
+<h3 class="base-search-card__title">{title}</h3>
+<h4 class="base-search-card__subtitle"><a>{company}</a></h4>
+<span class="job-search-card__location">{location}</span>
+<time class="job-search-card__listdate" datetime="2024-05-01">1 week ago</time>
+</div></li>"""
+
+DETAIL = """<section><div class="show-more-less-html__markup">{description}</div>
+<ul class="description__job-criteria-list">
+<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">Seniority level</h3>
+<span class="description__job-criteria-text">{seniority}</span></li>
+<li class="description__job-criteria-item"><h3 class="description__job-criteria-subheader">Employment type</h3>
+<span class="description__job-criteria-text">Full-time</span></li></ul>
+<div class="salary compensation__salary">${low},000.00/yr - ${high},000.00/yr</div></section>"""
+
+TITLES = ["Backend Engineer", "Data Scientist", "Frontend Developer", "DevOps Engineer", "ML Engineer"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+LOCATIONS = ["Bengaluru, India", "Pune, India", "Remote", "Hyderabad, India"]
+SKILLS = ["Python", "FastAPI", "PostgreSQL", "React", "TypeScript", "Docker", "Kubernetes",
+          "AWS", "Machine Learning", "PyTorch", "Go", "Redis", "Kafka", "Terraform"]
+
+
+def generate_fixtures(root: Path, query: str, location: str, count: int, page_size: int):
+    """Write synthetic listing and detail pages in the ReplaySource layout."""
+    rng = random.Random(11)
+    source_dir = root / "linkedin"
+    listing_dir = source_dir / fixture_slug(query, location)
+    detail_dir = source_dir / "detail"
+    listing_dir.mkdir(parents=True, exist_ok=True)
+    detail_dir.mkdir(parents=True, exist_ok=True)
+
+    for page in range((count + page_size - 1) // page_size):
+        cards = []
+        for i in range(page * page_size, min(count, (page + 1) * page_size)):
+            job_id = 4000000000 + i
+            cards.append(CARD.format(id=job_id, title=rng.choice(TITLES),
+                                     company=rng.choice(COMPANIES), location=rng.choice(LOCATIONS)))
+            description = " ".join(
+                f"We use {skill} daily and value ownership." for skill in rng.sample(SKILLS, 5)
+            ) * 10
+            low = rng.randint(10, 40)
+            (detail_dir / f"{job_id}.html").write_text(DETAIL.format(
+                description=description, seniority=rng.choice(["Entry level", "Mid-Senior level"]),
+                low=low, high=low + 10
+            ))
+        (listing_dir / f"page_{page:04d}.html").write_text("\n".join(cards))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--fixtures", help="Use recorded fixtures instead of generating them")
+    parser.add_argument("--query", default="software engineer")
+    parser.add_argument("--location", default="India")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--no-dedup", action="store_true", help="Skip the near-duplicate check")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+
+    fixtures_dir = args.fixtures
+    if not fixtures_dir:
+        fixtures_dir = os.path.join(_DB_DIR, "fixtures")
+        generate_fixtures(Path(fixtures_dir), args.query, args.location, args.jobs, LinkedInSource.page_size)
+
+    source = ReplaySource(fixtures_dir, parser=LinkedInSource())
+    source.max_pages = 10 ** 6
+    options = {"deduplicator": None} if args.no_dedup else {}
+    runner = ScrapeRunner(session_factory=SessionLocal, batch_size=args.batch_size, **options)
+
+    for label in ("insert", "update"):
+        start = time.perf_counter()
+        result = runner.run([ScrapeTask(source, args.query, args.location, limit=args.jobs)])[0]
+        elapsed = time.perf_counter() - start
+        print(f"{label}: {result['found']} jobs in {elapsed:.2f}s "
+              f"({result['found'] / elapsed:.0f} jobs/s; {result['created']} new, {result['updated']} updated)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark the compiled skill extractor against the old substring loop.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_skill_extractor --vocab-size 5000 --docs 2000
+
+Synthetic documents pad the vocabulary to --vocab-size; to measure real
+postings against the built-in vocabulary instead, pass --descriptions (a
+file with one description per line, or a JSON list) or --from-db (the
+newest job descriptions in DATABASE_URL).
+"""
+import argparse
+import json
+import random
+import string
+import time
+from typing import Dict, List
+
+from services.skill_extractor import SkillExtractor, DEFAULT_VOCABULARY_PATH
+
+
+def _random_word(rng: random.Random, length: int) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def build_vocabulary(base: SkillExtractor, size: int, rng: random.Random) -> Dict[str, List[str]]:
+    """Pad the built-in vocabulary with synthetic multi-word skills up to size terms."""
+    vocabulary: Dict[str, List[str]] = {}
+    for term, canonical in base.lookup.items():
+        vocabulary.setdefault(canonical, []).append(term)
+
+    terms = set(base.lookup)
+    while len(terms) < size:
+        name = ' '.join(_random_word(rng, rng.randint(4, 9)) for _ in range(rng.randint(1, 3)))
+        vocabulary[name.title()] = [name.replace(' ', '-')]
+        terms.update([name, name.replace(' ', '-')])
+    return vocabulary
+
+
+def build_documents(vocabulary: Dict[str, List[str]], count: int, rng: random.Random) -> List[str]:
+    """Generate job-description-sized documents that mention a few skills each."""
+    skills = list(vocabulary)
+    filler = [_random_word(rng, rng.randint(2, 10)) for _ in range(2000)]
+    documents = []
+    for _ in range(count):
+        words = [rng.choice(filler) for _ in range(400)]
+        for skill in rng.sample(skills, 8):
+            words.insert(rng.randrange(len(words)), skill)
+        documents.append(' '.join(words))
+    return documents
+
+
+def load_descriptions(path: str, count: int) -> List[str]:
+    """Descriptions from a JSON list or a file with one per line."""
+    with open(path) as f:
+        text = f.read()
+    try:
+        documents = json.loads(text)
+    except ValueError:
+        documents = text.splitlines()
+    return [doc for doc in documents if doc and doc.strip()][:count]
+
+
+def load_database_descriptions(count: int) -> List[str]:
+    """The newest job descriptions in DATABASE_URL."""
+    from database.database import SessionLocal
+    from database.models import Job
+
+    db = SessionLocal()
+    try:
+        rows = db.query(Job.description).filter(Job.description.isnot(None)).order_by(Job.id.desc()).limit(count)
+        return [description for (description,) in rows]
+    finally:
+        db.close()
+
+
+def legacy_extract(vocabulary: Dict[str, List[str]], text: str) -> List[str]:
+    """The previous approach: one lowercase substring scan per vocabulary entry."""
+    found = []
+    text_lower = text.lower()
+    for skill in vocabulary:
+        if skill.lower() in text_lower:
+            found.append(skill)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vocab-size", type=int, default=5000)
+    parser.add_argument("--docs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--descriptions", help="File of real job descriptions (JSON list or one per line)")
+    parser.add_argument("--from-db", action="store_true", help="Use job descriptions from DATABASE_URL")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    base = SkillExtractor.from_files(DEFAULT_VOCABULARY_PATH)
+    if args.descriptions or args.from_db:
+        # Real text against the shipped vocabulary, unpadded
+        vocabulary = build_vocabulary(base, 0, rng)
+        if args.descriptions:
+            documents = load_descriptions(args.descriptions, args.docs)
+        else:
+            documents = load_database_descriptions(args.docs)
+        if not documents:
+            parser.error("no descriptions to benchmark")
+    else:
+        vocabulary = build_vocabulary(base, args.vocab_size, rng)
+        documents = build_documents(vocabulary, args.docs, rng)
+
+    start = time.perf_counter()
+    extractor = SkillExtractor(vocabulary)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = 0
+    for doc in documents:
+        found += len(extractor.extract(doc))
+    compiled_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for doc in documents:
+        legacy_extract(vocabulary, doc)
+    legacy_time = time.perf_counter() - start
+
+    print(f"vocabulary terms:   {len(extractor)}")
+    print(f"documents:          {len(documents)} (avg {sum(map(len, documents)) // len(documents)} chars)")
+    print(f"skills found:       {found / len(documents):.1f}/doc")
+    print(f"compile:            {compile_time * 1000:.1f} ms (once per process)")
+    print(f"compiled extractor: {compiled_time / len(documents) * 1e6:.1f} us/doc")
+    print(f"substring loop:     {legacy_time / len(documents) * 1e6:.1f} us/doc")
+    print(f"speedup:            {legacy_time / compiled_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Run the Alembic migrations from code (app startup, benchmarks)."""
+from pathlib import Path
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def alembic_config(url: Optional[str] = None) -> Config:
+    """Config for migrations/; targets DATABASE_URL unless url is given."""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    if url:
+        config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    # Keep the application's logging setup
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def upgrade_to_head(url: Optional[str] = None):
+    """Create or upgrade the schema, including the trigger-maintained tables."""
+    command.upgrade(alembic_config(url), "head")
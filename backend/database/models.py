@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Boolean, Float, ForeignKey, JSON, Index, UniqueConstraint, text
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from database.database import Base
 
@@ -13,6 +13,8 @@ class User(Base):
     phone = Column(String(20))
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
+    # Bumped to revoke every token issued before
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
@@ -45,6 +47,7 @@ class UserProfile(Base):
     email_notifications = Column(Boolean, default=True)
     whatsapp_notifications = Column(Boolean, default=False)
     notification_frequency = Column(String(20), default="daily")  # instant, daily, weekly
+    last_digest_at = Column(DateTime)  # Last job match digest sent (services.digest_scheduler)
     
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -54,6 +57,10 @@ class UserProfile(Base):
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_user_active_created", "user_id", "is_active", "created_at"),
+        Index("ix_resumes_user_created", "user_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -62,9 +69,9 @@ class Resume(Base):
     file_path = Column(String(500), nullable=False)
     file_size = Column(Integer)
     
-    # Parsed content
-    parsed_text = Column(Text)
-    parsed_data = Column(JSON)  # Structured resume data
+    # Parsed content; large, so only loaded on request (undefer_group("parsed"))
+    parsed_text = deferred(Column(Text), group="parsed")
+    parsed_data = deferred(Column(JSON), group="parsed")  # Structured resume data
     
     # AI analysis
     skills_extracted = Column(JSON)
@@ -81,6 +88,12 @@ class Resume(Base):
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_active_work_type", "is_active", "work_type"),
+        Index("ix_jobs_source_external_id", "source", "external_id"),
+        # Newest-first listing (keyset on created_at, id)
+        Index("ix_jobs_active_created", "is_active", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -107,6 +120,9 @@ class Job(Base):
     required_skills = Column(JSON)
     preferred_skills = Column(JSON)
     
+    # Deduplication (canonical job this posting duplicates, if any)
+    duplicate_of_id = Column(Integer, ForeignKey("jobs.id"), nullable=True)
+    
     # Status
     is_active = Column(Boolean, default=True)
     posted_date = Column(DateTime)
@@ -118,8 +134,35 @@ class Job(Base):
     applications = relationship("JobApplication", back_populates="job")
     matches = relationship("JobMatch", back_populates="job")
 
+class JobSignature(Base):
+    __tablename__ = "job_signatures"
+    
+    # MinHash signature of a posting (services.job_deduplicator)
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True)
+    signature = Column(JSON, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+class JobSignatureBand(Base):
+    __tablename__ = "job_signature_bands"
+    __table_args__ = (
+        # LSH candidate lookup: postings sharing any (band, key) with a new one
+        Index("ix_job_signature_bands_lookup", "band", "band_key"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
+    band = Column(Integer, nullable=False)
+    band_key = Column(String(16), nullable=False)
+
 class JobMatch(Base):
     __tablename__ = "job_matches"
+    __table_args__ = (
+        UniqueConstraint("user_id", "job_id", name="uq_job_matches_user_job"),
+        Index("ix_job_matches_user_viewed_score", "user_id", "is_viewed", "overall_score"),
+        # Open matches only; predicates match how each dialect renders `is_dismissed == False`
+        Index("ix_job_matches_user_open_score", "user_id", "overall_score",
+              postgresql_where=text("is_dismissed = false"), sqlite_where=text("is_dismissed = 0")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -141,6 +184,7 @@ class JobMatch(Base):
     is_recommended = Column(Boolean, default=False)
     is_viewed = Column(Boolean, default=False)
     is_dismissed = Column(Boolean, default=False)
+    notified_at = Column(DateTime)  # Included in a job match notification/digest
     
     created_at = Column(DateTime, server_default=func.now())
     
@@ -171,6 +215,14 @@ class JobApplication(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_read", "user_id", "is_read"),
+        Index("ix_notifications_user_created", "user_id", "created_at", "id"),
+        # Undelivered outbox rows only
+        Index("ix_notifications_outbox", "id",
+              postgresql_where=text("status IN ('pending', 'processing')"),
+              sqlite_where=text("status IN ('pending', 'processing')")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -184,6 +236,15 @@ class Notification(Base):
     whatsapp_sent = Column(Boolean, default=False)
     is_read = Column(Boolean, default=False)
     
+    # Outbox (rendered per-channel content, drained by services.notification_worker)
+    channels = Column(JSON)  # ["email", "whatsapp"]
+    payload = Column(JSON)  # {"email": {...}, "whatsapp": {...}}
+    status = Column(String(20), default="pending", index=True)  # pending, processing, sent, failed
+    attempts = Column(Integer, default=0)
+    next_attempt_at = Column(DateTime)
+    last_error = Column(Text)
+    delivered_at = Column(DateTime)
+    
     # Related data
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=True)
     
@@ -192,6 +253,32 @@ class Notification(Base):
     # Relationships
     user = relationship("User", back_populates="notifications")
 
+# Per-user dashboard counters, kept current by database triggers (migration 0005);
+# rebuild from the source tables with `python -m services.user_stats`
+class UserStats(Base):
+    __tablename__ = "user_stats"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    
+    # Applications
+    total_applications = Column(Integer, default=0, server_default="0", nullable=False)
+    pending_applications = Column(Integer, default=0, server_default="0", nullable=False)  # applied, reviewed
+    interviews_scheduled = Column(Integer, default=0, server_default="0", nullable=False)
+    offers_received = Column(Integer, default=0, server_default="0", nullable=False)
+    last_application_at = Column(DateTime)
+    
+    # Matches
+    total_matches = Column(Integer, default=0, server_default="0", nullable=False)  # not dismissed
+    new_matches_today = Column(Integer, default=0, server_default="0", nullable=False)  # on new_matches_date
+    new_matches_date = Column(Date)
+    last_match_at = Column(DateTime)
+    
+    # Notifications
+    unread_notifications = Column(Integer, default=0, server_default="0", nullable=False)
+    last_notification_at = Column(DateTime)
+    
+    profile_completion = Column(Float, default=0, server_default="0", nullable=False)  # percent
+
 class ScrapingJob(Base):
     __tablename__ = "scraping_jobs"
     
@@ -1,9 +1,13 @@
 from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from typing import Optional
 import uvicorn
 import os
+import hmac
+import importlib
 from dotenv import load_dotenv
 
 # Try to import database modules with fallback
@@ -15,12 +19,24 @@ except ImportError:
     DATABASE_AVAILABLE = False
     print("Warning: Database modules not available. Running in minimal mode.")
 
-# Try to import routers with fallback
-try:
-    from routers import auth, users, jobs, resume, dashboard, notifications
-    ROUTERS_AVAILABLE = True
-except ImportError:
-    ROUTERS_AVAILABLE = False
+# Try to import routers with fallback; each one separately so a missing
+# router doesn't take the others down with it
+ROUTER_SPECS = [
+    ("auth", "/api/auth", "Authentication"),
+    ("users", "/api/users", "Users"),
+    ("jobs", "/api/jobs", "Jobs"),
+    ("resume", "/api/resume", "Resume"),
+    ("dashboard", "/api/dashboard", "Dashboard"),
+    ("notifications", "/api/notifications", "Notifications"),
+]
+routers = []
+for router_name, router_prefix, router_tag in ROUTER_SPECS:
+    try:
+        routers.append((importlib.import_module(f"routers.{router_name}"), router_prefix, router_tag))
+    except ImportError as e:
+        print(f"Warning: Router module {router_name} not available: {e}")
+ROUTERS_AVAILABLE = bool(routers)
+if not ROUTERS_AVAILABLE:
     print("Warning: Router modules not available. Running with basic endpoints only.")
 
 # Try to import services with fallback
@@ -35,12 +51,15 @@ except ImportError:
 
 load_dotenv()
 
-# Create all database tables if available
-if DATABASE_AVAILABLE:
+# Create or upgrade the database schema if available. Migrations (not
+# create_all) also install the triggers that maintain user_stats; set
+# RUN_MIGRATIONS_ON_STARTUP=false when a release step runs `alembic upgrade head`
+if DATABASE_AVAILABLE and os.getenv("RUN_MIGRATIONS_ON_STARTUP", "true").lower() == "true":
     try:
-        Base.metadata.create_all(bind=engine)
+        from database.migrate import upgrade_to_head
+        upgrade_to_head()
     except Exception as e:
-        print(f"Warning: Could not create database tables: {e}")
+        print(f"Warning: Could not migrate the database: {e}")
 
 app = FastAPI(
     title="WorkWale.ai API",
@@ -62,18 +81,42 @@ app.add_middleware(
 
 # Security
 security = HTTPBearer()
+metrics_auth = HTTPBearer(auto_error=False)
 
 # Include routers if available
 if ROUTERS_AVAILABLE:
-    try:
-        app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-        app.include_router(users.router, prefix="/api/users", tags=["Users"])
-        app.include_router(jobs.router, prefix="/api/jobs", tags=["Jobs"])
-        app.include_router(resume.router, prefix="/api/resume", tags=["Resume"])
-        app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
-        app.include_router(notifications.router, prefix="/api/notifications", tags=["Notifications"])
-    except Exception as e:
-        print(f"Warning: Could not include some routers: {e}")
+    for router_module, router_prefix, router_tag in routers:
+        try:
+            app.include_router(router_module.router, prefix=router_prefix, tags=[router_tag])
+        except Exception as e:
+            print(f"Warning: Could not include router {router_tag}: {e}")
+
+@app.on_event("startup")
+async def start_background_workers():
+    if SERVICES_AVAILABLE and DATABASE_AVAILABLE:
+        from services.metrics import register_pool_metrics
+        from services.notification_worker import register_outbox_metrics
+        register_pool_metrics()
+        register_outbox_metrics()
+    
+    # Single-process deployments can drain the notification outbox in-process;
+    # otherwise run `python -m services.notification_worker` separately
+    if SERVICES_AVAILABLE and DATABASE_AVAILABLE and os.getenv("NOTIFICATION_WORKER_IN_PROCESS", "false").lower() == "true":
+        from services.notification_worker import NotificationWorker
+        app.state.notification_worker = NotificationWorker()
+        app.state.notification_worker.start_in_background()
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    worker = getattr(app.state, "notification_worker", None)
+    if worker:
+        worker.stop()
+    if SERVICES_AVAILABLE:
+        from services.notification_clients import close_clients
+        close_clients()
+    if DATABASE_AVAILABLE:
+        from database.database import dispose_async_engines
+        await dispose_async_engines()
 
 @app.get("/")
 async def root():
@@ -93,6 +136,17 @@ async def root():
 async def health_check():
     return {"status": "healthy", "service": "WorkWale.ai API"}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(credentials: Optional[HTTPAuthorizationCredentials] = Depends(metrics_auth)):
+    """Prometheus-style metrics for this process (bearer METRICS_TOKEN; disabled when unset)."""
+    token = os.getenv("METRICS_TOKEN")
+    if not token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if credentials is None or not hmac.compare_digest(credentials.credentials, token):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    from services.metrics import render_metrics, CONTENT_TYPE
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
+
 # Basic demo endpoints for when full routers aren't available
 @app.get("/api/demo")
 async def demo_endpoint():
@@ -0,0 +1,74 @@
+"""Alembic environment: migrates the database configured in database.database."""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool, text
+
+from database.database import Base, DATABASE_URL
+from database import models  # noqa: F401  (registers the tables on Base.metadata)
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+# An explicit URL (e.g. from a benchmark or CLI -x option) wins over DATABASE_URL
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option("sqlalchemy.url", DATABASE_URL.replace("%", "%%"))
+
+target_metadata = Base.metadata
+
+# Dialect-specific search structures maintained only by migrations (0003_job_search)
+UNMANAGED_TABLE_PREFIXES = ("jobs_fts",)
+UNMANAGED_COLUMNS = {("jobs", "search_vector")}
+UNMANAGED_INDEXES = {"ix_jobs_search_vector", "ix_jobs_location_trgm"}
+
+# Serializes app workers that all migrate on startup (Postgres advisory lock key)
+MIGRATION_LOCK_ID = 72616901
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate/check from proposing to drop the search structures."""
+    if type_ == "table":
+        return not name.startswith(UNMANAGED_TABLE_PREFIXES)
+    if type_ == "column":
+        return (object.table.name, name) not in UNMANAGED_COLUMNS
+    if type_ == "index":
+        return name not in UNMANAGED_INDEXES
+    return True
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout instead of running it (alembic upgrade --sql)."""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+        include_object=include_object,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with connectable.connect() as connection:
+        # Batch mode lets the same migrations alter constraints on SQLite
+        context.configure(connection=connection, target_metadata=target_metadata, render_as_batch=True,
+                          include_object=include_object)
+        with context.begin_transaction():
+            if connection.dialect.name == "postgresql":
+                # Held until the migration transaction ends
+                connection.execute(text(f"SELECT pg_advisory_xact_lock({MIGRATION_LOCK_ID})"))
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,268 @@
+"""baseline
+
+The schema as created by ``Base.metadata.create_all`` before migrations were
+introduced. Existing databases are brought up to it in place: missing tables
+are created and columns added by later features (deduplication, notification
+outbox, digests, token revocation) are added if absent, so ``alembic upgrade
+head`` works on fresh and on create_all-managed databases alike.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 04:14:13.507553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    "users", "user_profiles", "resumes", "jobs", "job_matches",
+    "job_applications", "notifications", "scraping_jobs", "system_config",
+]
+
+# Columns added to existing tables after the first release
+LATER_COLUMNS = {
+    "users": [
+        lambda: sa.Column('token_version', sa.Integer(), server_default='0', nullable=False),
+    ],
+    "user_profiles": [
+        lambda: sa.Column('last_digest_at', sa.DateTime(), nullable=True),
+    ],
+    "jobs": [
+        lambda: sa.Column('duplicate_of_id', sa.Integer(), sa.ForeignKey('jobs.id', name='fk_jobs_duplicate_of_id'),
+                          nullable=True),
+    ],
+    "job_matches": [
+        lambda: sa.Column('notified_at', sa.DateTime(), nullable=True),
+    ],
+    # Notifications sent before the outbox keep a NULL status, so the worker never re-sends them
+    "notifications": [
+        lambda: sa.Column('channels', sa.JSON(), nullable=True),
+        lambda: sa.Column('payload', sa.JSON(), nullable=True),
+        lambda: sa.Column('status', sa.String(length=20), nullable=True),
+        lambda: sa.Column('attempts', sa.Integer(), nullable=True),
+        lambda: sa.Column('next_attempt_at', sa.DateTime(), nullable=True),
+        lambda: sa.Column('last_error', sa.Text(), nullable=True),
+        lambda: sa.Column('delivered_at', sa.DateTime(), nullable=True),
+    ],
+}
+
+
+def _timestamps(*names):
+    return [sa.Column(name, sa.DateTime(), server_default=sa.func.now(), nullable=True) for name in names]
+
+
+def _create_tables() -> None:
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('full_name', sa.String(length=255), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=True),
+    sa.Column('token_version', sa.Integer(), server_default='0', nullable=False),
+    *_timestamps('created_at', 'updated_at'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_id', 'users', ['id'])
+
+    op.create_table('jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('company', sa.String(length=255), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('requirements', sa.Text(), nullable=True),
+    sa.Column('salary_min', sa.Integer(), nullable=True),
+    sa.Column('salary_max', sa.Integer(), nullable=True),
+    sa.Column('experience_level', sa.String(length=50), nullable=True),
+    sa.Column('work_type', sa.String(length=50), nullable=True),
+    sa.Column('job_type', sa.String(length=50), nullable=True),
+    sa.Column('source', sa.String(length=50), nullable=True),
+    sa.Column('external_id', sa.String(length=255), nullable=True),
+    sa.Column('external_url', sa.String(length=500), nullable=True),
+    sa.Column('required_skills', sa.JSON(), nullable=True),
+    sa.Column('preferred_skills', sa.JSON(), nullable=True),
+    sa.Column('duplicate_of_id', sa.Integer(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('posted_date', sa.DateTime(), nullable=True),
+    *_timestamps('scraped_at', 'created_at', 'updated_at'),
+    sa.ForeignKeyConstraint(['duplicate_of_id'], ['jobs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_jobs_id', 'jobs', ['id'])
+
+    op.create_table('scraping_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(length=50), nullable=True),
+    sa.Column('search_query', sa.String(length=255), nullable=True),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=True),
+    sa.Column('jobs_found', sa.Integer(), nullable=True),
+    sa.Column('jobs_saved', sa.Integer(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    *_timestamps('created_at'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_scraping_jobs_id', 'scraping_jobs', ['id'])
+
+    op.create_table('system_config',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('value', sa.Text(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    *_timestamps('created_at', 'updated_at'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key')
+    )
+    op.create_index('ix_system_config_id', 'system_config', ['id'])
+
+    op.create_table('user_profiles',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('desired_job_title', sa.String(length=255), nullable=True),
+    sa.Column('desired_location', sa.String(length=255), nullable=True),
+    sa.Column('desired_salary_min', sa.Integer(), nullable=True),
+    sa.Column('desired_salary_max', sa.Integer(), nullable=True),
+    sa.Column('experience_level', sa.String(length=50), nullable=True),
+    sa.Column('work_type', sa.String(length=50), nullable=True),
+    sa.Column('skills', sa.JSON(), nullable=True),
+    sa.Column('industries', sa.JSON(), nullable=True),
+    sa.Column('company_sizes', sa.JSON(), nullable=True),
+    sa.Column('email_notifications', sa.Boolean(), nullable=True),
+    sa.Column('whatsapp_notifications', sa.Boolean(), nullable=True),
+    sa.Column('notification_frequency', sa.String(length=20), nullable=True),
+    sa.Column('last_digest_at', sa.DateTime(), nullable=True),
+    *_timestamps('created_at', 'updated_at'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    op.create_index('ix_user_profiles_id', 'user_profiles', ['id'])
+
+    op.create_table('resumes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=False),
+    sa.Column('file_size', sa.Integer(), nullable=True),
+    sa.Column('parsed_text', sa.Text(), nullable=True),
+    sa.Column('parsed_data', sa.JSON(), nullable=True),
+    sa.Column('skills_extracted', sa.JSON(), nullable=True),
+    sa.Column('experience_years', sa.Float(), nullable=True),
+    sa.Column('education_level', sa.String(length=100), nullable=True),
+    sa.Column('job_titles', sa.JSON(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    *_timestamps('created_at', 'updated_at'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_resumes_id', 'resumes', ['id'])
+
+    op.create_table('job_matches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('job_id', sa.Integer(), nullable=True),
+    sa.Column('overall_score', sa.Float(), nullable=True),
+    sa.Column('skills_score', sa.Float(), nullable=True),
+    sa.Column('experience_score', sa.Float(), nullable=True),
+    sa.Column('location_score', sa.Float(), nullable=True),
+    sa.Column('salary_score', sa.Float(), nullable=True),
+    sa.Column('matching_skills', sa.JSON(), nullable=True),
+    sa.Column('missing_skills', sa.JSON(), nullable=True),
+    sa.Column('match_explanation', sa.Text(), nullable=True),
+    sa.Column('is_recommended', sa.Boolean(), nullable=True),
+    sa.Column('is_viewed', sa.Boolean(), nullable=True),
+    sa.Column('is_dismissed', sa.Boolean(), nullable=True),
+    sa.Column('notified_at', sa.DateTime(), nullable=True),
+    *_timestamps('created_at'),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_job_matches_id', 'job_matches', ['id'])
+
+    op.create_table('job_applications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('job_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=True),
+    sa.Column('applied_date', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('resume_used', sa.String(length=255), nullable=True),
+    sa.Column('cover_letter', sa.Text(), nullable=True),
+    *_timestamps('created_at', 'updated_at'),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_job_applications_id', 'job_applications', ['id'])
+
+    op.create_table('notifications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('type', sa.String(length=50), nullable=True),
+    sa.Column('title', sa.String(length=255), nullable=True),
+    sa.Column('message', sa.Text(), nullable=True),
+    sa.Column('email_sent', sa.Boolean(), nullable=True),
+    sa.Column('whatsapp_sent', sa.Boolean(), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=True),
+    sa.Column('channels', sa.JSON(), nullable=True),
+    sa.Column('payload', sa.JSON(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=True),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('delivered_at', sa.DateTime(), nullable=True),
+    sa.Column('job_id', sa.Integer(), nullable=True),
+    *_timestamps('created_at'),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notifications_id', 'notifications', ['id'])
+    op.create_index('ix_notifications_status', 'notifications', ['status'])
+
+
+def _add_later_columns(inspector) -> None:
+    for table, columns in LATER_COLUMNS.items():
+        existing = {column["name"] for column in inspector.get_columns(table)}
+        missing = [make() for make in columns]
+        missing = [column for column in missing if column.name not in existing]
+        if missing:
+            with op.batch_alter_table(table) as batch_op:
+                for column in missing:
+                    batch_op.add_column(column)
+
+    indexes = {index["name"] for index in inspector.get_indexes("notifications")}
+    if "ix_notifications_status" not in indexes:
+        op.create_index('ix_notifications_status', 'notifications', ['status'])
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing = set(inspector.get_table_names())
+    if not existing.intersection(TABLES):
+        _create_tables()
+    elif existing.issuperset(TABLES):
+        _add_later_columns(inspector)
+    else:
+        missing = sorted(set(TABLES) - existing)
+        raise RuntimeError(f"Partially created schema (missing {missing}); create the tables before upgrading")
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_table(table)
@@ -0,0 +1,84 @@
+"""hot path indexes
+
+Composite and partial indexes for the matching, listing, ingest and outbox
+queries, plus a unique (user_id, job_id) constraint on job_matches. Duplicate
+matches are removed first, keeping the newest row of each pair. Indexes that
+already exist (e.g. created by hand) are left alone.
+
+On large Postgres tables run this in a maintenance window, or create the
+indexes CONCURRENTLY beforehand under the same names; this revision will then
+skip them.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 05:02:41.118240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial index predicate: Postgres, or (Postgres, SQLite))
+INDEXES = [
+    # Match refresh: drop a user's unviewed low scorers
+    ("ix_job_matches_user_viewed_score", "job_matches", ["user_id", "is_viewed", "overall_score"], None),
+    # Match listing, best first, without dismissed matches
+    ("ix_job_matches_user_open_score", "job_matches", ["user_id", "overall_score"],
+     # Written the way each dialect renders `is_dismissed == False`, so the planners match it
+     ("is_dismissed = false", "is_dismissed = 0")),
+    # Active/latest resume of a user and resume listing
+    ("ix_resumes_user_active_created", "resumes", ["user_id", "is_active", "created_at"], None),
+    ("ix_jobs_active_work_type", "jobs", ["is_active", "work_type"], None),
+    # Ingest upserts look postings up by their source id
+    ("ix_jobs_source_external_id", "jobs", ["source", "external_id"], None),
+    ("ix_notifications_user_read", "notifications", ["user_id", "is_read"], None),
+    # Outbox claims only ever scan undelivered rows, in id order
+    ("ix_notifications_outbox", "notifications", ["id"], "status IN ('pending', 'processing')"),
+]
+
+UNIQUE_MATCH = "uq_job_matches_user_job"
+
+
+def _partial(predicate):
+    if predicate is None:
+        return {}
+    postgresql, sqlite = predicate if isinstance(predicate, tuple) else (predicate, predicate)
+    return {"postgresql_where": sa.text(postgresql), "sqlite_where": sa.text(sqlite)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    existing = {}
+    for table in {table for _, table, _, _ in INDEXES} | {"job_matches"}:
+        existing[table] = {index["name"] for index in inspector.get_indexes(table)}
+
+    constraints = {constraint["name"] for constraint in inspector.get_unique_constraints("job_matches")}
+    if UNIQUE_MATCH not in constraints and UNIQUE_MATCH not in existing["job_matches"]:
+        # Keep the newest match of every (user_id, job_id) pair; the rest block the constraint
+        op.execute(
+            "DELETE FROM job_matches WHERE id NOT IN ("
+            "SELECT MAX(id) FROM job_matches GROUP BY user_id, job_id)"
+        )
+        with op.batch_alter_table("job_matches") as batch_op:
+            # On SQLite this rebuilds the table, so it runs before the indexes are added
+            batch_op.create_unique_constraint(UNIQUE_MATCH, ["user_id", "job_id"])
+
+    for name, table, columns, predicate in INDEXES:
+        if name not in existing[table]:
+            op.create_index(name, table, columns, **_partial(predicate))
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    with op.batch_alter_table("job_matches") as batch_op:
+        batch_op.drop_constraint(UNIQUE_MATCH, type_="unique")
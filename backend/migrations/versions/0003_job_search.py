@@ -0,0 +1,85 @@
+"""job search
+
+Full-text search structures for services.job_search:
+
+* Postgres: a generated, weighted ``jobs.search_vector`` tsvector over
+  title/company/description with a GIN index, and a pg_trgm GIN index on
+  ``jobs.location`` so ``ILIKE '%...%'`` filters stop scanning the table.
+* SQLite: an external-content FTS5 table ``jobs_fts`` kept in sync with
+  ``jobs`` by triggers.
+
+These are dialect specific and not declared on the models; migrations/env.py
+excludes them from autogenerate.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 07:31:12.402716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FTS_COLUMNS = "title, company, description, location"
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+            ") STORED"
+        )
+        op.execute("CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING gin (search_vector)")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_jobs_location_trgm ON jobs USING gin (location gin_trgm_ops)")
+
+    elif dialect == "sqlite":
+        op.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5({FTS_COLUMNS}, "
+            "content='jobs', content_rowid='id', tokenize='porter unicode61')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN "
+            f"INSERT INTO jobs_fts(rowid, {FTS_COLUMNS}) "
+            "VALUES (new.id, new.title, new.company, new.description, new.location); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN "
+            f"INSERT INTO jobs_fts(jobs_fts, rowid, {FTS_COLUMNS}) "
+            "VALUES ('delete', old.id, old.title, old.company, old.description, old.location); END"
+        )
+        # Only reindex when searchable text changes, not on is_active/duplicate_of_id updates
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF {FTS_COLUMNS} ON jobs BEGIN "
+            f"INSERT INTO jobs_fts(jobs_fts, rowid, {FTS_COLUMNS}) "
+            "VALUES ('delete', old.id, old.title, old.company, old.description, old.location); "
+            f"INSERT INTO jobs_fts(rowid, {FTS_COLUMNS}) "
+            "VALUES (new.id, new.title, new.company, new.description, new.location); END"
+        )
+        op.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_jobs_location_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_jobs_search_vector")
+        op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS search_vector")
+
+    elif dialect == "sqlite":
+        for trigger in ("jobs_fts_insert", "jobs_fts_delete", "jobs_fts_update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS jobs_fts")
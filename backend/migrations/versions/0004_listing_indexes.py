@@ -0,0 +1,43 @@
+"""listing indexes
+
+(created_at, id) indexes behind the keyset-paginated listings of jobs,
+resumes and notifications (services.pagination), so every page is an index
+range scan instead of a sort of all matching rows. Job matches page on the
+existing ix_job_matches_user_open_score. Indexes that already exist are left
+alone, as in 0002.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 09:12:47.530196
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns)
+INDEXES = [
+    ("ix_jobs_active_created", "jobs", ["is_active", "created_at", "id"]),
+    ("ix_resumes_user_created", "resumes", ["user_id", "created_at", "id"]),
+    ("ix_notifications_user_created", "notifications", ["user_id", "created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        if name not in {index["name"] for index in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
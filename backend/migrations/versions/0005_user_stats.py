@@ -0,0 +1,259 @@
+"""user stats
+
+A ``user_stats`` row per user holding the dashboard counters, maintained by
+row triggers on job_applications, job_matches, notifications and
+user_profiles so every write path (ORM, bulk statements, retention deletes)
+keeps it current. Updates only fire the triggers when a counted column
+changes. Existing data is backfilled here; ``python -m services.user_stats``
+rebuilds it later with the same rules, so keep the two in sync.
+
+The table may already exist (created by ``create_all``); it is then kept,
+the triggers are installed and the rows recomputed.
+
+On SQLite, a later batch_alter_table on one of these tables recreates it
+and drops its triggers; such a migration must recreate them.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 10:05:38.914402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (columns whose updates change the counters, {stats column: one row's contribution},
+#           stats column holding the newest created_at)
+COUNTERS = {
+    "job_applications": (["user_id", "status"], {
+        "total_applications": "1",
+        "pending_applications": "CASE WHEN {row}.status IN ('applied', 'reviewed') THEN 1 ELSE 0 END",
+        "interviews_scheduled": "CASE WHEN {row}.status = 'interview' THEN 1 ELSE 0 END",
+        "offers_received": "CASE WHEN {row}.status = 'offered' THEN 1 ELSE 0 END",
+    }, "last_application_at"),
+    "job_matches": (["user_id", "is_dismissed", "created_at"], {
+        "total_matches": "CASE WHEN {row}.is_dismissed THEN 0 ELSE 1 END",
+    }, "last_match_at"),
+    "notifications": (["user_id", "is_read"], {
+        "unread_notifications": "CASE WHEN {row}.is_read THEN 0 ELSE 1 END",
+    }, "last_notification_at"),
+}
+
+# Profile completion: percentage of these fields that are filled in
+PROFILE_FIELDS = ["desired_job_title", "desired_location", "desired_salary_min", "experience_level",
+                  "work_type", "skills"]
+PROFILE_NUMERIC_FIELDS = {"desired_salary_min"}
+PROFILE_JSON_FIELDS = {"skills"}
+
+
+def _day(dialect: str, value: str) -> str:
+    return f"CAST({value} AS DATE)" if dialect == "postgresql" else f"date({value})"
+
+
+def _changes(dialect: str, table: str, row: str, sign: str) -> str:
+    """SET list adding (sign "+") or removing (sign "-") one row's contribution."""
+    _, counters, latest = COUNTERS[table]
+    changes = [f"{column} = {column} {sign} ({expression.format(row=row)})"
+               for column, expression in counters.items()]
+
+    if table == "job_matches":
+        # Matches created on new_matches_date; a newer day restarts the count
+        day = _day(dialect, f"{row}.created_at")
+        if sign == "+":
+            changes.append(
+                f"new_matches_today = CASE WHEN new_matches_date = {day} THEN new_matches_today + 1 "
+                f"WHEN new_matches_date IS NULL OR {day} > new_matches_date THEN 1 ELSE new_matches_today END"
+            )
+            changes.append(
+                f"new_matches_date = CASE WHEN new_matches_date IS NULL OR {day} > new_matches_date "
+                f"THEN coalesce({day}, new_matches_date) ELSE new_matches_date END"
+            )
+        else:
+            changes.append(
+                f"new_matches_today = CASE WHEN new_matches_date = {day} THEN new_matches_today - 1 "
+                "ELSE new_matches_today END"
+            )
+
+    if sign == "+":
+        changes.append(
+            f"{latest} = CASE WHEN {latest} IS NULL OR {row}.created_at > {latest} "
+            f"THEN coalesce({row}.created_at, {latest}) ELSE {latest} END"
+        )
+    return ", ".join(changes)
+
+
+def _profile_completion(dialect: str, row: str) -> str:
+    filled = []
+    for field in PROFILE_FIELDS:
+        value = f"{row}.{field}"
+        if field in PROFILE_JSON_FIELDS:
+            text = f"CAST({value} AS TEXT)" if dialect == "postgresql" else value
+            filled.append(f"CASE WHEN {value} IS NOT NULL AND {text} NOT IN ('null', '[]') THEN 1 ELSE 0 END")
+        elif field in PROFILE_NUMERIC_FIELDS:
+            filled.append(f"CASE WHEN {value} IS NOT NULL THEN 1 ELSE 0 END")
+        else:
+            filled.append(f"CASE WHEN {value} IS NOT NULL AND {value} <> '' THEN 1 ELSE 0 END")
+    return f"100.0 * ({' + '.join(filled)}) / {len(PROFILE_FIELDS)}"
+
+
+def _ensure_row(dialect: str, row: str) -> str:
+    if dialect == "postgresql":
+        return f"INSERT INTO user_stats (user_id) VALUES ({row}.user_id) ON CONFLICT (user_id) DO NOTHING"
+    return f"INSERT OR IGNORE INTO user_stats (user_id) SELECT {row}.user_id WHERE {row}.user_id IS NOT NULL"
+
+
+def _postgresql_triggers():
+    dialect = "postgresql"
+    statements = []
+    for table, (watched, _, _) in COUNTERS.items():
+        statements.append(f"""
+CREATE OR REPLACE FUNCTION user_stats_{table}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.user_id IS NOT NULL THEN
+        UPDATE user_stats SET {_changes(dialect, table, "OLD", "-")} WHERE user_id = OLD.user_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.user_id IS NOT NULL THEN
+        {_ensure_row(dialect, "NEW")};
+        UPDATE user_stats SET {_changes(dialect, table, "NEW", "+")} WHERE user_id = NEW.user_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql""")
+        statements.append(
+            f"CREATE TRIGGER user_stats_{table} AFTER INSERT OR DELETE OR UPDATE OF {', '.join(watched)} "
+            f"ON {table} FOR EACH ROW EXECUTE FUNCTION user_stats_{table}()"
+        )
+
+    statements.append(f"""
+CREATE OR REPLACE FUNCTION user_stats_user_profiles() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        UPDATE user_stats SET profile_completion = 0 WHERE user_id = OLD.user_id;
+    ELSIF NEW.user_id IS NOT NULL THEN
+        {_ensure_row(dialect, "NEW")};
+        UPDATE user_stats SET profile_completion = {_profile_completion(dialect, "NEW")}
+        WHERE user_id = NEW.user_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql""")
+    statements.append(
+        f"CREATE TRIGGER user_stats_user_profiles AFTER INSERT OR DELETE OR UPDATE OF user_id, "
+        f"{', '.join(PROFILE_FIELDS)} ON user_profiles FOR EACH ROW EXECUTE FUNCTION user_stats_user_profiles()"
+    )
+    return statements
+
+
+def _sqlite_triggers():
+    dialect = "sqlite"
+    statements = []
+    for table, (watched, _, _) in COUNTERS.items():
+        add = (f"{_ensure_row(dialect, 'NEW')}; "
+               f"UPDATE user_stats SET {_changes(dialect, table, 'NEW', '+')} WHERE user_id = NEW.user_id;")
+        remove = f"UPDATE user_stats SET {_changes(dialect, table, 'OLD', '-')} WHERE user_id = OLD.user_id;"
+        statements.append(f"CREATE TRIGGER user_stats_{table}_insert AFTER INSERT ON {table} BEGIN {add} END")
+        statements.append(f"CREATE TRIGGER user_stats_{table}_delete AFTER DELETE ON {table} BEGIN {remove} END")
+        statements.append(
+            f"CREATE TRIGGER user_stats_{table}_update AFTER UPDATE OF {', '.join(watched)} ON {table} "
+            f"BEGIN {remove} {add} END"
+        )
+
+    completion = (f"{_ensure_row(dialect, 'NEW')}; UPDATE user_stats SET profile_completion = "
+                  f"{_profile_completion(dialect, 'NEW')} WHERE user_id = NEW.user_id;")
+    statements.append(f"CREATE TRIGGER user_stats_user_profiles_insert AFTER INSERT ON user_profiles "
+                      f"BEGIN {completion} END")
+    statements.append(f"CREATE TRIGGER user_stats_user_profiles_update AFTER UPDATE OF user_id, "
+                      f"{', '.join(PROFILE_FIELDS)} ON user_profiles BEGIN {completion} END")
+    statements.append("CREATE TRIGGER user_stats_user_profiles_delete AFTER DELETE ON user_profiles BEGIN "
+                      "UPDATE user_stats SET profile_completion = 0 WHERE user_id = OLD.user_id; END")
+    return statements
+
+
+def _backfill(dialect: str) -> str:
+    """Recompute every user's row with the trigger rules (same as services.user_stats)."""
+    today = "CURRENT_DATE" if dialect == "postgresql" else "date('now')"
+    joins = []
+    columns = []
+    for alias, (table, (_, counters, latest)) in zip("amn", COUNTERS.items()):
+        aggregates = [f"sum({expression.format(row=table)}) AS {column}" for column, expression in counters.items()]
+        aggregates.append(f"max({table}.created_at) AS {latest}")
+        columns += [f"coalesce({alias}.{column}, 0)" for column in counters] + [f"{alias}.{latest}"]
+        if table == "job_matches":
+            aggregates.append(
+                f"sum(CASE WHEN {_day(dialect, 'job_matches.created_at')} = {today} THEN 1 ELSE 0 END) "
+                "AS new_matches_today"
+            )
+            columns.append(f"coalesce({alias}.new_matches_today, 0)")
+        joins.append(f"LEFT JOIN (SELECT user_id, {', '.join(aggregates)} FROM {table} GROUP BY user_id) {alias} "
+                     f"ON {alias}.user_id = users.id")
+
+    names = []
+    for table, (_, counters, latest) in COUNTERS.items():
+        names += list(counters) + [latest] + (["new_matches_today"] if table == "job_matches" else [])
+    return (
+        f"INSERT INTO user_stats (user_id, {', '.join(names)}, new_matches_date, profile_completion) "
+        f"SELECT users.id, {', '.join(columns)}, {today}, {_profile_completion(dialect, 'p')} "
+        f"FROM users {' '.join(joins)} LEFT JOIN user_profiles p ON p.user_id = users.id"
+    )
+
+
+def _drop_triggers(dialect: str):
+    tables = list(COUNTERS) + ["user_profiles"]
+    if dialect == "postgresql":
+        for table in tables:
+            op.execute(f"DROP TRIGGER IF EXISTS user_stats_{table} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS user_stats_{table}()")
+    elif dialect == "sqlite":
+        for table in tables:
+            for event in ("insert", "delete", "update"):
+                op.execute(f"DROP TRIGGER IF EXISTS user_stats_{table}_{event}")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    # A database set up by create_all already has the table, but no triggers
+    if not sa.inspect(op.get_bind()).has_table("user_stats"):
+        op.create_table(
+            "user_stats",
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), primary_key=True),
+            sa.Column("total_applications", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("pending_applications", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("interviews_scheduled", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("offers_received", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("last_application_at", sa.DateTime()),
+            sa.Column("total_matches", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("new_matches_today", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("new_matches_date", sa.Date()),
+            sa.Column("last_match_at", sa.DateTime()),
+            sa.Column("unread_notifications", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("last_notification_at", sa.DateTime()),
+            sa.Column("profile_completion", sa.Float(), server_default="0", nullable=False),
+        )
+
+    if dialect == "postgresql":
+        statements = _postgresql_triggers()
+    elif dialect == "sqlite":
+        statements = _sqlite_triggers()
+    else:
+        statements = []
+    _drop_triggers(dialect)
+    for statement in statements:
+        op.execute(statement)
+
+    # Counters for rows written before the triggers existed
+    op.execute("DELETE FROM user_stats")
+    op.execute(_backfill(dialect))
+
+
+def downgrade() -> None:
+    _drop_triggers(op.get_bind().dialect.name)
+    op.drop_table("user_stats")
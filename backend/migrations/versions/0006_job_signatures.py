@@ -0,0 +1,54 @@
+"""job signatures
+
+Database-backed near-duplicate index for services.job_deduplicator: one
+MinHash signature per posting plus its LSH band keys, indexed on
+(band, band_key) for candidate lookups. It replaces the JSON index file,
+which concurrent scraper workers overwrote. Tables that already exist are
+left alone; signatures for jobs scraped before this revision are filled in
+by ``python -m services.job_deduplicator --rebuild``.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 14:02:51.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("job_signatures"):
+        op.create_table('job_signatures',
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('signature', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id']),
+        sa.PrimaryKeyConstraint('job_id')
+        )
+    if not inspector.has_table("job_signature_bands"):
+        op.create_table('job_signature_bands',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('band', sa.Integer(), nullable=False),
+        sa.Column('band_key', sa.String(length=16), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id']),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_job_signature_bands_id', 'job_signature_bands', ['id'])
+        op.create_index('ix_job_signature_bands_job_id', 'job_signature_bands', ['job_id'])
+        op.create_index('ix_job_signature_bands_lookup', 'job_signature_bands', ['band', 'band_key'])
+
+
+def downgrade() -> None:
+    op.drop_table('job_signature_bands')
+    op.drop_table('job_signatures')
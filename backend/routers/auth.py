@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
 from datetime import timedelta
@@ -6,16 +6,21 @@ from datetime import timedelta
 from database.database import get_db
 from database.models import User, UserProfile
 from schemas.schemas import UserCreate, UserResponse, LoginRequest, Token, APIResponse
-from services.auth import AuthService, get_current_active_user
-from services.notification_service import NotificationService
+from services.auth import AuthService, get_current_active_user, get_current_active_user_async
+from services.notification_service import get_notification_service
+from services.rate_limiter import client_ip, enforce_rate_limit, get_limiter
 
 router = APIRouter()
 security = HTTPBearer()
 
 @router.post("/register", response_model=APIResponse)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, request: Request, db: Session = Depends(get_db)):
     """Register a new user."""
     
+    # Shed abusive clients before any database or bcrypt work
+    enforce_rate_limit("register_ip", client_ip(request))
+    enforce_rate_limit("register_email", user_data.email.lower())
+    
     # Check if user already exists
     existing_user = db.query(User).filter(User.email == user_data.email).first()
     if existing_user:
@@ -25,7 +30,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = AuthService.get_password_hash(user_data.password)
+    hashed_password = await AuthService.get_password_hash_async(user_data.password)
     
     new_user = User(
         email=user_data.email,
@@ -44,7 +49,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     db.commit()
     
     # Send welcome notification
-    notification_service = NotificationService()
+    notification_service = get_notification_service()
     notification_service.send_welcome_notification(db, new_user)
     
     return APIResponse(
@@ -54,11 +59,16 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
 
 @router.post("/login", response_model=Token)
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: LoginRequest, request: Request, db: Session = Depends(get_db)):
     """Login user and return access token."""
     
+    # Shed credential stuffing before any database or bcrypt work
+    email_key = login_data.email.lower()
+    enforce_rate_limit("login_ip", client_ip(request))
+    enforce_rate_limit("login_email", email_key)
+    
     # Authenticate user
-    user = AuthService.authenticate_user(db, login_data.email, login_data.password)
+    user = await AuthService.authenticate_user_async(db, login_data.email, login_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,16 +82,17 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
             detail="Inactive user"
         )
     
+    # Only failures should count towards locking out an email
+    get_limiter("login_email").reset(email_key)
+    
     # Create access token
     access_token_expires = timedelta(minutes=30)
-    access_token = AuthService.create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
-    )
+    access_token = AuthService.create_user_token(user, expires_delta=access_token_expires)
     
     return Token(access_token=access_token, token_type="bearer")
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_active_user)):
+async def get_current_user_info(current_user: User = Depends(get_current_active_user_async)):
     """Get current user information."""
     return current_user
 
@@ -90,9 +101,7 @@ async def refresh_token(current_user: User = Depends(get_current_active_user)):
     """Refresh access token."""
     
     access_token_expires = timedelta(minutes=30)
-    access_token = AuthService.create_access_token(
-        data={"sub": current_user.email}, expires_delta=access_token_expires
-    )
+    access_token = AuthService.create_user_token(current_user, expires_delta=access_token_expires)
     
     return Token(access_token=access_token, token_type="bearer")
 
@@ -169,8 +178,8 @@ async def delete_account(current_user: User = Depends(get_current_active_user),
     # 2. Clean up related data
     # 3. Send confirmation email
     
-    current_user.is_active = False
-    db.commit()
+    # Also revokes the user's outstanding tokens
+    AuthService.deactivate_user(db, current_user)
     
     return APIResponse(
         success=True,
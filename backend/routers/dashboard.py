@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.database import get_async_read_db
+from database.models import UserStats
+from schemas.schemas import DashboardStats
+from services.auth import get_current_user_snapshot_async
+from services.token_cache import UserSnapshot
+from services.user_stats import dashboard_stats
+
+router = APIRouter()
+
+@router.get("/stats", response_model=DashboardStats)
+async def get_dashboard_stats(
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Dashboard counters for the user, read from their user_stats row."""
+    
+    stats = await db.get(UserStats, current_user.id)
+    
+    return DashboardStats(**dashboard_stats(stats))
@@ -0,0 +1,99 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import Optional
+
+from database.database import get_async_read_db
+from database.models import Job, JobMatch
+from schemas.schemas import (
+    CursorPaginatedResponse, ExperienceLevel, JobMatchResponse, JobResponse, JobSearchRequest, JobSearchResponse,
+    WorkType
+)
+from services.auth import get_current_user_snapshot_async
+from services.job_search import get_job_search
+from services.pagination import paginate
+from services.token_cache import UserSnapshot
+
+router = APIRouter()
+
+@router.post("/search", response_model=JobSearchResponse)
+async def search_jobs(
+    search: JobSearchRequest,
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Search active jobs, most relevant first; pass next_cursor back as cursor for more."""
+    
+    try:
+        page = await get_job_search().search(db, search, search.cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return JobSearchResponse(**page._asdict())
+
+@router.get("/", response_model=CursorPaginatedResponse[JobResponse])
+async def list_jobs(
+    work_type: Optional[WorkType] = None,
+    experience_level: Optional[ExperienceLevel] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """List active jobs, newest first; pass next_cursor back as cursor for more."""
+    
+    query = select(Job).where(Job.is_active == True, Job.duplicate_of_id.is_(None))
+    if work_type:
+        query = query.where(Job.work_type == work_type.value)
+    if experience_level:
+        query = query.where(Job.experience_level == experience_level.value)
+    
+    try:
+        page = await paginate(db, query, cursor=cursor, limit=limit, include_total=include_total)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return CursorPaginatedResponse(**page._asdict())
+
+@router.get("/matches", response_model=CursorPaginatedResponse[JobMatchResponse])
+async def list_job_matches(
+    recommended_only: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """List the user's job matches, best first; pass next_cursor back as cursor for more."""
+    
+    query = select(JobMatch).options(selectinload(JobMatch.job)).where(
+        JobMatch.user_id == current_user.id,
+        JobMatch.is_dismissed == False
+    )
+    if recommended_only:
+        query = query.where(JobMatch.is_recommended == True)
+    
+    try:
+        page = await paginate(
+            db,
+            query,
+            cursor=cursor,
+            limit=limit,
+            order_by=(JobMatch.overall_score, JobMatch.id),
+            include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return CursorPaginatedResponse(**page._asdict())
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from database.database import get_async_read_db
+from database.models import Notification
+from schemas.schemas import CursorPaginatedResponse, NotificationResponse
+from services.auth import get_current_user_snapshot_async
+from services.pagination import paginate
+from services.token_cache import UserSnapshot
+
+router = APIRouter()
+
+@router.get("/", response_model=CursorPaginatedResponse[NotificationResponse])
+async def list_notifications(
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """List the user's notifications, newest first; pass next_cursor back as cursor for more."""
+    
+    query = select(Notification).where(Notification.user_id == current_user.id)
+    if unread_only:
+        query = query.where(Notification.is_read == False)
+    
+    try:
+        page = await paginate(db, query, cursor=cursor, limit=limit, include_total=include_total)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return CursorPaginatedResponse(**page._asdict())
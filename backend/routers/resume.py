@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Form
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer_group
+from typing import Optional
 import os
 import shutil
 from pathlib import Path
 import uuid
 
-from database.database import get_db
+from database.database import get_db, get_async_read_db
 from database.models import User, Resume
-from schemas.schemas import ResumeResponse, APIResponse, FileUploadResponse
-from services.auth import get_current_active_user
+from schemas.schemas import ResumeResponse, APIResponse, FileUploadResponse, CursorPaginatedResponse
+from services.auth import get_current_active_user, get_current_user_snapshot_async
+from services.pagination import paginate
+from services.token_cache import UserSnapshot
 from services.resume_parser import ResumeParser
 from services.job_matcher import JobMatcher
 
@@ -105,31 +109,47 @@ async def upload_resume(
             detail=f"Failed to process resume: {str(e)}"
         )
 
-@router.get("/list", response_model=List[ResumeResponse])
+@router.get("/list", response_model=CursorPaginatedResponse[ResumeResponse])
 async def list_resumes(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    include_total: bool = False,
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """List all user's resumes."""
+    """List the user's resumes, newest first; pass next_cursor back as cursor for more."""
     
-    resumes = db.query(Resume).filter(
-        Resume.user_id == current_user.id
-    ).order_by(Resume.created_at.desc()).all()
+    try:
+        page = await paginate(
+            db,
+            select(Resume).where(Resume.user_id == current_user.id),
+            cursor=cursor,
+            limit=limit,
+            include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
-    return resumes
+    return CursorPaginatedResponse(**page._asdict())
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
     resume_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get specific resume details."""
     
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Resume).where(
+            Resume.id == resume_id,
+            Resume.user_id == current_user.id
+        )
+    )
+    resume = result.scalars().first()
     
     if not resume:
         raise HTTPException(
@@ -142,15 +162,18 @@ async def get_resume(
 @router.get("/{resume_id}/parsed-data")
 async def get_resume_parsed_data(
     resume_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get parsed resume data in detail."""
     
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Resume).where(
+            Resume.id == resume_id,
+            Resume.user_id == current_user.id
+        ).options(undefer_group("parsed"))
+    )
+    resume = result.scalars().first()
     
     if not resume:
         raise HTTPException(
@@ -298,15 +321,18 @@ async def reparse_resume(
 @router.get("/{resume_id}/download")
 async def download_resume(
     resume_id: int,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: UserSnapshot = Depends(get_current_user_snapshot_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Download original resume file."""
     
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Resume).where(
+            Resume.id == resume_id,
+            Resume.user_id == current_user.id
+        )
+    )
+    resume = result.scalars().first()
     
     if not resume:
         raise HTTPException(
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, validator
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Generic, TypeVar
 from datetime import datetime
 from enum import Enum
 
@@ -149,8 +149,16 @@ class JobSearchRequest(BaseModel):
     work_type: Optional[WorkType] = None
     salary_min: Optional[int] = None
     skills: Optional[List[str]] = []
-    page: int = 1
+    # Deprecated: offset pages were replaced by cursor; only page 1 is accepted
+    page: Optional[int] = None
     limit: int = 20
+    cursor: Optional[str] = None  # next_cursor of the previous page (keyset pagination)
+    
+    @validator("page")
+    def reject_offset_pages(cls, value):
+        if value is not None and value > 1:
+            raise ValueError("page is no longer supported; pass next_cursor back as cursor")
+        return value
 
 # Job Match schemas
 class JobMatchResponse(BaseModel):
@@ -228,6 +236,7 @@ class DashboardStats(BaseModel):
     offers_received: int
     total_matches: int
     new_matches_today: int
+    unread_notifications: int = 0
     profile_completion: float
     recent_activity: List[Dict[str, Any]]
 
@@ -283,4 +292,16 @@ class PaginatedResponse(BaseModel):
     total: int
     page: int
     limit: int
-    pages: int
\ No newline at end of file
+    pages: int
+
+T = TypeVar("T")
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None  # pass back as cursor for the next page
+    has_more: bool = False
+    total: Optional[int] = None  # only when include_total=true (costs a COUNT)
+
+class JobSearchResponse(CursorPaginatedResponse[JobResponse]):
+    # Relevance ranking covered only the newest JOB_SEARCH_RANK_WINDOW matches
+    truncated: bool = False
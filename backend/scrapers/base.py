@@ -0,0 +1,195 @@
+import json
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type
+
+from services.skill_extractor import extract_skills
+
+logger = logging.getLogger(__name__)
+
+# Registered job source classes, keyed by Job.source value
+SOURCES: Dict[str, Type["JobSource"]] = {}
+
+# Columns of database.models.Job that a normalized job dict may carry
+JOB_FIELDS = (
+    "title", "company", "location", "description", "requirements",
+    "salary_min", "salary_max", "experience_level", "work_type", "job_type",
+    "source", "external_id", "external_url", "required_skills", "preferred_skills",
+    "posted_date",
+)
+
+
+def register_source(name: str) -> Callable[[Type["JobSource"]], Type["JobSource"]]:
+    """Class decorator registering a JobSource under a source name."""
+    def decorator(cls: Type["JobSource"]) -> Type["JobSource"]:
+        cls.name = name
+        SOURCES[name] = cls
+        return cls
+    return decorator
+
+
+def get_source(name: str, **kwargs) -> "JobSource":
+    """Instantiate a registered job source by name."""
+    if name not in SOURCES:
+        raise ValueError(f"Unknown job source: {name}. Available: {', '.join(sorted(SOURCES))}")
+    return SOURCES[name](**kwargs)
+
+
+class JobSource(ABC):
+    """Plugin interface for job boards.
+
+    A source is split into transport (``fetch_listing_page``/``fetch_detail_page``,
+    returning raw HTML or JSON text) and parsing (``parse_listing_page``/
+    ``parse_detail_page``). Keeping the two apart lets ``ReplaySource`` feed
+    recorded pages through the real parsers without a network or browser.
+    """
+
+    name: str = ""
+
+    # Page size used by paginate() to detect the last page
+    page_size: int = 25
+
+    # Whether detail pages may be fetched concurrently (False for a shared browser)
+    concurrent_details: bool = True
+
+    # Upper bound on pages walked by paginate()
+    max_pages: int = 40
+
+    # ---- transport -------------------------------------------------------
+
+    @abstractmethod
+    def fetch_listing_page(self, query: str, location: str = "", page: int = 0,
+                           filters: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Fetch one raw search result page, or None when there are no more."""
+
+    @abstractmethod
+    def fetch_detail_page(self, listing: Dict[str, Any]) -> Optional[str]:
+        """Fetch the raw detail page for a listing, or None if unavailable."""
+
+    # ---- parsing ---------------------------------------------------------
+
+    def parse_listing_page(self, raw: str) -> List[Dict[str, Any]]:
+        """Parse a raw listing page into listing dicts (JSON by default)."""
+        data = json.loads(raw)
+        return data.get("jobs", []) if isinstance(data, dict) else data
+
+    def parse_detail_page(self, raw: str, listing: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse a raw detail page into extra job fields (JSON by default)."""
+        return json.loads(raw)
+
+    # ---- public API ------------------------------------------------------
+
+    def search(self, query: str, location: str = "", page: int = 0,
+               filters: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Return the listings on one search result page."""
+        raw = self.fetch_listing_page(query, location, page, filters)
+        if not raw:
+            return []
+        return self.parse_listing_page(raw)
+
+    def paginate(self, query: str, location: str = "", limit: int = 50,
+                 filters: Optional[Dict[str, str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield listings across result pages until limit or the last page."""
+        yielded = 0
+        seen = set()
+
+        for page in range(self.max_pages):
+            listings = self.search(query, location, page, filters)
+            if not listings:
+                break
+
+            for listing in listings:
+                # Listings without an id or URL cannot be told apart, so all are kept
+                key = listing.get("external_id") or listing.get("external_url")
+                if key:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                yield listing
+                yielded += 1
+                if yielded >= limit:
+                    return
+
+            if len(listings) < self.page_size:
+                break
+
+    def fetch_detail(self, listing: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge detail page fields into a listing."""
+        job = dict(listing)
+        try:
+            raw = self.fetch_detail_page(listing)
+            if raw:
+                job.update({k: v for k, v in self.parse_detail_page(raw, listing).items() if v is not None})
+        except Exception as e:
+            logger.warning(f"[{self.name}] Could not fetch details for {listing.get('external_id')}: {e}")
+        return job
+
+    def normalize(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Coerce a parsed job into the column layout of database.models.Job."""
+        normalized = {field: job.get(field) for field in JOB_FIELDS}
+        normalized["source"] = normalized["source"] or self.name
+
+        for field in ("title", "company", "location", "description", "requirements"):
+            if isinstance(normalized[field], str):
+                normalized[field] = normalized[field].strip()
+
+        if normalized["external_id"] is not None:
+            normalized["external_id"] = str(normalized["external_id"])
+
+        text = " ".join(filter(None, [normalized["title"], normalized["description"]]))
+        text_lower = text.lower()
+
+        if not normalized["required_skills"]:
+            normalized["required_skills"] = extract_skills(normalized["description"])
+        normalized["preferred_skills"] = normalized["preferred_skills"] or []
+
+        if not normalized["work_type"]:
+            location_lower = (normalized["location"] or "").lower()
+            if "remote" in location_lower or "remote" in text_lower:
+                normalized["work_type"] = "remote"
+            elif "hybrid" in location_lower or "hybrid" in text_lower:
+                normalized["work_type"] = "hybrid"
+            else:
+                normalized["work_type"] = "onsite"
+
+        if isinstance(normalized["posted_date"], str):
+            try:
+                normalized["posted_date"] = datetime.fromisoformat(normalized["posted_date"])
+            except ValueError:
+                normalized["posted_date"] = None
+
+        return normalized
+
+    def iter_jobs(self, query: str, location: str = "", limit: int = 50,
+                  filters: Optional[Dict[str, str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield normalized jobs (listing + detail) as they are scraped."""
+        listings = self.paginate(query, location, limit, filters)
+
+        if not self.concurrent_details:
+            for listing in listings:
+                yield self.normalize(self.fetch_detail(listing))
+            return
+
+        # Fetch details a page-sized chunk at a time so memory stays bounded
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix=f"{self.name}-detail") as executor:
+            chunk: List[Dict[str, Any]] = []
+            for listing in listings:
+                chunk.append(listing)
+                if len(chunk) >= self.page_size:
+                    for job in executor.map(self.fetch_detail, chunk):
+                        yield self.normalize(job)
+                    chunk = []
+            for job in executor.map(self.fetch_detail, chunk):
+                yield self.normalize(job)
+
+    def close(self):
+        """Release any resources held by the source."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
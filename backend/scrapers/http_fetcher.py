@@ -0,0 +1,174 @@
+import os
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+HTTP_MAX_CONNECTIONS = int(os.getenv("SCRAPER_HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("SCRAPER_HTTP_MAX_KEEPALIVE", "10"))
+HTTP_TIMEOUT = float(os.getenv("SCRAPER_HTTP_TIMEOUT", "15"))
+HTTP_CACHE_SIZE = int(os.getenv("SCRAPER_HTTP_CACHE_SIZE", "4096"))
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+
+class FetchResult:
+    """Outcome of one HTTP fetch."""
+
+    def __init__(self, url: str, status_code: int, text: Optional[str], from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.from_cache = from_cache
+
+    @property
+    def ok(self) -> bool:
+        return self.text is not None and (200 <= self.status_code < 300 or self.status_code == 304)
+
+
+class HttpFetcher:
+    """Pooled async HTTP client with ETag/Last-Modified revalidation.
+
+    One ``httpx.AsyncClient`` (keep-alive pool, gzip) runs on a private event
+    loop thread, so synchronous scrapers running in worker threads all share
+    the same connection pool. Bodies of responses carrying validators are kept
+    in a bounded LRU so re-scraping an unchanged page costs a 304 with no body.
+    """
+
+    def __init__(self, max_connections: int = HTTP_MAX_CONNECTIONS,
+                 max_keepalive: int = HTTP_MAX_KEEPALIVE, timeout: float = HTTP_TIMEOUT,
+                 cache_size: int = HTTP_CACHE_SIZE, headers: Optional[Dict[str, str]] = None):
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive)
+        self.timeout = httpx.Timeout(timeout)
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self.cache_size = cache_size
+
+        # url -> (etag, last_modified, body)
+        self._validators: "OrderedDict[str, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    # ---- event loop ------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop and client on first use."""
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="http-fetcher", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+        return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                limits=self.limits,
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+        return self._client
+
+    # ---- conditional request cache --------------------------------------
+
+    def _cached(self, url: str) -> Optional[tuple]:
+        with self._cache_lock:
+            entry = self._validators.get(url)
+            if entry is not None:
+                self._validators.move_to_end(url)
+            return entry
+
+    def _store(self, url: str, response: httpx.Response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        with self._cache_lock:
+            self._validators[url] = (etag, last_modified, response.text)
+            self._validators.move_to_end(url)
+            while len(self._validators) > self.cache_size:
+                self._validators.popitem(last=False)
+
+    # ---- fetching --------------------------------------------------------
+
+    async def fetch_async(self, url: str) -> FetchResult:
+        """Fetch a URL, revalidating against any cached validators."""
+        headers = {}
+        cached = self._cached(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = await self._get_client().get(url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return FetchResult(url, 0, None)
+
+        if response.status_code == 304 and cached:
+            return FetchResult(url, 304, cached[2], from_cache=True)
+
+        if 200 <= response.status_code < 300:
+            self._store(url, response)
+            return FetchResult(url, response.status_code, response.text)
+
+        logger.info(f"HTTP {response.status_code} for {url}")
+        return FetchResult(url, response.status_code, None)
+
+    async def fetch_many_async(self, urls: List[str]) -> List[FetchResult]:
+        """Fetch several URLs concurrently over the shared pool."""
+        return await asyncio.gather(*(self.fetch_async(url) for url in urls))
+
+    def fetch(self, url: str) -> FetchResult:
+        """Blocking wrapper around fetch_async, safe to call from any thread."""
+        future = asyncio.run_coroutine_threadsafe(self.fetch_async(url), self._ensure_loop())
+        return future.result()
+
+    def fetch_many(self, urls: List[str]) -> List[FetchResult]:
+        """Blocking wrapper around fetch_many_async."""
+        future = asyncio.run_coroutine_threadsafe(self.fetch_many_async(urls), self._ensure_loop())
+        return future.result()
+
+    def close(self):
+        """Close the client and stop the event loop thread."""
+        if self._loop is None:
+            return
+
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result()
+            self._client = None
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,7 +1,7 @@
 import time
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -15,6 +15,8 @@ import logging
 from datetime import datetime, timedelta
 import re
 
+from services.skill_extractor import extract_skills
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -102,14 +104,19 @@ class LinkedInScraper:
     def search_jobs(self, query: str, location: str = "", experience_level: str = "",
                    work_type: str = "", limit: int = 50) -> List[Dict[str, Any]]:
         """Search for jobs on LinkedIn."""
+        return list(self.iter_jobs(query, location, experience_level, work_type, limit))
+    
+    def iter_jobs(self, query: str, location: str = "", experience_level: str = "",
+                  work_type: str = "", limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """Search for jobs on LinkedIn, yielding each job as soon as it is parsed."""
         
         if not self.driver:
             self.driver = self.setup_driver()
             if not self.login():
                 logger.error("Failed to login to LinkedIn")
-                return []
+                return
         
-        jobs = []
+        processed_jobs = 0
         
         try:
             # Build search URL
@@ -136,7 +143,6 @@ class LinkedInScraper:
                 EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results-list"))
             )
             
-            processed_jobs = 0
             page = 0
             
             while processed_jobs < limit:
@@ -153,16 +159,16 @@ class LinkedInScraper:
                     
                     try:
                         job_data = self._extract_job_from_card(card)
-                        if job_data:
-                            jobs.append(job_data)
-                            processed_jobs += 1
-                            
-                        # Random delay to avoid detection
-                        time.sleep(0.5)
-                        
                     except Exception as e:
                         logger.warning(f"Error extracting job card: {e}")
                         continue
+                    
+                    if job_data:
+                        processed_jobs += 1
+                        yield job_data
+                    
+                    # Random delay to avoid detection
+                    time.sleep(0.5)
                 
                 # Try to load more jobs or go to next page
                 if processed_jobs < limit:
@@ -173,12 +179,10 @@ class LinkedInScraper:
                 if page > 10:  # Safety limit
                     break
             
-            logger.info(f"Successfully scraped {len(jobs)} jobs from LinkedIn")
+            logger.info(f"Successfully scraped {processed_jobs} jobs from LinkedIn")
             
         except Exception as e:
             logger.error(f"Error searching LinkedIn jobs: {e}")
-        
-        return jobs
     
     def _extract_job_from_card(self, card) -> Optional[Dict[str, Any]]:
         """Extract job information from a job card element."""
@@ -312,26 +316,10 @@ class LinkedInScraper:
     
     def _extract_skills_from_text(self, text: str) -> List[str]:
         """Extract skills from job description text."""
-        # Common technical skills to look for
-        skills_keywords = [
-            'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Angular', 'Vue.js',
-            'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Docker', 'Kubernetes',
-            'AWS', 'Azure', 'GCP', 'Git', 'Linux', 'HTML', 'CSS', 'TypeScript',
-            'FastAPI', 'Django', 'Flask', 'Spring', 'Express.js', 'TensorFlow',
-            'PyTorch', 'Machine Learning', 'Data Science', 'Pandas', 'NumPy',
-            'C++', 'C#', '.NET', 'Ruby', 'PHP', 'Swift', 'Kotlin', 'Go', 'Rust'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skills_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills
+        return extract_skills(text)
     
-    def _get_experience_filter(self, experience_level: str) -> str:
+    @staticmethod
+    def _get_experience_filter(experience_level: str) -> str:
         """Get LinkedIn experience filter parameter."""
         filters = {
             "entry": "1",
@@ -341,7 +329,8 @@ class LinkedInScraper:
         }
         return filters.get(experience_level.lower(), "")
     
-    def _get_work_type_filter(self, work_type: str) -> str:
+    @staticmethod
+    def _get_work_type_filter(work_type: str) -> str:
         """Get LinkedIn work type filter parameter."""
         filters = {
             "remote": "2",
@@ -0,0 +1,232 @@
+import os
+import re
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+from bs4 import BeautifulSoup
+from dotenv import load_dotenv
+
+from scrapers.base import JobSource, register_source
+from scrapers.http_fetcher import HttpFetcher, FetchResult
+from scrapers.linkedin_scraper import LinkedInScraper
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Transport: "auto" (HTTP first, browser only when a page needs JS), "http" or "browser"
+FETCH_MODE = os.getenv("SCRAPER_FETCH_MODE", "auto")
+
+# Status codes LinkedIn uses to refuse plain HTTP clients
+BROWSER_FALLBACK_STATUSES = {401, 403, 999}
+
+# Markup that is only present when a page was rendered server-side
+LISTING_MARKERS = ("base-card", "job-search-card")
+DETAIL_MARKERS = ("show-more-less-html__markup", "description__text")
+
+# LinkedIn seniority labels -> ExperienceLevel values
+SENIORITY_LEVELS = {
+    "internship": "entry",
+    "entry level": "entry",
+    "associate": "mid",
+    "mid-senior level": "senior",
+    "director": "executive",
+    "executive": "executive",
+}
+
+# LinkedIn employment type labels -> JobType values
+EMPLOYMENT_TYPES = {
+    "full-time": "full-time",
+    "part-time": "part-time",
+    "contract": "contract",
+    "temporary": "contract",
+    "internship": "internship",
+}
+
+
+@register_source("linkedin")
+class LinkedInSource(JobSource):
+    """LinkedIn public (guest) job pages.
+
+    The guest search and job posting endpoints serve server-rendered HTML
+    fragments, so the parsers below work on raw HTML and no login is needed.
+    Pages are fetched over pooled HTTP; headless Chrome is only started when
+    a response turns out to need JavaScript (or mode="browser").
+    """
+
+    base_url = "https://www.linkedin.com"
+    page_size = 25
+
+    def __init__(self, base_url: Optional[str] = None, headless: bool = True,
+                 mode: str = FETCH_MODE, fetcher: Optional[HttpFetcher] = None):
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+        if mode not in ("auto", "http", "browser"):
+            raise ValueError(f"Unknown fetch mode: {mode}")
+
+        self.headless = headless
+        self.mode = mode
+        self.fetcher = fetcher
+        self._owns_fetcher = fetcher is None
+        if self.fetcher is None and mode != "browser":
+            self.fetcher = HttpFetcher()
+
+        # Details are fetched concurrently over HTTP; a browser is used serially
+        self.concurrent_details = mode != "browser"
+
+        self._browser: Optional[LinkedInScraper] = None
+        self._browser_lock = threading.Lock()
+
+    # ---- URLs ------------------------------------------------------------
+
+    def listing_url(self, query: str, location: str = "", page: int = 0,
+                    filters: Optional[Dict[str, str]] = None) -> str:
+        """Build the guest search URL for a result page."""
+        filters = filters or {}
+        params = {
+            "keywords": query,
+            "location": location,
+            "f_TPR": "r604800",  # Past week
+            "f_E": LinkedInScraper._get_experience_filter(filters.get("experience_level", "")),
+            "f_WT": LinkedInScraper._get_work_type_filter(filters.get("work_type", "")),
+            "sortBy": "DD",  # Sort by date
+            "start": page * self.page_size,
+        }
+        params = {k: v for k, v in params.items() if v}
+        return f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?{urlencode(params)}"
+
+    def detail_url(self, listing: Dict[str, Any]) -> Optional[str]:
+        """Build the guest job posting URL for a listing."""
+        if not listing.get("external_id"):
+            return None
+        return f"{self.base_url}/jobs-guest/jobs/api/jobPosting/{listing['external_id']}"
+
+    # ---- transport -------------------------------------------------------
+
+    def _browser_get(self, url: str) -> str:
+        """Load a page in the (lazily started) headless browser."""
+        with self._browser_lock:
+            if self._browser is None:
+                self._browser = LinkedInScraper()
+                self._browser.driver = self._browser.setup_driver(headless=self.headless)
+            self._browser.driver.get(url)
+            return self._browser.driver.page_source
+
+    @staticmethod
+    def needs_browser(result: FetchResult, markers: tuple) -> bool:
+        """Whether an HTTP response is a JS shell/auth wall rather than real content."""
+        if not result.ok:
+            return result.status_code in BROWSER_FALLBACK_STATUSES
+        text = result.text or ""
+        if not text.strip() or any(marker in text for marker in markers):
+            return False
+        return "authwall" in text or "<script" in text
+
+    def _fetch(self, url: str, markers: tuple) -> Optional[str]:
+        """Fetch over HTTP, falling back to the browser only when required."""
+        if self.mode == "browser":
+            return self._browser_get(url)
+
+        result = self.fetcher.fetch(url)
+        if self.mode == "auto" and self.needs_browser(result, markers):
+            logger.info(f"Falling back to browser for {url} (HTTP {result.status_code})")
+            return self._browser_get(url)
+
+        return result.text if result.ok else None
+
+    def fetch_listing_page(self, query: str, location: str = "", page: int = 0,
+                           filters: Optional[Dict[str, str]] = None) -> Optional[str]:
+        return self._fetch(self.listing_url(query, location, page, filters), LISTING_MARKERS)
+
+    def fetch_detail_page(self, listing: Dict[str, Any]) -> Optional[str]:
+        url = self.detail_url(listing)
+        return self._fetch(url, DETAIL_MARKERS) if url else None
+
+    # ---- parsing ---------------------------------------------------------
+
+    def parse_listing_page(self, raw: str) -> List[Dict[str, Any]]:
+        """Parse job cards from a guest search result page."""
+        soup = BeautifulSoup(raw, "html.parser")
+        listings = []
+
+        for card in soup.select("div.base-card, div.job-search-card"):
+            link = card.select_one("a.base-card__full-link") or card.find("a", href=True)
+            job_url = link["href"].split("?")[0] if link else None
+
+            external_id = None
+            urn = card.get("data-entity-urn", "")
+            if urn:
+                external_id = urn.rsplit(":", 1)[-1]
+            elif job_url:
+                id_match = re.search(r'(\d+)/?$', job_url)
+                external_id = id_match.group(1) if id_match else None
+
+            title = card.select_one(".base-search-card__title")
+            company = card.select_one(".base-search-card__subtitle")
+            location = card.select_one(".job-search-card__location")
+            posted = card.select_one("time")
+
+            if not title or not company:
+                continue
+
+            posted_date = None
+            if posted is not None and posted.get("datetime"):
+                try:
+                    posted_date = datetime.fromisoformat(posted["datetime"])
+                except ValueError:
+                    posted_date = None
+
+            listings.append({
+                "title": title.get_text(strip=True),
+                "company": company.get_text(strip=True),
+                "location": location.get_text(strip=True) if location else "",
+                "external_id": external_id,
+                "external_url": job_url,
+                "posted_date": posted_date,
+                "source": self.name,
+            })
+
+        return listings
+
+    def parse_detail_page(self, raw: str, listing: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse description and job criteria from a guest job posting page."""
+        soup = BeautifulSoup(raw, "html.parser")
+        details: Dict[str, Any] = {}
+
+        description = soup.select_one(".show-more-less-html__markup, .description__text")
+        if description:
+            details["description"] = description.get_text("\n", strip=True)
+
+        for item in soup.select(".description__job-criteria-item"):
+            header = item.select_one(".description__job-criteria-subheader")
+            value = item.select_one(".description__job-criteria-text")
+            if not header or not value:
+                continue
+
+            header_text = header.get_text(strip=True).lower()
+            value_text = value.get_text(strip=True).lower()
+            if "seniority" in header_text:
+                details["experience_level"] = SENIORITY_LEVELS.get(value_text)
+            elif "employment" in header_text:
+                details["job_type"] = EMPLOYMENT_TYPES.get(value_text)
+
+        salary = soup.select_one(".compensation__salary, .salary")
+        if salary:
+            amounts = [
+                int(float(a.replace(",", "")))
+                for a in re.findall(r'(\d[\d,]*(?:\.\d+)?)', salary.get_text())
+            ]
+            if amounts:
+                details["salary_min"] = min(amounts)
+                details["salary_max"] = max(amounts)
+
+        return details
+
+    def close(self):
+        if self._browser:
+            self._browser.close()
+            self._browser = None
+        if self.fetcher and self._owns_fetcher:
+            self.fetcher.close()
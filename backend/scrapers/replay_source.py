@@ -0,0 +1,117 @@
+import re
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from scrapers.base import JobSource
+
+logger = logging.getLogger(__name__)
+
+# Extensions tried, in order, when looking up a recorded page
+FIXTURE_EXTENSIONS = (".html", ".json")
+
+
+def fixture_slug(query: str, location: str = "") -> str:
+    """Filesystem-safe directory name for a search."""
+    slug = re.sub(r'[^a-z0-9]+', '-', f"{query} {location}".lower()).strip('-')
+    return slug or "all"
+
+
+def _detect_extension(raw: str) -> str:
+    return ".json" if raw.lstrip()[:1] in ("{", "[") else ".html"
+
+
+class ReplaySource(JobSource):
+    """Replays recorded listing/detail pages from disk through a source's parsers.
+
+    Fixture layout (``.html`` or ``.json``)::
+
+        <fixtures_dir>/<source>/<query-location slug>/page_0000.html
+        <fixtures_dir>/<source>/detail/<external_id>.html
+
+    Parsing and normalization are delegated to ``parser`` (e.g. a
+    ``LinkedInSource``), so the replay exercises exactly the code a live
+    scrape would. Without a parser, pages are read as JSON.
+    """
+
+    def __init__(self, fixtures_dir: str, parser: Optional[JobSource] = None,
+                 source_name: Optional[str] = None):
+        self.parser = parser
+        self.name = source_name or (parser.name if parser else "replay")
+        self.root = Path(fixtures_dir) / self.name
+        if parser:
+            self.page_size = parser.page_size
+            self.max_pages = parser.max_pages
+
+    def _read(self, stem: Path) -> Optional[str]:
+        for extension in FIXTURE_EXTENSIONS:
+            path = stem.with_suffix(extension)
+            if path.exists():
+                return path.read_text(encoding="utf-8")
+        return None
+
+    def fetch_listing_page(self, query: str, location: str = "", page: int = 0,
+                           filters: Optional[Dict[str, str]] = None) -> Optional[str]:
+        return self._read(self.root / fixture_slug(query, location) / f"page_{page:04d}")
+
+    def fetch_detail_page(self, listing: Dict[str, Any]) -> Optional[str]:
+        if not listing.get("external_id"):
+            return None
+        return self._read(self.root / "detail" / str(listing["external_id"]))
+
+    def parse_listing_page(self, raw: str) -> List[Dict[str, Any]]:
+        if self.parser:
+            return self.parser.parse_listing_page(raw)
+        return super().parse_listing_page(raw)
+
+    def parse_detail_page(self, raw: str, listing: Dict[str, Any]) -> Dict[str, Any]:
+        if self.parser:
+            return self.parser.parse_detail_page(raw, listing)
+        return super().parse_detail_page(raw, listing)
+
+    def normalize(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        if self.parser:
+            return self.parser.normalize(job)
+        return super().normalize(job)
+
+
+class RecordingSource(JobSource):
+    """Wraps a live source and saves every fetched page as a replay fixture."""
+
+    def __init__(self, source: JobSource, fixtures_dir: str):
+        self.source = source
+        self.name = source.name
+        self.page_size = source.page_size
+        self.max_pages = source.max_pages
+        self.concurrent_details = source.concurrent_details
+        self.root = Path(fixtures_dir) / self.name
+
+    def _write(self, stem: Path, raw: Optional[str]):
+        if not raw:
+            return
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        stem.with_suffix(_detect_extension(raw)).write_text(raw, encoding="utf-8")
+
+    def fetch_listing_page(self, query: str, location: str = "", page: int = 0,
+                           filters: Optional[Dict[str, str]] = None) -> Optional[str]:
+        raw = self.source.fetch_listing_page(query, location, page, filters)
+        self._write(self.root / fixture_slug(query, location) / f"page_{page:04d}", raw)
+        return raw
+
+    def fetch_detail_page(self, listing: Dict[str, Any]) -> Optional[str]:
+        raw = self.source.fetch_detail_page(listing)
+        if listing.get("external_id"):
+            self._write(self.root / "detail" / str(listing["external_id"]), raw)
+        return raw
+
+    def parse_listing_page(self, raw: str) -> List[Dict[str, Any]]:
+        return self.source.parse_listing_page(raw)
+
+    def parse_detail_page(self, raw: str, listing: Dict[str, Any]) -> Dict[str, Any]:
+        return self.source.parse_detail_page(raw, listing)
+
+    def normalize(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        return self.source.normalize(job)
+
+    def close(self):
+        self.source.close()
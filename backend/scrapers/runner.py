@@ -0,0 +1,98 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from database.models import ScrapingJob
+from scrapers.base import JobSource
+from services.job_ingest import DEFAULT_DEDUPLICATOR, BatchedJobWriter
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeTask:
+    """One search to run against one source."""
+
+    def __init__(self, source: JobSource, query: str, location: str = "",
+                 limit: int = 50, filters: Optional[Dict[str, str]] = None):
+        self.source = source
+        self.query = query
+        self.location = location
+        self.limit = limit
+        self.filters = filters or {}
+
+
+class ScrapeRunner:
+    """Runs scrape tasks concurrently and upserts the results.
+
+    Tasks for different source instances run in parallel; tasks sharing a
+    source instance run one after another on the same worker, since a source
+    (e.g. one holding a browser) is not assumed to be thread-safe. New jobs
+    are checked for near-duplicates (services.job_deduplicator) unless
+    another deduplicator, or None to skip the check, is passed.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 max_workers: int = 4, batch_size: int = 50, flush_interval: float = 5.0,
+                 deduplicator: Optional[Any] = DEFAULT_DEDUPLICATOR):
+        self.session_factory = session_factory
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.deduplicator = deduplicator
+
+    def run(self, tasks: List[ScrapeTask]) -> List[Dict[str, Any]]:
+        """Run all tasks and return one result dict per task."""
+        groups: Dict[int, List[ScrapeTask]] = {}
+        for task in tasks:
+            groups.setdefault(id(task.source), []).append(task)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scrape") as executor:
+            futures = [executor.submit(self._run_group, group) for group in groups.values()]
+            for future in as_completed(futures):
+                results.extend(future.result())
+        return results
+
+    def _run_group(self, tasks: List[ScrapeTask]) -> List[Dict[str, Any]]:
+        return [self.run_task(task) for task in tasks]
+
+    def run_task(self, task: ScrapeTask) -> Dict[str, Any]:
+        """Stream one search into the database, tracked by a ScrapingJob row."""
+        db = self.session_factory()
+        scraping_job = ScrapingJob(
+            source=task.source.name,
+            search_query=task.query,
+            location=task.location,
+            status="running",
+            started_at=datetime.utcnow()
+        )
+        db.add(scraping_job)
+        db.commit()
+
+        writer = BatchedJobWriter(db, scraping_job, batch_size=self.batch_size,
+                                  flush_interval=self.flush_interval,
+                                  deduplicator=self.deduplicator)
+        result = {'source': task.source.name, 'query': task.query, 'status': 'running'}
+
+        try:
+            with writer:
+                writer.write(task.source.iter_jobs(task.query, task.location, task.limit, task.filters))
+            result['status'] = "completed"
+        except Exception as e:
+            # Batches flushed before the failure stay saved
+            logger.error(f"[{task.source.name}] Scrape '{task.query}' failed: {e}")
+            result['status'] = "failed"
+            scraping_job.error_message = str(e)
+        finally:
+            scraping_job.status = result['status']
+            scraping_job.completed_at = datetime.utcnow()
+            db.commit()
+            db.close()
+
+        result.update(writer.stats)
+        logger.info(f"[{task.source.name}] '{task.query}': {result['found']} found, "
+                    f"{result['created']} new, {result['updated']} updated")
+        return result
@@ -1,15 +1,18 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import os
 from dotenv import load_dotenv
 
-from database.database import get_db
+from database.database import get_db, get_async_db
 from database.models import User
+from services.token_cache import UserSnapshot, get_token_cache
+from services.password_hasher import pwd_context, get_password_hasher
 
 load_dotenv()
 
@@ -17,9 +20,9 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
-
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Trust uid/act claims on snapshot endpoints without any lookup; a revoked
+# token then keeps working on those endpoints until it expires
+AUTH_STATELESS_TOKENS = os.getenv("AUTH_STATELESS_TOKENS", "false").lower() == "true"
 
 # Security
 security = HTTPBearer()
@@ -35,6 +38,11 @@ class AuthService:
         """Hash a password."""
         return pwd_context.hash(password)
     
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """Hash a password on the bcrypt thread pool."""
+        return await get_password_hasher().hash(password)
+    
     @staticmethod
     def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
         """Authenticate user with email and password."""
@@ -45,6 +53,26 @@ class AuthService:
             return None
         return user
     
+    @staticmethod
+    async def authenticate_user_async(db: Session, email: str, password: str) -> Optional[User]:
+        """Authenticate user, verifying the password off the event loop.
+        
+        Hashes made with outdated bcrypt parameters are transparently
+        replaced with one using the current BCRYPT_ROUNDS.
+        """
+        user = db.query(User).filter(User.email == email).first()
+        if not user:
+            return None
+        
+        valid, new_hash = await get_password_hasher().verify_and_update(password, user.hashed_password)
+        if not valid:
+            return None
+        
+        if new_hash:
+            user.hashed_password = new_hash
+            db.commit()
+        return user
+    
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Create JWT access token."""
@@ -59,44 +87,193 @@ class AuthService:
         return encoded_jwt
     
     @staticmethod
-    def verify_token(token: str) -> Optional[str]:
-        """Verify JWT token and return email."""
+    def create_user_token(user: User, expires_delta: Optional[timedelta] = None) -> str:
+        """Create an access token carrying the user id, token version and active flag."""
+        return AuthService.create_access_token(
+            data={
+                "sub": str(user.id),
+                "uid": user.id,
+                "email": user.email,
+                "tv": user.token_version or 0,
+                "act": bool(user.is_active)
+            },
+            expires_delta=expires_delta
+        )
+    
+    @staticmethod
+    def decode_token(token: str) -> Optional[Dict[str, Any]]:
+        """Verify JWT token and return its claims."""
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            email: str = payload.get("sub")
-            if email is None:
-                return None
-            return email
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         except JWTError:
             return None
+    
+    @staticmethod
+    def verify_token(token: str) -> Optional[str]:
+        """Verify JWT token and return its subject (user id, or email for legacy tokens)."""
+        payload = AuthService.decode_token(token)
+        if payload is None:
+            return None
+        return payload.get("sub")
+    
+    @staticmethod
+    def revoke_tokens(db: Session, user: User):
+        """Invalidate every token issued to a user so far."""
+        user.token_version = (user.token_version or 0) + 1
+        db.commit()
+        get_token_cache().invalidate_user(user.id)
+    
+    @staticmethod
+    def deactivate_user(db: Session, user: User):
+        """Deactivate an account; its tokens stop working immediately."""
+        user.is_active = False
+        AuthService.revoke_tokens(db, user)
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user."""
-    credentials_exception = HTTPException(
+@event.listens_for(User, "after_update")
+def _invalidate_cached_tokens(mapper, connection, target):
+    # Any path that deactivates a user or changes its email drops its cached tokens
+    state = inspect(target)
+    if any(getattr(state.attrs, name).history.has_changes() for name in ("is_active", "email", "token_version")):
+        get_token_cache().invalidate_user(target.id)
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _cached_or_decoded(token: str) -> Tuple[Dict[str, Any], Optional[UserSnapshot]]:
+    """Claims and snapshot of a cached token, or the freshly decoded claims."""
+    cached = get_token_cache().get(token)
+    if cached is not None:
+        return cached
     
-    try:
-        token = credentials.credentials
-        email = AuthService.verify_token(token)
-        if email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+    claims = AuthService.decode_token(token)
+    if claims is None or claims.get("sub") is None:
+        raise _credentials_exception()
+    return claims, None
+
+def _check_token_user(claims: Dict[str, Any], user: Optional[User]) -> User:
+    if user is None or ("uid" in claims and (user.token_version or 0) != claims.get("tv", 0)):
+        raise _credentials_exception()
+    return user
+
+def _stateless_snapshot(claims: Dict[str, Any]) -> UserSnapshot:
+    return UserSnapshot(claims["uid"], claims.get("email"), bool(claims.get("act")))
+
+def resolve_token(token: str, db: Session,
+                  stateless: bool = False) -> Tuple[Dict[str, Any], UserSnapshot, Optional[User]]:
+    """Validate a bearer token, from the token cache when possible.
+    
+    Tokens carrying ``uid`` are checked with a primary key lookup against the
+    user's token version (or, with ``stateless``, trusted outright); legacy
+    tokens whose ``sub`` is an email fall back to the email lookup. Returns
+    the claims, a user snapshot and the User row if one was loaded.
+    """
+    claims, snapshot = _cached_or_decoded(token)
+    if snapshot is not None:
+        return claims, snapshot, None
+    
+    if "uid" in claims:
+        if stateless:
+            return claims, _stateless_snapshot(claims), None
+        user = db.get(User, claims["uid"])
+    else:
+        # Tokens issued before user ids were embedded
+        user = db.query(User).filter(User.email == claims["sub"]).first()
+    user = _check_token_user(claims, user)
+    
+    snapshot = UserSnapshot.from_user(user)
+    get_token_cache().put(token, claims, snapshot)
+    return claims, snapshot, user
+
+async def resolve_token_async(token: str, db: AsyncSession,
+                              stateless: bool = False) -> Tuple[Dict[str, Any], UserSnapshot, Optional[User]]:
+    """resolve_token for handlers using an AsyncSession."""
+    claims, snapshot = _cached_or_decoded(token)
+    if snapshot is not None:
+        return claims, snapshot, None
+    
+    if "uid" in claims:
+        if stateless:
+            return claims, _stateless_snapshot(claims), None
+        user = await db.get(User, claims["uid"])
+    else:
+        result = await db.execute(select(User).where(User.email == claims["sub"]).limit(1))
+        user = result.scalars().first()
+    user = _check_token_user(claims, user)
+    
+    snapshot = UserSnapshot.from_user(user)
+    get_token_cache().put(token, claims, snapshot)
+    return claims, snapshot, user
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """Get current authenticated user."""
+    token = credentials.credentials
+    _, snapshot, user = resolve_token(token, db)
     
-    user = db.query(User).filter(User.email == email).first()
     if user is None:
-        raise credentials_exception
+        # Cached token: primary key lookup instead of decode + email lookup
+        user = db.get(User, snapshot.id)
+        if user is None:
+            get_token_cache().invalidate_token(token)
+            raise _credentials_exception()
     
     return user
 
+def get_current_user_snapshot(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> UserSnapshot:
+    """Get the current active user's id/email without loading the User row.
+    
+    For read endpoints that only need the user id; cached tokens (and, with
+    AUTH_STATELESS_TOKENS, any new-format token) are served without touching
+    the database.
+    """
+    _, snapshot, _ = resolve_token(credentials.credentials, db, stateless=AUTH_STATELESS_TOKENS)
+    if not snapshot.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return snapshot
+
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """Get current active user."""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
\ No newline at end of file
+    return current_user
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """get_current_user for async handlers; queries don't block the event loop."""
+    token = credentials.credentials
+    _, snapshot, user = await resolve_token_async(token, db)
+    
+    if user is None:
+        user = await db.get(User, snapshot.id)
+        if user is None:
+            get_token_cache().invalidate_token(token)
+            raise _credentials_exception()
+    
+    return user
+
+async def get_current_user_snapshot_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> UserSnapshot:
+    """get_current_user_snapshot for async handlers."""
+    _, snapshot, _ = await resolve_token_async(credentials.credentials, db, stateless=AUTH_STATELESS_TOKENS)
+    if not snapshot.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return snapshot
+
+async def get_current_active_user_async(current_user: User = Depends(get_current_user_async)) -> User:
+    """get_current_active_user for async handlers."""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
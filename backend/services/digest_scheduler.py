@@ -0,0 +1,167 @@
+import os
+import time
+import logging
+import argparse
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from dotenv import load_dotenv
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from database.models import User, UserProfile, Job, JobMatch
+from services.notification_service import NotificationService, get_notification_service
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+DIGEST_MAX_MATCHES = int(os.getenv("DIGEST_MAX_MATCHES", "10"))
+DIGEST_USER_BATCH_SIZE = int(os.getenv("DIGEST_USER_BATCH_SIZE", "500"))
+DIGEST_POLL_INTERVAL = int(os.getenv("DIGEST_POLL_INTERVAL", "60"))
+
+# notification_frequency -> minimum time between two digests for a user
+DIGEST_WINDOWS = {
+    "instant": timedelta(0),
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+
+
+class DigestScheduler:
+    """Aggregates new recommended matches into one notification per user per window.
+
+    Each frequency window is handled with a single streaming query over
+    job_matches joined to jobs, users and profiles, ordered by user so rows
+    can be grouped as they arrive. Digests are written to the notification
+    outbox and the included matches are stamped ``notified_at`` with a
+    set-based UPDATE per batch of users. A digest holds the top
+    ``max_matches``; the rest stay pending and lead the next digest.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 service: Optional[NotificationService] = None,
+                 max_matches: int = DIGEST_MAX_MATCHES, user_batch_size: int = DIGEST_USER_BATCH_SIZE):
+        self.session_factory = session_factory
+        self.service = service or get_notification_service()
+        self.max_matches = max_matches
+        self.user_batch_size = user_batch_size
+
+    def due_matches_query(self, db: Session, frequency: str, now: datetime):
+        """Pending recommended matches of every user whose window has elapsed."""
+        window_start = now - DIGEST_WINDOWS[frequency]
+
+        return db.query(JobMatch, Job, User, UserProfile).join(
+            Job, Job.id == JobMatch.job_id
+        ).join(
+            User, User.id == JobMatch.user_id
+        ).join(
+            UserProfile, UserProfile.user_id == User.id
+        ).filter(
+            UserProfile.notification_frequency == frequency,
+            or_(UserProfile.email_notifications == True, UserProfile.whatsapp_notifications == True),
+            or_(UserProfile.last_digest_at.is_(None), UserProfile.last_digest_at <= window_start),
+            User.is_active == True,
+            JobMatch.notified_at.is_(None),
+            JobMatch.is_recommended == True,
+            JobMatch.is_dismissed == False,
+            Job.is_active == True
+        ).order_by(User.id, JobMatch.overall_score.desc())
+
+    def _flush(self, db: Session, digests: List[Dict], now: datetime) -> int:
+        """Queue digests for a batch of users and mark the included matches notified."""
+        if not digests:
+            return 0
+
+        match_ids = []
+        for digest in digests:
+            rows = digest['rows'][:self.max_matches]
+            matches = [
+                {
+                    'job': job,
+                    'overall_score': match.overall_score,
+                    'matching_skills': match.matching_skills or []
+                }
+                for match, job in rows
+            ]
+            self.service.send_job_match_notification(
+                db, digest['user'], matches, user_profile=digest['profile'], commit=False
+            )
+            # Only the matches in the digest count as notified
+            match_ids.extend(match.id for match, _ in rows)
+
+        db.execute(
+            update(JobMatch).where(JobMatch.id.in_(match_ids)).values(notified_at=now),
+            execution_options={"synchronize_session": False}
+        )
+        db.execute(
+            update(UserProfile).where(
+                UserProfile.user_id.in_([d['user'].id for d in digests])
+            ).values(last_digest_at=now),
+            execution_options={"synchronize_session": False}
+        )
+        db.commit()
+
+        return len(digests)
+
+    def run_window(self, frequency: str, now: Optional[datetime] = None) -> int:
+        """Send digests for every due user of one frequency; returns users notified."""
+        now = now or datetime.utcnow()
+        read_db = self.session_factory()
+        write_db = self.session_factory()
+
+        sent = 0
+        digests: List[Dict] = []
+        current: Optional[Dict] = None
+
+        try:
+            for match, job, user, profile in self.due_matches_query(read_db, frequency, now).yield_per(1000):
+                if current is None or current['user'].id != user.id:
+                    if len(digests) >= self.user_batch_size:
+                        sent += self._flush(write_db, digests, now)
+                        digests = []
+                    current = {'user': user, 'profile': profile, 'rows': []}
+                    digests.append(current)
+                current['rows'].append((match, job))
+
+            sent += self._flush(write_db, digests, now)
+        except Exception as e:
+            write_db.rollback()
+            logger.error(f"{frequency} digest run failed: {e}")
+            raise
+        finally:
+            read_db.close()
+            write_db.close()
+
+        if sent:
+            logger.info(f"Queued {sent} {frequency} job match digests")
+        return sent
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Run every frequency window once."""
+        now = now or datetime.utcnow()
+        return {frequency: self.run_window(frequency, now) for frequency in DIGEST_WINDOWS}
+
+    def run_forever(self, poll_interval: int = DIGEST_POLL_INTERVAL):
+        """Run all windows every poll_interval seconds."""
+        logger.info("Digest scheduler started")
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Digest scheduler pass failed: {e}")
+            time.sleep(poll_interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Send job match digests")
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    args = parser.parse_args()
+
+    scheduler = DigestScheduler()
+    if args.once:
+        print(scheduler.run_once())
+    else:
+        scheduler.run_forever()
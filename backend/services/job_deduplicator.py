@@ -0,0 +1,298 @@
+import os
+import re
+import hashlib
+import logging
+import argparse
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import delete, func, insert, select, text, tuple_
+from sqlalchemy.orm import Session, aliased
+
+from database.database import SessionLocal
+from database.models import Job, JobSignature, JobSignatureBand
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+DEDUP_ENABLED = os.getenv("JOB_DEDUP_ENABLED", "true").lower() == "true"
+DEDUP_THRESHOLD = float(os.getenv("JOB_DEDUP_THRESHOLD", "0.8"))
+
+# Mersenne prime used for the universal hash family
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Advisory lock serializing deduplication batches on Postgres
+DEDUP_LOCK_ID = 72616902
+
+# Legal suffixes that differ between boards for the same employer
+_COMPANY_SUFFIXES = {
+    'inc', 'llc', 'ltd', 'limited', 'pvt', 'private', 'corp', 'corporation',
+    'co', 'company', 'gmbh', 'plc', 'technologies', 'solutions'
+}
+
+# Title abbreviations boards spell differently
+_TITLE_ABBREVIATIONS = {
+    'sr': 'senior', 'jr': 'junior', 'mgr': 'manager', 'engg': 'engineering', 'dev': 'developer'
+}
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    if not text:
+        return ""
+    text = re.sub(r'[^a-z0-9+#]+', ' ', text.lower())
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _stable_hash(value: str) -> int:
+    """64-bit hash that is stable across processes (unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Normalized title with common abbreviations expanded."""
+    return " ".join(_TITLE_ABBREVIATIONS.get(word, word) for word in normalize_text(title).split())
+
+
+def normalize_company(company: Optional[str]) -> str:
+    """Normalized company name without legal suffixes."""
+    return " ".join(w for w in normalize_text(company).split() if w not in _COMPANY_SUFFIXES)
+
+
+def normalize_city(location: Optional[str]) -> str:
+    """Normalized city; boards disagree on state/country suffixes, so only it is compared."""
+    return normalize_text((location or "").split(',')[0])
+
+
+class MinHasher:
+    """Computes MinHash signatures with a fixed family of permutations."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 42):
+        self.num_perm = num_perm
+        self.seed = seed
+
+        # Derive permutation coefficients deterministically so persisted
+        # signatures stay comparable across restarts
+        self.permutations = []
+        for i in range(num_perm):
+            a = _stable_hash(f"a:{seed}:{i}") % (_MERSENNE_PRIME - 1) + 1
+            b = _stable_hash(f"b:{seed}:{i}") % _MERSENNE_PRIME
+            self.permutations.append((a, b))
+
+    def signature(self, shingles: Set[str]) -> List[int]:
+        """Compute the MinHash signature of a shingle set."""
+        if not shingles:
+            return [_MAX_HASH] * self.num_perm
+
+        hashes = [_stable_hash(shingle) for shingle in shingles]
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self.permutations
+        ]
+
+    @staticmethod
+    def jaccard(sig_a: List[int], sig_b: List[int]) -> float:
+        """Estimate Jaccard similarity from two signatures."""
+        if not sig_a or len(sig_a) != len(sig_b):
+            return 0.0
+        equal = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+        return equal / len(sig_a)
+
+
+class JobDeduplicator:
+    """Clusters near-duplicate job postings across sources.
+
+    Each job is fingerprinted from its normalized title, company, location and
+    description shingles. Its MinHash signature and LSH band keys are stored
+    in job_signatures / job_signature_bands, and a new job is compared only
+    with postings sharing a band key (one indexed lookup), so a batch costs
+    roughly O(batch size) regardless of how many jobs have been seen before.
+
+    Those fields add a handful of shingles next to hundreds from the
+    description, so the same text posted for another city or seniority still
+    scores above the threshold. A candidate is therefore a duplicate only if
+    its normalized title, company and city also equal the new job's. The
+    first job seen in a cluster stays canonical; later duplicates are
+    deactivated and point at it through ``duplicate_of_id``. Once the
+    canonical is deactivated, the next matching job starts a new cluster
+    instead of joining one with no active posting.
+
+    The index lives in the database, so every scraper worker and process sees
+    the same one. On Postgres, batches are serialized with an advisory lock so
+    two workers cannot both miss a duplicate they are inserting concurrently.
+    Changing num_perm or bands requires ``rebuild()``.
+    """
+
+    def __init__(self, threshold: float = DEDUP_THRESHOLD, num_perm: int = 128, bands: int = 16,
+                 shingle_size: int = 3):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm=num_perm)
+
+    def fingerprint(self, title: str, company: str, location: str, description: str) -> Set[str]:
+        """Build the shingle set used for MinHash."""
+        shingles = set()
+
+        for word in normalize_title(title).split():
+            shingles.add(f"t:{word}")
+
+        company = normalize_company(company)
+        if company:
+            shingles.add(f"c:{company}")
+
+        city = normalize_city(location)
+        if city:
+            shingles.add(f"l:{city}")
+
+        words = normalize_text(description).split()
+        size = self.shingle_size
+        for i in range(max(len(words) - size + 1, 0)):
+            shingles.add("d:" + " ".join(words[i:i + size]))
+
+        return shingles
+
+    @staticmethod
+    def identity(title: Optional[str], company: Optional[str], location: Optional[str]) -> Tuple[str, str, str]:
+        """Fields that must match exactly for two postings to be duplicates."""
+        return normalize_title(title), normalize_company(company), normalize_city(location)
+
+    def job_signature(self, job: Job) -> List[int]:
+        """Compute the MinHash signature for a job."""
+        return self.hasher.signature(
+            self.fingerprint(job.title, job.company, job.location, job.description)
+        )
+
+    def band_keys(self, signature: List[int]) -> List[str]:
+        """Hash each band of a signature to a bucket key."""
+        keys = []
+        for band in range(self.bands):
+            start = band * self.rows
+            chunk = ",".join(str(v) for v in signature[start:start + self.rows])
+            keys.append(hashlib.blake2b(chunk.encode('utf-8'), digest_size=8).hexdigest())
+        return keys
+
+    def find_duplicate(self, db: Session, signature: List[int],
+                       identity: Tuple[str, str, str]) -> Optional[Tuple[int, float]]:
+        """Return (canonical job id, similarity) of the closest indexed duplicate.
+
+        Only candidates with the same identity() whose canonical is still
+        active are considered.
+        """
+        sharing_a_band = select(JobSignatureBand.job_id).where(
+            tuple_(JobSignatureBand.band, JobSignatureBand.band_key).in_(list(enumerate(self.band_keys(signature))))
+        )
+        canonical = aliased(Job)
+        candidates = db.execute(
+            select(JobSignature.signature, canonical.id, Job.title, Job.company, Job.location)
+            .join(Job, Job.id == JobSignature.job_id)
+            .join(canonical, canonical.id == func.coalesce(Job.duplicate_of_id, Job.id))
+            .where(JobSignature.job_id.in_(sharing_a_band), canonical.is_active == True)
+        )
+
+        best = None
+        for candidate_signature, canonical_id, title, company, location in candidates:
+            if self.identity(title, company, location) != identity:
+                continue
+            similarity = MinHasher.jaccard(signature, candidate_signature)
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (canonical_id, similarity)
+        return best
+
+    def _index(self, db: Session, job_id: int, signature: List[int]):
+        db.execute(insert(JobSignature), [{"job_id": job_id, "signature": signature}])
+        db.execute(insert(JobSignatureBand), [
+            {"job_id": job_id, "band": band, "band_key": key}
+            for band, key in enumerate(self.band_keys(signature))
+        ])
+
+    def _lock(self, db: Session):
+        # Held until the batch commits
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": DEDUP_LOCK_ID})
+
+    def deduplicate(self, db: Session, jobs: List[Job]) -> Dict[str, int]:
+        """Check a batch of persisted jobs against the index and mark duplicates; commits."""
+        stats = {'checked': 0, 'duplicates': 0, 'canonical': 0}
+        self._lock(db)
+
+        job_ids = [job.id for job in jobs if job.id is not None]
+        indexed = set(db.scalars(select(JobSignature.job_id).where(JobSignature.job_id.in_(job_ids))))
+
+        for job in jobs:
+            if job.id is None or job.id in indexed:
+                continue
+            indexed.add(job.id)
+
+            stats['checked'] += 1
+            signature = self.job_signature(job)
+            duplicate = self.find_duplicate(db, signature, self.identity(job.title, job.company, job.location))
+
+            if duplicate and duplicate[0] != job.id:
+                canonical_id, similarity = duplicate
+                job.duplicate_of_id = canonical_id
+                job.is_active = False
+                # Later jobs in the batch resolve their canonical id through this row
+                db.flush()
+                stats['duplicates'] += 1
+                logger.debug(f"Job {job.id} duplicates job {canonical_id} (similarity {similarity:.2f})")
+            else:
+                stats['canonical'] += 1
+            self._index(db, job.id, signature)
+
+        db.commit()
+
+        logger.info(f"Deduplicated {stats['checked']} jobs: {stats['duplicates']} duplicates found")
+        return stats
+
+    def rebuild(self, db: Session, batch_size: int = 1000) -> Dict[str, int]:
+        """Re-index every job in the database, keeping the existing clusters."""
+        self._lock(db)
+        db.execute(delete(JobSignatureBand))
+        db.execute(delete(JobSignature))
+
+        indexed = 0
+        last_id = 0
+        while True:
+            jobs = db.query(Job).filter(Job.id > last_id).order_by(Job.id).limit(batch_size).all()
+            if not jobs:
+                break
+            last_id = jobs[-1].id
+
+            for job in jobs:
+                self._index(db, job.id, self.job_signature(job))
+            indexed += len(jobs)
+            db.expunge_all()
+
+        db.commit()
+        return {'indexed': indexed}
+
+
+@lru_cache(maxsize=1)
+def get_job_deduplicator() -> Optional[JobDeduplicator]:
+    """Return the shared deduplicator, or None when JOB_DEDUP_ENABLED is off."""
+    return JobDeduplicator() if DEDUP_ENABLED else None
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Manage the near-duplicate job index")
+    parser.add_argument("--rebuild", action="store_true", help="Re-index every job (after upgrading or "
+                                                               "changing the MinHash parameters)")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        db = SessionLocal()
+        try:
+            print(JobDeduplicator().rebuild(db))
+        finally:
+            db.close()
+    else:
+        parser.print_help()
@@ -0,0 +1,165 @@
+import time
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from database.models import Job, ScrapingJob
+from services.job_deduplicator import get_job_deduplicator
+
+logger = logging.getLogger(__name__)
+
+# Default for ``deduplicator`` arguments: use the shared deduplicator.
+# None disables the near-duplicate check (e.g. when replaying fixtures)
+DEFAULT_DEDUPLICATOR: Any = object()
+
+# Fields refreshed on an existing job when it is scraped again
+UPDATABLE_FIELDS = (
+    "title", "company", "location", "description", "requirements",
+    "salary_min", "salary_max", "experience_level", "work_type", "job_type",
+    "external_url", "required_skills", "preferred_skills", "posted_date",
+)
+
+
+def stage_jobs(db: Session, jobs: List[Dict[str, Any]]) -> Tuple[Dict[str, int], List[Job]]:
+    """Add or update normalized job dicts keyed by (source, external_id), without committing.
+
+    Existing rows are loaded with one query per source in the batch rather
+    than one per job. Returns counts and the newly created Job rows.
+    """
+    stats = {'created': 0, 'updated': 0, 'skipped': 0}
+    if not jobs:
+        return stats, []
+
+    # Load existing jobs for this batch in one round trip per source
+    ids_by_source: Dict[str, set] = {}
+    for job in jobs:
+        if job.get("source") and job.get("external_id"):
+            ids_by_source.setdefault(job["source"], set()).add(job["external_id"])
+
+    existing: Dict[Tuple[str, str], Job] = {}
+    for source, external_ids in ids_by_source.items():
+        rows = db.query(Job).filter(
+            Job.source == source,
+            Job.external_id.in_(external_ids)
+        ).all()
+        for row in rows:
+            existing[(row.source, row.external_id)] = row
+
+    created: List[Job] = []
+    for job in jobs:
+        if not job.get("title") or not job.get("company"):
+            stats['skipped'] += 1
+            continue
+
+        key = (job.get("source"), job.get("external_id"))
+        row = existing.get(key) if key[1] else None
+
+        if row is not None:
+            for field in UPDATABLE_FIELDS:
+                value = job.get(field)
+                if value is not None and value != getattr(row, field):
+                    setattr(row, field, value)
+            stats['updated'] += 1
+        else:
+            row = Job(**{k: v for k, v in job.items() if hasattr(Job, k)})
+            db.add(row)
+            created.append(row)
+            if key[1]:
+                existing[key] = row
+            stats['created'] += 1
+
+    return stats, created
+
+
+def deduplicate_created(db: Session, created: List[Job], stats: Dict[str, int],
+                        deduplicator: Optional[Any] = None):
+    """Check committed new jobs against the near-duplicate index (they need ids)."""
+    if deduplicator is not None and created:
+        stats['duplicates'] = deduplicator.deduplicate(db, created)['duplicates']
+
+
+def upsert_jobs(db: Session, jobs: List[Dict[str, Any]],
+                deduplicator: Optional[Any] = None) -> Tuple[Dict[str, int], List[Job]]:
+    """Insert or update normalized job dicts and commit; see stage_jobs."""
+    stats, created = stage_jobs(db, jobs)
+    db.commit()
+    deduplicate_created(db, created, stats, deduplicator)
+    return stats, created
+
+
+class BatchedJobWriter:
+    """Buffers streamed jobs and upserts them every N jobs or T seconds.
+
+    Each flush commits the batch together with the ScrapingJob counters, so
+    progress is durable and visible while a scrape is still running, and a
+    failure mid-run only loses the unflushed tail. Memory is bounded by the
+    batch size no matter how many jobs the source yields.
+
+    The time limit is checked when jobs are added; the writer never touches
+    the session from another thread. New jobs go through the shared
+    near-duplicate check unless another deduplicator (or None, to skip the
+    check) is passed in.
+    """
+
+    def __init__(self, db: Session, scraping_job: Optional[ScrapingJob] = None,
+                 batch_size: int = 50, flush_interval: float = 5.0,
+                 deduplicator: Optional[Any] = DEFAULT_DEDUPLICATOR):
+        self.db = db
+        self.scraping_job = scraping_job
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.deduplicator = get_job_deduplicator() if deduplicator is DEFAULT_DEDUPLICATOR else deduplicator
+
+        self.buffer: List[Dict[str, Any]] = []
+        self.stats = {'found': 0, 'created': 0, 'updated': 0, 'skipped': 0}
+        self._last_flush = time.monotonic()
+
+    def add(self, job: Dict[str, Any]):
+        """Queue a job, flushing if the batch is full or the interval elapsed."""
+        self.buffer.append(job)
+        self.stats['found'] += 1
+
+        if (len(self.buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Upsert buffered jobs and persist progress counters in one commit."""
+        batch, self.buffer = self.buffer, []
+        self._last_flush = time.monotonic()
+
+        valid = [job for job in batch if job.get("title") and job.get("company")]
+        self.stats['skipped'] += len(batch) - len(valid)
+
+        stats, created = stage_jobs(self.db, valid)
+        if self.scraping_job is not None:
+            # jobs_saved counts new postings; re-scraped ones are only refreshed
+            self.scraping_job.jobs_found = self.stats['found']
+            self.scraping_job.jobs_saved = (self.scraping_job.jobs_saved or 0) + stats['created']
+        self.db.commit()
+
+        self.stats['created'] += stats['created']
+        self.stats['updated'] += stats['updated']
+        deduplicate_created(self.db, created, stats, self.deduplicator)
+
+    def write(self, jobs: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Consume a job stream to the end, flushing as it goes."""
+        for job in jobs:
+            self.add(job)
+        self.flush()
+        return self.stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Persist whatever was scraped before an error, too
+        if exc_type is not None:
+            self.db.rollback()
+        try:
+            self.flush()
+        except Exception as e:
+            if exc_type is None:
+                raise
+            self.db.rollback()
+            logger.error(f"Could not flush scraped jobs after error: {e}")
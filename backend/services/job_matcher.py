@@ -5,25 +5,53 @@ from openai import OpenAI
 from dotenv import load_dotenv
 import math
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session, load_only
 
 from database.models import User, UserProfile, Resume, Job, JobMatch
 from schemas.schemas import JobSearchRequest
+from services.system_config import SystemConfigCache, get_system_config
 
 load_dotenv()
 
+# Defaults for the tunables read from system_config
+DEFAULT_WEIGHTS = {
+    'skills': 0.35,
+    'experience': 0.25,
+    'location': 0.15,
+    'salary': 0.15,
+    'education': 0.10
+}
+DEFAULT_MIN_SCORE = 30  # matches below this are not stored
+DEFAULT_RECOMMEND_SCORE = 70
+DEFAULT_STALE_SCORE = 40  # unviewed matches below this are dropped on refresh
+
 class JobMatcher:
-    def __init__(self):
+    def __init__(self, config: Optional[SystemConfigCache] = None):
         self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        
-        # Weights for different matching criteria
-        self.weights = {
-            'skills': 0.35,
-            'experience': 0.25,
-            'location': 0.15,
-            'salary': 0.15,
-            'education': 0.10
-        }
+        self.config = config or get_system_config()
+    
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Weights for different matching criteria (system_config "matching.weights", partial JSON object)."""
+        overrides = self.config.get_json('matching.weights', {})
+        if not isinstance(overrides, dict):
+            return dict(DEFAULT_WEIGHTS)
+        return {**DEFAULT_WEIGHTS, **{
+            name: weight for name, weight in overrides.items() if isinstance(weight, (int, float))
+        }}
+    
+    @property
+    def min_score(self) -> float:
+        return self.config.get_float('matching.min_score', DEFAULT_MIN_SCORE)
+    
+    @property
+    def recommend_score(self) -> float:
+        return self.config.get_float('matching.recommend_score', DEFAULT_RECOMMEND_SCORE)
+    
+    @property
+    def stale_score(self) -> float:
+        return self.config.get_float('matching.stale_score', DEFAULT_STALE_SCORE)
     
     def calculate_skills_match(self, user_skills: List[str], job_required_skills: List[str], 
                               job_preferred_skills: List[str] = None) -> Tuple[float, List[str], List[str]]:
@@ -297,11 +325,12 @@ class JobMatcher:
         )
         
         # Calculate weighted overall score
+        weights = self.weights
         overall_score = (
-            skills_score * self.weights['skills'] +
-            experience_score * self.weights['experience'] +
-            location_score * self.weights['location'] +
-            salary_score * self.weights['salary']
+            skills_score * weights['skills'] +
+            experience_score * weights['experience'] +
+            location_score * weights['location'] +
+            salary_score * weights['salary']
         )
         
         # Generate explanation
@@ -321,12 +350,16 @@ class JobMatcher:
             'match_explanation': explanation
         }
     
-    def find_job_matches(self, db: Session, user: User, limit: int = 20) -> List[JobMatch]:
+    def find_job_matches(self, db: Session, user: User, limit: Optional[int] = 20,
+                         commit: bool = True) -> List[JobMatch]:
         """Find and score job matches for a user."""
         
         # Get user profile and latest resume
         user_profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
-        user_resume = db.query(Resume).filter(
+        # Only the columns used for scoring, not the parsed resume blobs
+        user_resume = db.query(Resume).options(
+            load_only(Resume.id, Resume.skills_extracted, Resume.experience_years)
+        ).filter(
             Resume.user_id == user.id, 
             Resume.is_active == True
         ).order_by(Resume.created_at.desc()).first()
@@ -351,60 +384,77 @@ class JobMatcher:
         
         jobs = jobs_query.limit(100).all()  # Limit to avoid processing too many jobs
         
+        # Jobs already matched, in one query
+        existing_job_ids = set()
+        if jobs:
+            existing_job_ids = {
+                job_id for (job_id,) in db.query(JobMatch.job_id).filter(
+                    JobMatch.user_id == user.id,
+                    JobMatch.job_id.in_([job.id for job in jobs])
+                )
+            }
+        
         # Calculate matches
-        matches = []
+        min_score = self.min_score
+        recommend_score = self.recommend_score
+        rows = []
         for job in jobs:
-            # Check if match already exists
-            existing_match = db.query(JobMatch).filter(
-                JobMatch.user_id == user.id,
-                JobMatch.job_id == job.id
-            ).first()
-            
-            if existing_match:
+            if job.id in existing_job_ids:
                 continue
             
             # Calculate match score
             match_data = self.calculate_job_match(user, user_profile, user_resume, job)
             
             # Only create matches above threshold
-            if match_data['overall_score'] >= 30:
-                job_match = JobMatch(
-                    user_id=user.id,
-                    job_id=job.id,
-                    overall_score=match_data['overall_score'],
-                    skills_score=match_data['skills_score'],
-                    experience_score=match_data['experience_score'],
-                    location_score=match_data['location_score'],
-                    salary_score=match_data['salary_score'],
-                    matching_skills=match_data['matching_skills'],
-                    missing_skills=match_data['missing_skills'],
-                    match_explanation=match_data['match_explanation'],
-                    is_recommended=match_data['overall_score'] >= 70
-                )
-                
-                db.add(job_match)
-                matches.append(job_match)
+            if match_data['overall_score'] >= min_score:
+                rows.append({
+                    'user_id': user.id,
+                    'job_id': job.id,
+                    'overall_score': match_data['overall_score'],
+                    'skills_score': match_data['skills_score'],
+                    'experience_score': match_data['experience_score'],
+                    'location_score': match_data['location_score'],
+                    'salary_score': match_data['salary_score'],
+                    'matching_skills': match_data['matching_skills'],
+                    'missing_skills': match_data['missing_skills'],
+                    'match_explanation': match_data['match_explanation'],
+                    'is_recommended': match_data['overall_score'] >= recommend_score
+                })
+        
+        # Insert new matches with a single multi-row INSERT
+        matches = []
+        if rows:
+            matches = list(db.scalars(insert(JobMatch).returning(JobMatch), rows).all())
         
-        # Commit new matches
-        db.commit()
+        if commit:
+            db.commit()
         
         # Return top matches
         return sorted(matches, key=lambda x: x.overall_score, reverse=True)[:limit]
     
-    def update_match_recommendations(self, db: Session, user: User):
-        """Update match recommendations for a user (called after profile/resume updates)."""
+    def update_match_recommendations(self, db: Session, user: User) -> Tuple[int, int]:
+        """Update match recommendations for a user (called after profile/resume updates).
         
-        # Remove old matches that are no longer relevant
-        old_matches = db.query(JobMatch).filter(
-            JobMatch.user_id == user.id,
-            JobMatch.is_viewed == False,
-            JobMatch.overall_score < 40
-        ).all()
+        Returns (stale matches removed, new matches added); both happen in one transaction.
+        """
         
-        for match in old_matches:
-            db.delete(match)
+        # Remove old matches that are no longer relevant, in one statement
+        result = db.execute(
+            delete(JobMatch).where(
+                JobMatch.user_id == user.id,
+                JobMatch.is_viewed == False,
+                JobMatch.overall_score < self.stale_score
+            ),
+            execution_options={"synchronize_session": False}
+        )
+        removed = result.rowcount
         
         # Find new matches
-        self.find_job_matches(db, user, limit=50)
-        
-        db.commit()
\ No newline at end of file
+        try:
+            added = self.find_job_matches(db, user, limit=None, commit=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        return removed, len(added)
@@ -0,0 +1,247 @@
+import os
+import re
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import and_, column, func, inspect, literal_column, or_, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import Job
+from schemas.schemas import JobSearchRequest
+from services.pagination import decode_cursor, encode_cursor
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+# Relevance ranking is limited to the newest N matching postings, which keeps
+# broad queries ("engineer") from scoring every row of the table
+JOB_SEARCH_RANK_WINDOW = int(os.getenv("JOB_SEARCH_RANK_WINDOW", "1000"))
+JOB_SEARCH_MAX_LIMIT = 100
+
+# Full-text structures created by the migrations (see 0003_job_search)
+FTS_TABLE = "jobs_fts"
+SEARCH_VECTOR = "search_vector"
+# bm25 weights for the jobs_fts columns: title, company, description, location
+FTS_WEIGHTS = (10.0, 5.0, 1.0, 0.0)
+
+jobs_fts = table(FTS_TABLE, column("rowid"))
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchPage(NamedTuple):
+    items: List[Job]
+    next_cursor: Optional[str]
+    has_more: bool
+    total: Optional[int] = None
+    # More postings matched than the rank window holds; older ones were not ranked
+    truncated: bool = False
+
+
+def fts_phrase(text: str) -> Optional[str]:
+    """FTS5 phrase for free text; user input never reaches the query syntax."""
+    tokens = _TOKEN.findall(text.lower())
+    return '"' + " ".join(tokens) + '"' if tokens else None
+
+
+def fts_query(query: Optional[str], skills: List[str], location: Optional[str]) -> Optional[str]:
+    """FTS5 MATCH expression: all query terms, any skill, the location terms."""
+    parts = []
+    terms = [f'"{token}"' for token in _TOKEN.findall((query or "").lower())]
+    if terms:
+        parts.append("{title company description} : (" + " AND ".join(terms) + ")")
+    phrases = [phrase for phrase in (fts_phrase(skill) for skill in skills) if phrase]
+    if phrases:
+        parts.append("{title description} : (" + " OR ".join(phrases) + ")")
+    places = [f'"{token}"' for token in _TOKEN.findall((location or "").lower())]
+    if places:
+        parts.append("location : (" + " AND ".join(places) + ")")
+    return " AND ".join(parts) if parts else None
+
+
+def websearch_skills(skills: List[str]) -> Optional[str]:
+    """websearch_to_tsquery input matching any of the skills."""
+    phrases = [" ".join(_TOKEN.findall(skill)) for skill in skills]
+    phrases = [f'"{phrase}"' for phrase in phrases if phrase]
+    return " or ".join(phrases) if phrases else None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def ranked_cursor(after: Dict[str, Any]) -> Dict[str, Any]:
+    """Check the keyset values of a ranked search cursor; raises ValueError.
+
+    Unranked searches issue id-only cursors, which are rejected here if the
+    search has gained a text query since.
+    """
+    if not _is_number(after.get("s")) or not isinstance(after.get("w"), int) or isinstance(after["w"], bool):
+        raise ValueError("Invalid cursor")
+    if after.get("t", 0) not in (0, 1):
+        raise ValueError("Invalid cursor")
+    return after
+
+
+class JobSearch:
+    """Ranked job search with keyset pagination.
+
+    Postgres uses the generated ``jobs.search_vector`` tsvector (GIN indexed)
+    and a pg_trgm index for location substrings; SQLite uses the ``jobs_fts``
+    FTS5 table. Without either (a database created by create_all and never
+    migrated) it falls back to unranked ILIKE filtering.
+
+    Text queries rank the newest ``rank_window`` matching postings by
+    relevance; the window's lowest job id travels in the cursor so later
+    pages rank the same set. When more postings match, every page of the
+    search is flagged ``truncated``.
+    """
+
+    def __init__(self, rank_window: int = JOB_SEARCH_RANK_WINDOW):
+        self.rank_window = rank_window
+        self._support: Dict[str, Optional[str]] = {}
+
+    async def backend(self, db: AsyncSession) -> Optional[str]:
+        """"postgresql", "sqlite" or None when the search structures are missing."""
+        bind = db.get_bind()
+        key = str(bind.url)
+        if key not in self._support:
+            dialect = bind.dialect.name
+
+            def check(session):
+                inspector = inspect(session.connection())
+                if dialect == "postgresql":
+                    return SEARCH_VECTOR in {col["name"] for col in inspector.get_columns("jobs")}
+                if dialect == "sqlite":
+                    return inspector.has_table(FTS_TABLE)
+                return False
+
+            supported = await db.run_sync(check)
+            if not supported:
+                logger.warning("Job search indexes missing (run `alembic upgrade head`); using ILIKE fallback")
+            self._support[key] = dialect if supported else None
+        return self._support[key]
+
+    def _filters(self, request: JobSearchRequest) -> List[Any]:
+        filters = [Job.is_active == True, Job.duplicate_of_id.is_(None)]
+        if request.experience_level:
+            filters.append(Job.experience_level == request.experience_level.value)
+        if request.work_type:
+            filters.append(Job.work_type == request.work_type.value)
+        if request.salary_min:
+            filters.append(or_(Job.salary_max.is_(None), Job.salary_max >= request.salary_min))
+        return filters
+
+    def _text_query(self, backend: Optional[str], request: JobSearchRequest) -> Tuple[List[Any], Any, Any, Any]:
+        """(match clauses, id column, rank expression or None, FROM clause) for the text criteria."""
+        skills = request.skills or []
+
+        if backend == "sqlite":
+            match = fts_query(request.query, skills, request.location)
+            if match is None:
+                return [], Job.id, None, Job
+            fts = literal_column(FTS_TABLE)
+            columns = [jobs_fts.c.rowid.label("id")]
+            if request.query or skills:
+                # bm25 is lower for better matches
+                columns.append((-func.bm25(fts, *FTS_WEIGHTS)).label("score"))
+            matches = select(*columns).where(fts.op("MATCH")(match)).subquery("fts")
+            # Ordering and keyset conditions go on the FTS rowid so SQLite drives the
+            # join from jobs_fts instead of re-running the MATCH for every jobs row
+            source = Job.__table__.join(matches, matches.c.id == Job.id)
+            rank = matches.c.score if len(columns) > 1 else None
+            return [], matches.c.id, rank, source
+
+        clauses = []
+        rank = None
+        if backend == "postgresql":
+            vector = literal_column(f"jobs.{SEARCH_VECTOR}")
+            tsqueries = []
+            if request.query and request.query.strip():
+                tsqueries.append(func.websearch_to_tsquery("english", request.query))
+            skills_query = websearch_skills(skills)
+            if skills_query:
+                tsqueries.append(func.websearch_to_tsquery("english", skills_query))
+            for tsquery in tsqueries:
+                clauses.append(vector.op("@@")(tsquery))
+            if tsqueries:
+                combined = tsqueries[0] if len(tsqueries) == 1 else tsqueries[0].op("&&")(tsqueries[1])
+                # Normalization 32 maps the rank into [0, 1)
+                rank = func.ts_rank_cd(vector, combined, 32)
+        else:
+            for token in _TOKEN.findall(request.query or ""):
+                pattern = f"%{token}%"
+                clauses.append(or_(Job.title.ilike(pattern), Job.company.ilike(pattern),
+                                   Job.description.ilike(pattern)))
+            if skills:
+                clauses.append(or_(*(Job.description.ilike(f"%{skill}%") for skill in skills)))
+
+        if request.location and request.location.strip():
+            # Served by the pg_trgm index on Postgres
+            clauses.append(Job.location.ilike(f"%{request.location.strip()}%"))
+        return clauses, Job.id, rank, Job
+
+    async def search(self, db: AsyncSession, request: JobSearchRequest,
+                     cursor: Optional[str] = None) -> SearchPage:
+        """Return a page of jobs; next_cursor is None on the last page."""
+        after = decode_cursor(cursor) if cursor else None
+        limit = max(1, min(request.limit, JOB_SEARCH_MAX_LIMIT))
+
+        backend = await self.backend(db)
+        clauses, job_id, rank, source = self._text_query(backend, request)
+        conditions = self._filters(request) + clauses
+
+        if rank is None:
+            statement = select(Job).select_from(source).where(*conditions)
+            if after:
+                statement = statement.where(job_id < after["id"])
+            result = await db.execute(statement.order_by(job_id.desc()).limit(limit + 1))
+            jobs = list(result.scalars().all())
+            has_more = len(jobs) > limit
+            jobs = jobs[:limit]
+            next_cursor = encode_cursor({"id": jobs[-1].id}) if has_more else None
+            return SearchPage(jobs, next_cursor, has_more)
+
+        if after:
+            ranked_cursor(after)
+            window_start = after["w"]
+            truncated = bool(after.get("t"))
+        else:
+            # The window's oldest id, and the next older match if there is one
+            bounds = (await db.execute(
+                select(job_id).select_from(source).where(*conditions).order_by(
+                    job_id.desc()
+                ).offset(self.rank_window - 1).limit(2)
+            )).scalars().all()
+            window_start = bounds[0] if bounds else 0
+            truncated = len(bounds) > 1
+
+        score = rank.label("score")
+        statement = select(Job, score).select_from(source).where(*conditions, job_id >= window_start)
+        if after:
+            statement = statement.where(or_(
+                rank < after["s"],
+                and_(rank == after["s"], job_id < after["id"])
+            ))
+        result = await db.execute(statement.order_by(score.desc(), job_id.desc()).limit(limit + 1))
+        rows = result.all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more:
+            last_job, last_score = rows[-1]
+            values = {"s": float(last_score), "id": last_job.id, "w": window_start}
+            if truncated:
+                values["t"] = 1
+            next_cursor = encode_cursor(values)
+        return SearchPage([job for job, _ in rows], next_cursor, has_more, truncated=truncated)
+
+
+@lru_cache(maxsize=1)
+def get_job_search() -> JobSearch:
+    """Return the process-wide job search service."""
+    return JobSearch()
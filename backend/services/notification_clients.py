@@ -0,0 +1,198 @@
+import os
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from twilio.rest import Client
+from twilio.http.http_client import TwilioHttpClient
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Provider credentials
+TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
+TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+TWILIO_API_HOST = os.getenv("TWILIO_API_HOST", "https://api.twilio.com")
+SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
+SENDGRID_API_HOST = os.getenv("SENDGRID_API_HOST", "https://api.sendgrid.com")
+
+# Connection pool configuration shared by both providers
+HTTP_POOL_SIZE = int(os.getenv("NOTIFICATION_HTTP_POOL_SIZE", "20"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("NOTIFICATION_HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("NOTIFICATION_HTTP_READ_TIMEOUT", "15"))
+
+
+def _pooled_session(pool_size: int) -> requests.Session:
+    """requests session keeping up to pool_size keep-alive connections per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class SendGridClient:
+    """Minimal SendGrid v3 mail client over a pooled keep-alive session."""
+
+    def __init__(self, api_key: str, host: str = SENDGRID_API_HOST, pool_size: int = HTTP_POOL_SIZE,
+                 connect_timeout: float = HTTP_CONNECT_TIMEOUT, read_timeout: float = HTTP_READ_TIMEOUT):
+        self.url = host.rstrip("/") + "/v3/mail/send"
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = _pooled_session(pool_size)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        })
+
+    def send_mail(self, body: Dict[str, Any]) -> Tuple[int, str]:
+        """POST a /v3/mail/send body; returns (status code, response text), 0 on network errors."""
+        try:
+            response = self.session.post(self.url, json=body, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.error(f"SendGrid request failed: {e}")
+            return 0, str(e)
+        return response.status_code, response.text
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncSendGridClient:
+    """SendGrid v3 mail client on a pooled httpx.AsyncClient, for asyncio workers."""
+
+    def __init__(self, api_key: str, host: str = SENDGRID_API_HOST, pool_size: int = HTTP_POOL_SIZE,
+                 connect_timeout: float = HTTP_CONNECT_TIMEOUT, read_timeout: float = HTTP_READ_TIMEOUT):
+        self.url = host.rstrip("/") + "/v3/mail/send"
+        self.client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {api_key}"},
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+        )
+
+    async def send_mail(self, body: Dict[str, Any]) -> Tuple[int, str]:
+        try:
+            response = await self.client.post(self.url, json=body)
+        except httpx.HTTPError as e:
+            logger.error(f"SendGrid request failed: {e}")
+            return 0, str(e)
+        return response.status_code, response.text
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+class AsyncTwilioClient:
+    """Sends Twilio messages through the REST API on a pooled httpx.AsyncClient."""
+
+    def __init__(self, account_sid: str, auth_token: str, host: str = TWILIO_API_HOST,
+                 pool_size: int = HTTP_POOL_SIZE, connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+                 read_timeout: float = HTTP_READ_TIMEOUT):
+        self.url = f"{host.rstrip('/')}/2010-04-01/Accounts/{account_sid}/Messages.json"
+        self.client = httpx.AsyncClient(
+            auth=(account_sid, auth_token),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+        )
+
+    async def create_message(self, from_: str, to: str, body: str) -> Tuple[int, str]:
+        """Create a message; returns (status code, response text), 0 on network errors."""
+        try:
+            response = await self.client.post(self.url, data={"From": from_, "To": to, "Body": body})
+        except httpx.HTTPError as e:
+            logger.error(f"Twilio request failed: {e}")
+            return 0, str(e)
+        return response.status_code, response.text
+
+    async def aclose(self):
+        await self.client.aclose()
+
+
+def create_twilio_client(account_sid: str, auth_token: str, pool_size: int = HTTP_POOL_SIZE,
+                         read_timeout: float = HTTP_READ_TIMEOUT) -> Client:
+    """Twilio REST client whose HTTP client reuses a pooled session."""
+    http_client = TwilioHttpClient(pool_connections=True, timeout=read_timeout)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    http_client.session.mount("https://", adapter)
+    return Client(account_sid, auth_token, http_client=http_client)
+
+
+# Process-wide clients, created on first use
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_or_create(name: str, factory):
+    client = _clients.get(name)
+    if client is None and name not in _clients:
+        with _clients_lock:
+            if name not in _clients:
+                _clients[name] = factory()
+            client = _clients[name]
+    return client
+
+
+def get_twilio_client() -> Optional[Client]:
+    """Shared Twilio client, or None without credentials."""
+    def factory():
+        if not (TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN):
+            logger.warning("Twilio credentials not found. WhatsApp notifications disabled.")
+            return None
+        return create_twilio_client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+    return _get_or_create("twilio", factory)
+
+
+def get_sendgrid_client() -> Optional[SendGridClient]:
+    """Shared SendGrid client, or None without an API key."""
+    def factory():
+        if not SENDGRID_API_KEY:
+            logger.warning("SendGrid API key not found. Email notifications disabled.")
+            return None
+        return SendGridClient(SENDGRID_API_KEY)
+    return _get_or_create("sendgrid", factory)
+
+
+class AsyncProviderClients:
+    """Async provider clients bound to one event loop."""
+
+    def __init__(self):
+        self.sendgrid = AsyncSendGridClient(SENDGRID_API_KEY) if SENDGRID_API_KEY else None
+        self.twilio = (
+            AsyncTwilioClient(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+            if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN else None
+        )
+
+    async def aclose(self):
+        for client in (self.sendgrid, self.twilio):
+            if client is not None:
+                await client.aclose()
+
+
+# httpx async connections belong to the loop that opened them
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncProviderClients]" = \
+    weakref.WeakKeyDictionary()
+
+
+def get_async_clients() -> AsyncProviderClients:
+    """Async clients for the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.get(loop)
+    if clients is None:
+        clients = _async_clients[loop] = AsyncProviderClients()
+    return clients
+
+
+def close_clients():
+    """Close the shared synchronous sessions (on shutdown)."""
+    with _clients_lock:
+        sendgrid = _clients.pop("sendgrid", None)
+        twilio = _clients.pop("twilio", None)
+    if sendgrid is not None:
+        sendgrid.close()
+    if twilio is not None and twilio.http_client.session is not None:
+        twilio.http_client.session.close()
@@ -1,21 +1,50 @@
 import os
+import re
+import html
+import time
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Any, Optional
-from twilio.rest import Client
-from sendgrid import SendGridAPIClient
+from typing import List, Dict, Any, Optional, Tuple, Hashable
+from datetime import datetime
+from functools import lru_cache
 from sendgrid.helpers.mail import Mail
 from dotenv import load_dotenv
 import logging
 from sqlalchemy.orm import Session
 
-from database.models import User, Notification, Job
+from database.models import User, UserProfile, Notification, Job
+from services.notification_templates import get_notification_templates
+from services.notification_clients import get_twilio_client, get_sendgrid_client, get_async_clients
+from services.metrics import counter, histogram
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# SendGrid accepts at most 1000 personalizations per request
+SENDGRID_BATCH_SIZE = min(int(os.getenv("SENDGRID_BATCH_SIZE", "1000")), 1000)
+# Per-personalization limit on the total size of substitutions
+SENDGRID_MAX_SUBSTITUTION_BYTES = 10000
+
+# Provider call instrumentation; channel is email, email_bulk or whatsapp
+SEND_LATENCY = histogram(
+    "notification_send_duration_seconds", "Latency of notification provider calls", ["channel"]
+)
+SEND_RESULTS = counter(
+    "notification_send_results", "Notification provider calls by HTTP status (error = no response)",
+    ["channel", "status"]
+)
+BULK_RECIPIENTS = counter(
+    "notification_bulk_recipients", "Recipients of bulk email requests by outcome", ["result"]
+)
+
+
+def record_send(channel: str, started: float, status_code: int):
+    """Record latency and outcome of one provider call."""
+    SEND_LATENCY.observe(time.perf_counter() - started, channel=channel)
+    SEND_RESULTS.inc(channel=channel, status=status_code or "error")
+
 class NotificationService:
     def __init__(self):
         # Twilio configuration for WhatsApp
@@ -27,18 +56,25 @@ class NotificationService:
         self.sendgrid_api_key = os.getenv("SENDGRID_API_KEY")
         self.from_email = os.getenv("FROM_EMAIL", "noreply@workwale.ai")
         
-        # Initialize clients
-        if self.twilio_account_sid and self.twilio_auth_token:
-            self.twilio_client = Client(self.twilio_account_sid, self.twilio_auth_token)
-        else:
-            self.twilio_client = None
-            logger.warning("Twilio credentials not found. WhatsApp notifications disabled.")
+        # Process-wide pooled clients, shared by every service instance
+        self.twilio_client = get_twilio_client()
+        self.sendgrid_client = get_sendgrid_client()
         
-        if self.sendgrid_api_key:
-            self.sendgrid_client = SendGridAPIClient(api_key=self.sendgrid_api_key)
-        else:
-            self.sendgrid_client = None
-            logger.warning("SendGrid API key not found. Email notifications disabled.")
+        self.bulk_batch_size = SENDGRID_BATCH_SIZE
+        self.templates = get_notification_templates()
+        self._email_templates: Dict[str, Dict[str, str]] = {}
+    
+    def build_email(self, to_email: str, subject: str, html_content: str,
+                    text_content: str = None) -> Dict[str, Any]:
+        """Build a SendGrid /v3/mail/send request body for one email."""
+        message = Mail(
+            from_email=self.from_email,
+            to_emails=to_email,
+            subject=subject,
+            html_content=html_content,
+            plain_text_content=text_content
+        )
+        return message.get()
     
     def send_email(self, to_email: str, subject: str, html_content: str, 
                    text_content: str = None) -> bool:
@@ -48,216 +84,335 @@ class NotificationService:
             return False
         
         try:
-            message = Mail(
-                from_email=self.from_email,
-                to_emails=to_email,
-                subject=subject,
-                html_content=html_content,
-                plain_text_content=text_content
+            started = time.perf_counter()
+            status_code, _ = self.sendgrid_client.send_mail(
+                self.build_email(to_email, subject, html_content, text_content)
             )
+            record_send("email", started, status_code)
             
-            response = self.sendgrid_client.send(message)
-            
-            if response.status_code >= 200 and response.status_code < 300:
+            if status_code >= 200 and status_code < 300:
                 logger.info(f"Email sent successfully to {to_email}")
                 return True
             else:
-                logger.error(f"Failed to send email to {to_email}. Status: {response.status_code}")
+                logger.error(f"Failed to send email to {to_email}. Status: {status_code}")
                 return False
                 
         except Exception as e:
             logger.error(f"Error sending email to {to_email}: {str(e)}")
             return False
     
+    async def send_email_async(self, to_email: str, subject: str, html_content: str,
+                               text_content: str = None) -> bool:
+        """Send email using SendGrid from an asyncio worker."""
+        client = get_async_clients().sendgrid
+        if not client:
+            logger.error("SendGrid client not initialized")
+            return False
+        
+        started = time.perf_counter()
+        status_code, _ = await client.send_mail(self.build_email(to_email, subject, html_content, text_content))
+        record_send("email", started, status_code)
+        if 200 <= status_code < 300:
+            logger.info(f"Email sent successfully to {to_email}")
+            return True
+        logger.error(f"Failed to send email to {to_email}. Status: {status_code}")
+        return False
+    
+    @staticmethod
+    def whatsapp_address(to_phone: str) -> str:
+        """Normalize a phone number into Twilio's whatsapp: address."""
+        # Ensure phone number is in correct format
+        if not to_phone.startswith('+'):
+            to_phone = '+' + to_phone.replace('+', '').replace(' ', '').replace('-', '')
+        return f'whatsapp:{to_phone}'
+    
     def send_whatsapp(self, to_phone: str, message: str) -> bool:
         """Send WhatsApp message using Twilio."""
         if not self.twilio_client:
             logger.error("Twilio client not initialized")
             return False
         
+        started = time.perf_counter()
         try:
-            # Ensure phone number is in correct format
-            if not to_phone.startswith('+'):
-                to_phone = '+' + to_phone.replace('+', '').replace(' ', '').replace('-', '')
-            
             message = self.twilio_client.messages.create(
                 body=message,
                 from_=self.twilio_whatsapp_number,
-                to=f'whatsapp:{to_phone}'
+                to=self.whatsapp_address(to_phone)
             )
+            record_send("whatsapp", started, 201)
             
             logger.info(f"WhatsApp message sent successfully to {to_phone}")
             return True
             
         except Exception as e:
+            # TwilioRestException carries the HTTP status of the API error
+            record_send("whatsapp", started, getattr(e, "status", None))
             logger.error(f"Error sending WhatsApp to {to_phone}: {str(e)}")
             return False
     
-    def create_job_match_email_template(self, user_name: str, matches: List[Dict]) -> str:
-        """Create HTML email template for job matches."""
+    async def send_whatsapp_async(self, to_phone: str, message: str) -> bool:
+        """Send WhatsApp message using Twilio from an asyncio worker."""
+        client = get_async_clients().twilio
+        if not client:
+            logger.error("Twilio client not initialized")
+            return False
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }}
-                .container {{ max-width: 600px; margin: 0 auto; background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                .header {{ text-align: center; margin-bottom: 30px; }}
-                .logo {{ color: #4A90E2; font-size: 24px; font-weight: bold; }}
-                .job-card {{ border: 1px solid #ddd; border-radius: 8px; padding: 20px; margin-bottom: 20px; }}
-                .job-title {{ font-size: 18px; font-weight: bold; color: #333; margin-bottom: 5px; }}
-                .company {{ color: #666; margin-bottom: 10px; }}
-                .match-score {{ background: linear-gradient(90deg, #4A90E2, #50C878); color: white; padding: 5px 15px; border-radius: 20px; display: inline-block; font-weight: bold; }}
-                .job-details {{ margin: 15px 0; }}
-                .skills {{ background-color: #f0f8ff; padding: 10px; border-radius: 5px; margin: 10px 0; }}
-                .btn {{ background-color: #4A90E2; color: white; padding: 12px 25px; text-decoration: none; border-radius: 5px; display: inline-block; margin-top: 15px; }}
-                .footer {{ text-align: center; margin-top: 30px; color: #666; font-size: 14px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <div class="logo">WorkWale.ai</div>
-                    <h2>🎯 New Job Matches Found!</h2>
-                    <p>Hi {user_name}, we found some exciting opportunities for you!</p>
-                </div>
-        """
+        started = time.perf_counter()
+        status_code, _ = await client.create_message(
+            self.twilio_whatsapp_number, self.whatsapp_address(to_phone), message
+        )
+        record_send("whatsapp", started, status_code)
+        if 200 <= status_code < 300:
+            logger.info(f"WhatsApp message sent successfully to {to_phone}")
+            return True
+        logger.error(f"Failed to send WhatsApp to {to_phone}. Status: {status_code}")
+        return False
+    
+    def get_email_template(self, template_name: str) -> Dict[str, str]:
+        """Skeleton of a shared email with -tag- placeholders for per-recipient values.
         
-        for match in matches:
-            job = match['job']
-            score = match['overall_score']
-            
-            score_class = ""
-            if score >= 80:
-                score_color = "#50C878"
-                score_text = "Excellent Match"
-            elif score >= 60:
-                score_color = "#4A90E2"
-                score_text = "Good Match"
+        Values are inserted verbatim, so tags in the html part must be given
+        HTML-escaped values; the text part has its own unescaped tags.
+        """
+        template = self._email_templates.get(template_name)
+        if template is None:
+            if template_name == "job_match":
+                template = {
+                    "html": self.create_job_match_email_layout("-name-", "-matches-"),
+                    "text": "Hi -text_name-, we found -count- new job matches for you! Visit WorkWale.ai to view them."
+                }
             else:
-                score_color = "#FFA500"
-                score_text = "Moderate Match"
-            
-            html_content += f"""
-                <div class="job-card">
-                    <div class="job-title">{job.title}</div>
-                    <div class="company">{job.company} • {job.location or 'Location not specified'}</div>
-                    <div class="match-score" style="background-color: {score_color};">
-                        {score}% {score_text}
-                    </div>
-                    <div class="job-details">
-                        <p><strong>Experience Level:</strong> {job.experience_level or 'Not specified'}</p>
-                        <p><strong>Work Type:</strong> {job.work_type or 'Not specified'}</p>
-                        <p><strong>Salary:</strong> {f'${job.salary_min:,} - ${job.salary_max:,}' if job.salary_min and job.salary_max else 'Not disclosed'}</p>
-                    </div>
-                    <div class="skills">
-                        <strong>Matching Skills:</strong> {', '.join(match.get('matching_skills', [])[:5])}
-                        {f"and {len(match.get('matching_skills', [])) - 5} more..." if len(match.get('matching_skills', [])) > 5 else ""}
-                    </div>
-                    <a href="{job.external_url or '#'}" class="btn">View Job Details</a>
-                </div>
-            """
+                raise ValueError(f"Unknown email template: {template_name}")
+            self._email_templates[template_name] = template
+        return template
+    
+    def render_email_template(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill a templated email payload locally, for sending it on its own."""
+        template = self.get_email_template(content["template"])
+        substitutions = content.get("substitutions") or {}
+        pattern = re.compile("|".join(re.escape(tag) for tag in substitutions)) if substitutions else None
+        
+        def fill(text: Optional[str]) -> Optional[str]:
+            if text is None or pattern is None:
+                return text
+            return pattern.sub(lambda m: substitutions[m.group(0)], text)
+        
+        return {
+            "to": content["to"],
+            "subject": fill(content["subject"]),
+            "html": fill(template["html"]),
+            "text": fill(template.get("text"))
+        }
+    
+    def send_channel(self, channel: str, content: Dict[str, Any]) -> bool:
+        """Send one rendered outbox payload over the given channel."""
+        if channel == "email":
+            if content.get("template"):
+                content = self.render_email_template(content)
+            return self.send_email(content["to"], content["subject"], content["html"], content.get("text"))
+        if channel == "whatsapp":
+            return self.send_whatsapp(content["to"], content["body"])
+        logger.error(f"Unknown notification channel: {channel}")
+        return False
+    
+    async def send_channel_async(self, channel: str, content: Dict[str, Any]) -> bool:
+        """Async counterpart of send_channel."""
+        if channel == "email":
+            if content.get("template"):
+                content = self.render_email_template(content)
+            return await self.send_email_async(content["to"], content["subject"], content["html"], content.get("text"))
+        if channel == "whatsapp":
+            return await self.send_whatsapp_async(content["to"], content["body"])
+        logger.error(f"Unknown notification channel: {channel}")
+        return False
+    
+    def _post_personalizations(self, template_name: str, contents: List[Dict[str, Any]]) -> int:
+        """Send one SendGrid request with a personalization per recipient; returns the HTTP status."""
+        template = self.get_email_template(template_name)
+        
+        body = {
+            "from": {"email": self.from_email},
+            "personalizations": [
+                {
+                    "to": [{"email": content["to"]}],
+                    "subject": content["subject"],
+                    "substitutions": content.get("substitutions") or {}
+                }
+                for content in contents
+            ],
+            # SendGrid requires text/plain to come before text/html
+            "content": [
+                {"type": "text/plain", "value": template["text"]},
+                {"type": "text/html", "value": template["html"]}
+            ]
+        }
         
-        html_content += """
-                <div class="footer">
-                    <p>🚀 Ready to apply? Visit your WorkWale.ai dashboard to manage your applications.</p>
-                    <p style="font-size: 12px; color: #999;">
-                        You're receiving this because you enabled job match notifications. 
-                        <a href="#" style="color: #4A90E2;">Update preferences</a>
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
+        started = time.perf_counter()
+        status_code, _ = self.sendgrid_client.send_mail(body)
+        record_send("email_bulk", started, status_code)
+        if not 200 <= status_code < 300:
+            logger.error(f"SendGrid bulk send of {len(contents)} emails failed. Status: {status_code}")
+        return status_code
+    
+    def _send_personalization_batch(self, template_name: str,
+                                    recipients: List[Tuple[Hashable, Dict[str, Any]]],
+                                    results: Dict[Hashable, bool]):
+        status = self._post_personalizations(template_name, [content for _, content in recipients])
+        
+        if 200 <= status < 300:
+            for key, _ in recipients:
+                results[key] = True
+        elif status == 400 and len(recipients) > 1:
+            # A single bad address rejects the whole request; split to isolate it
+            middle = len(recipients) // 2
+            self._send_personalization_batch(template_name, recipients[:middle], results)
+            self._send_personalization_batch(template_name, recipients[middle:], results)
+        else:
+            # 429/5xx/network errors are left to the outbox retry
+            for key, _ in recipients:
+                results[key] = False
+    
+    def send_bulk_email(self, template_name: str,
+                        recipients: List[Tuple[Hashable, Dict[str, Any]]]) -> Dict[Hashable, bool]:
+        """Send a templated email to many recipients in as few requests as possible.
+        
+        ``recipients`` pairs a caller-chosen key with a templated email payload
+        (``to``, ``subject``, ``substitutions``). Recipients are sent as
+        personalizations of up to 1000 per request; the result maps each key
+        to whether its email was accepted.
         """
+        results: Dict[Hashable, bool] = {}
+        if not recipients:
+            return results
         
-        return html_content
-    
-    def create_job_match_whatsapp_message(self, user_name: str, matches: List[Dict]) -> str:
-        """Create WhatsApp message for job matches."""
+        if not self.sendgrid_client:
+            logger.error("SendGrid client not initialized")
+            return {key: False for key, _ in recipients}
+        
+        batchable = []
+        for key, content in recipients:
+            size = sum(len(k.encode()) + len(v.encode()) for k, v in (content.get("substitutions") or {}).items())
+            if size > SENDGRID_MAX_SUBSTITUTION_BYTES:
+                # Too large for a personalization; render and send it on its own
+                results[key] = self.send_channel("email", content)
+            else:
+                batchable.append((key, content))
         
-        message = f"🎯 *WorkWale.ai Job Alert*\n\n"
-        message += f"Hi {user_name}! We found {len(matches)} new job matches for you:\n\n"
+        for start in range(0, len(batchable), self.bulk_batch_size):
+            self._send_personalization_batch(
+                template_name, batchable[start:start + self.bulk_batch_size], results
+            )
         
-        for i, match in enumerate(matches[:3], 1):  # Limit to 3 jobs for WhatsApp
-            job = match['job']
-            score = match['overall_score']
-            
-            score_emoji = "🟢" if score >= 80 else "🔵" if score >= 60 else "🟡"
-            
-            message += f"{score_emoji} *{job.title}*\n"
-            message += f"🏢 {job.company}\n"
-            message += f"📍 {job.location or 'Remote'}\n"
-            message += f"📊 {score}% Match\n"
-            
-            if match.get('matching_skills'):
-                skills = ', '.join(match['matching_skills'][:3])
-                message += f"💼 Skills: {skills}\n"
-            
-            message += f"🔗 {job.external_url or 'Link not available'}\n\n"
+        sent = sum(1 for ok in results.values() if ok)
+        BULK_RECIPIENTS.inc(sent, result="accepted")
+        BULK_RECIPIENTS.inc(len(results) - sent, result="failed")
+        logger.info(f"Bulk '{template_name}' email: {sent}/{len(recipients)} accepted")
+        return results
+    
+    def enqueue_notification(self, db: Session, user: User, notification_type: str,
+                             title: str, message: str, email: Dict[str, Any] = None,
+                             whatsapp: Dict[str, Any] = None, job_id: int = None,
+                             commit: bool = True) -> Notification:
+        """Write a notification to the outbox; the worker delivers it asynchronously."""
+        payload = {}
+        if email:
+            payload["email"] = email
+        if whatsapp:
+            payload["whatsapp"] = whatsapp
         
-        if len(matches) > 3:
-            message += f"... and {len(matches) - 3} more matches available on your dashboard!\n\n"
+        notification = Notification(
+            user_id=user.id,
+            type=notification_type,
+            title=title,
+            message=message,
+            job_id=job_id,
+            channels=list(payload),
+            payload=payload,
+            # In-app only notifications have nothing left to deliver
+            status="pending" if payload else "sent",
+            attempts=0,
+            next_attempt_at=datetime.utcnow()
+        )
         
-        message += "Visit WorkWale.ai to view all matches and apply! 🚀"
+        db.add(notification)
+        if commit:
+            db.commit()
         
-        return message
+        return notification
     
-    def send_job_match_notification(self, db: Session, user: User, matches: List[Dict]) -> Dict[str, bool]:
-        """Send job match notifications via email and/or WhatsApp."""
-        
-        results = {'email_sent': False, 'whatsapp_sent': False}
+    def create_job_match_email_template(self, user_name: str, matches: List[Dict]) -> str:
+        """Create HTML email template for job matches."""
+        return self.templates.render_email(user_name, matches)
+    
+    def create_job_match_email_layout(self, user_name: str, cards_html: str) -> str:
+        """Wrap rendered job cards in the job match email skeleton."""
+        return self.templates.render_email_layout(user_name, cards_html)
+    
+    def create_job_match_cards_html(self, matches: List[Dict]) -> str:
+        """Render the job cards section of the job match email."""
+        return self.templates.render_email_cards(matches)
+    
+    def create_job_match_whatsapp_message(self, user_name: str, matches: List[Dict]) -> str:
+        """Create WhatsApp message for job matches."""
+        return self.templates.render_whatsapp(user_name, matches)
+    
+    def send_job_match_notification(self, db: Session, user: User, matches: List[Dict],
+                                    user_profile: UserProfile = None,
+                                    commit: bool = True) -> Optional[Notification]:
+        """Queue job match notifications via email and/or WhatsApp."""
         
-        # Get user preferences
-        user_profile = user.profile
+        # Get user preferences (callers batching many users pass the profile in)
+        user_profile = user_profile or user.profile
         if not user_profile:
             logger.warning(f"No profile found for user {user.id}")
-            return results
+            return None
         
-        # Send email notification
-        if user_profile.email_notifications and user.email:
-            html_content = self.create_job_match_email_template(user.full_name, matches)
-            text_content = f"Hi {user.full_name}, we found {len(matches)} new job matches for you! Visit WorkWale.ai to view them."
-            
-            subject = f"🎯 {len(matches)} New Job Matches Found - WorkWale.ai"
-            
-            if self.send_email(user.email, subject, html_content, text_content):
-                results['email_sent'] = True
+        email = None
+        whatsapp = None
         
-        # Send WhatsApp notification
+        # Email notification
+        if user_profile.email_notifications and user.email:
+            # Rendered from the shared skeleton so the worker can batch recipients
+            email = {
+                "to": user.email,
+                "subject": f"🎯 {len(matches)} New Job Matches Found - WorkWale.ai",
+                "template": "job_match",
+                "substitutions": {
+                    "-name-": html.escape(user.full_name or ""),
+                    "-text_name-": user.full_name or "",
+                    "-count-": str(len(matches)),
+                    "-matches-": self.create_job_match_cards_html(matches)
+                }
+            }
+        
+        # WhatsApp notification
         if user_profile.whatsapp_notifications and user.phone:
-            whatsapp_message = self.create_job_match_whatsapp_message(user.full_name, matches)
-            
-            if self.send_whatsapp(user.phone, whatsapp_message):
-                results['whatsapp_sent'] = True
+            whatsapp = {
+                "to": user.phone,
+                "body": self.create_job_match_whatsapp_message(user.full_name, matches)
+            }
         
-        # Create notification record
-        notification = Notification(
-            user_id=user.id,
-            type="job_match",
+        return self.enqueue_notification(
+            db, user, "job_match",
             title=f"{len(matches)} New Job Matches",
             message=f"We found {len(matches)} job opportunities that match your profile!",
-            email_sent=results['email_sent'],
-            whatsapp_sent=results['whatsapp_sent']
+            email=email,
+            whatsapp=whatsapp,
+            commit=commit
         )
-        
-        db.add(notification)
-        db.commit()
-        
-        return results
     
     def send_application_update_notification(self, db: Session, user: User, 
                                           job_title: str, company: str, 
-                                          new_status: str) -> Dict[str, bool]:
-        """Send notification when application status changes."""
-        
-        results = {'email_sent': False, 'whatsapp_sent': False}
+                                          new_status: str) -> Optional[Notification]:
+        """Queue notification when application status changes."""
         
         # Get user preferences
         user_profile = user.profile
         if not user_profile:
-            return results
+            return None
+        
+        email = None
+        whatsapp = None
         
         # Create message content
         status_emojis = {
@@ -270,7 +425,7 @@ class NotificationService:
         
         emoji = status_emojis.get(new_status.lower(), '📋')
         
-        # Send email
+        # Email
         if user_profile.email_notifications and user.email:
             subject = f"{emoji} Application Update: {job_title} at {company}"
             
@@ -287,10 +442,9 @@ class NotificationService:
             </div>
             """
             
-            if self.send_email(user.email, subject, html_content):
-                results['email_sent'] = True
+            email = {"to": user.email, "subject": subject, "html": html_content}
         
-        # Send WhatsApp
+        # WhatsApp
         if user_profile.whatsapp_notifications and user.phone:
             whatsapp_message = f"{emoji} *Application Update*\n\n"
             whatsapp_message += f"Hi {user.full_name}!\n\n"
@@ -298,30 +452,22 @@ class NotificationService:
             whatsapp_message += f"📋 *Status:* {new_status.title()}\n\n"
             whatsapp_message += "Visit WorkWale.ai to view details! 🚀"
             
-            if self.send_whatsapp(user.phone, whatsapp_message):
-                results['whatsapp_sent'] = True
+            whatsapp = {"to": user.phone, "body": whatsapp_message}
         
-        # Create notification record
-        notification = Notification(
-            user_id=user.id,
-            type="application_update",
+        return self.enqueue_notification(
+            db, user, "application_update",
             title=f"Application Update: {job_title}",
             message=f"Status changed to: {new_status.title()}",
-            email_sent=results['email_sent'],
-            whatsapp_sent=results['whatsapp_sent']
+            email=email,
+            whatsapp=whatsapp
         )
-        
-        db.add(notification)
-        db.commit()
-        
-        return results
     
-    def send_welcome_notification(self, db: Session, user: User) -> Dict[str, bool]:
-        """Send welcome notification to new users."""
+    def send_welcome_notification(self, db: Session, user: User) -> Notification:
+        """Queue welcome notification to new users."""
         
-        results = {'email_sent': False, 'whatsapp_sent': False}
+        email = None
         
-        # Send welcome email
+        # Welcome email
         if user.email:
             subject = "🎉 Welcome to WorkWale.ai - Your AI Job Search Begins!"
             
@@ -362,20 +508,17 @@ class NotificationService:
             </div>
             """
             
-            if self.send_email(user.email, subject, html_content):
-                results['email_sent'] = True
+            email = {"to": user.email, "subject": subject, "html": html_content}
         
-        # Create notification record
-        notification = Notification(
-            user_id=user.id,
-            type="system",
+        return self.enqueue_notification(
+            db, user, "system",
             title="Welcome to WorkWale.ai!",
             message="Your AI-powered job search journey begins now!",
-            email_sent=results['email_sent'],
-            whatsapp_sent=results['whatsapp_sent']
+            email=email
         )
-        
-        db.add(notification)
-        db.commit()
-        
-        return results
\ No newline at end of file
+
+
+@lru_cache(maxsize=1)
+def get_notification_service() -> NotificationService:
+    """Return the process-wide notification service."""
+    return NotificationService()
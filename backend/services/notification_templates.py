@@ -0,0 +1,182 @@
+import os
+import html
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from dotenv import load_dotenv
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent / "templates" / "notifications"
+
+# Compiled template bytecode is shared between processes (API, workers)
+TEMPLATE_CACHE_DIR = os.getenv("NOTIFICATION_TEMPLATE_CACHE_DIR")
+FRAGMENT_CACHE_SIZE = int(os.getenv("NOTIFICATION_FRAGMENT_CACHE_SIZE", "50000"))
+
+# Placeholder used to cut a rendered skeleton into its static parts
+_SLOT = "\x00slot\x00"
+
+
+def score_bucket(score: float) -> str:
+    """Label bucket of a match score; card styling only depends on this."""
+    if score >= 80:
+        return "excellent"
+    elif score >= 60:
+        return "good"
+    return "moderate"
+
+
+SCORE_STYLES = {
+    "excellent": ("#50C878", "Excellent Match", "🟢"),
+    "good": ("#4A90E2", "Good Match", "🔵"),
+    "moderate": ("#FFA500", "Moderate Match", "🟡"),
+}
+
+
+class FragmentCache:
+    """Bounded cache of rendered fragments, evicting oldest entries first.
+
+    Reads are plain dict lookups; only inserts take the lock.
+    """
+
+    def __init__(self, maxsize: int = FRAGMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.data: Dict[Hashable, Any] = {}
+        self.lock = threading.Lock()
+
+    def get_or_render(self, key: Hashable, render: Callable[[], Any]) -> Any:
+        value = self.data.get(key)
+        if value is None:
+            value = render()
+            with self.lock:
+                while len(self.data) >= self.maxsize:
+                    self.data.pop(next(iter(self.data)))
+                self.data[key] = value
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+class NotificationTemplates:
+    """Precompiled notification templates with per-job fragment caching.
+
+    Templates are compiled once when the renderer is created, and the static
+    skeletons are pre-rendered into string parts. Job card fragments depend
+    only on the job and its score bucket, so they are cached under
+    ``(job id, updated_at, bucket)`` and shared by every user matched to the
+    job; the user name, score number and skills are dropped into the slots of
+    those parts. Bodies are assembled with a single ``join``.
+    """
+
+    def __init__(self, templates_dir: Path = TEMPLATES_DIR, cache_dir: Optional[str] = TEMPLATE_CACHE_DIR,
+                 fragment_cache_size: int = FRAGMENT_CACHE_SIZE):
+        bytecode_cache = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+        self.env = Environment(
+            loader=FileSystemLoader(str(templates_dir)),
+            autoescape=select_autoescape(["html"]),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False
+        )
+        self.fragments = FragmentCache(fragment_cache_size)
+
+        # Compile everything up front so no request pays for it
+        self.email_layout = self.env.get_template("job_match_email.html")
+        self.email_card = self.env.get_template("job_match_card.html").module
+        self.whatsapp = self.env.get_template("job_match_whatsapp.txt").module
+
+        # Static skeletons cut into parts around their per-user slots
+        slot = Markup(_SLOT)
+        self.email_layout_parts = self.email_layout.render(user_name=slot, cards=slot).split(_SLOT)
+        self.email_skills_parts = str(self.email_card.skills(slot, "")).split(_SLOT)
+        self.email_skills_more_parts = str(self.email_card.skills(slot, slot)).split(_SLOT)
+        self.whatsapp_skills_parts = str(self.whatsapp.skills(_SLOT)).split(_SLOT)
+
+    def render_email_layout(self, user_name: str, cards_html: str) -> str:
+        """Wrap already rendered cards in the job match email skeleton."""
+        head, middle, tail = self.email_layout_parts
+        return "".join((head, html.escape(user_name or ""), middle, cards_html, tail))
+
+    def _email_card_parts(self, job, bucket: str) -> tuple:
+        color, text, _ = SCORE_STYLES[bucket]
+        return (
+            str(self.email_card.open(job, color)),
+            str(self.email_card.details(job, text)),
+            str(self.email_card.tail(job))
+        )
+
+    def render_email_cards(self, matches: List[Dict]) -> str:
+        """Render the job cards section of the job match email."""
+        get = self.fragments.get_or_render
+        parts = []
+        for match in matches:
+            job = match['job']
+            score = match['overall_score']
+            bucket = score_bucket(score)
+            card_open, details, tail = get(
+                ("email", job.id, job.updated_at, bucket),
+                lambda: self._email_card_parts(job, bucket)
+            )
+
+            parts.extend((card_open, str(score), "%", details))
+
+            matching_skills = match.get('matching_skills') or []
+            shown = html.escape(", ".join(matching_skills[:5]))
+            if len(matching_skills) > 5:
+                before, between, after = self.email_skills_more_parts
+                parts.extend((before, shown, between, str(len(matching_skills) - 5), after))
+            else:
+                before, after = self.email_skills_parts
+                parts.extend((before, shown, after))
+
+            parts.append(tail)
+        return "".join(parts)
+
+    def render_email(self, user_name: str, matches: List[Dict]) -> str:
+        """Full job match email body."""
+        return self.render_email_layout(user_name, self.render_email_cards(matches))
+
+    def render_whatsapp(self, user_name: str, matches: List[Dict], limit: int = 3) -> str:
+        """Job match WhatsApp message listing the top ``limit`` matches."""
+        get = self.fragments.get_or_render
+        header_head, header_tail = get(
+            ("whatsapp_header", len(matches)),
+            lambda: tuple(str(self.whatsapp.header(_SLOT, len(matches))).split(_SLOT))
+        )
+        parts = [header_head, user_name or "", header_tail]
+
+        for match in matches[:limit]:
+            job = match['job']
+            score = match['overall_score']
+            bucket = score_bucket(score)
+            job_open, link = get(
+                ("whatsapp", job.id, job.updated_at, bucket),
+                lambda: (str(self.whatsapp.job_open(job, SCORE_STYLES[bucket][2])), str(self.whatsapp.link(job)))
+            )
+            parts.extend((job_open, str(score), get("whatsapp_job_close", self.whatsapp.job_close)))
+
+            if match.get('matching_skills'):
+                before, after = self.whatsapp_skills_parts
+                parts.extend((before, ", ".join(match['matching_skills'][:3]), after))
+            parts.append(link)
+
+        remaining = max(len(matches) - limit, 0)
+        parts.append(get(("whatsapp_footer", remaining), lambda: self.whatsapp.footer(remaining)))
+        return "".join(parts)
+
+
+@lru_cache(maxsize=1)
+def get_notification_templates() -> NotificationTemplates:
+    """Return the process-wide template renderer (compiled once on first use)."""
+    return NotificationTemplates()
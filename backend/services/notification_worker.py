@@ -0,0 +1,316 @@
+import os
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from dotenv import load_dotenv
+from sqlalchemy import or_, and_, func
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from database.models import Notification
+from services.notification_service import NotificationService, get_notification_service
+from services.metrics import counter, gauge, histogram, register_pool_metrics, serve_metrics
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+WORKER_CONCURRENCY = int(os.getenv("NOTIFICATION_WORKER_CONCURRENCY", "8"))
+WORKER_BATCH_SIZE = int(os.getenv("NOTIFICATION_WORKER_BATCH_SIZE", "100"))
+WORKER_POLL_INTERVAL = float(os.getenv("NOTIFICATION_WORKER_POLL_INTERVAL", "2"))
+MAX_ATTEMPTS = int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", "5"))
+RETRY_BASE_SECONDS = float(os.getenv("NOTIFICATION_RETRY_BASE_SECONDS", "30"))
+RETRY_MAX_SECONDS = float(os.getenv("NOTIFICATION_RETRY_MAX_SECONDS", "3600"))
+
+# A claimed batch not finished within this window is picked up again
+CLAIM_LEASE_SECONDS = int(os.getenv("NOTIFICATION_CLAIM_LEASE_SECONDS", "300"))
+
+# Port for a standalone worker's /metrics endpoint (disabled when unset); it
+# requires METRICS_TOKEN when set, so bind beyond localhost only with a token
+WORKER_METRICS_PORT = os.getenv("NOTIFICATION_WORKER_METRICS_PORT")
+WORKER_METRICS_HOST = os.getenv("NOTIFICATION_WORKER_METRICS_HOST", "127.0.0.1")
+# Seconds between refreshes of the outbox depth/age gauges
+OUTBOX_METRICS_INTERVAL = float(os.getenv("NOTIFICATION_OUTBOX_METRICS_INTERVAL", "30"))
+
+# Sends per second allowed for each provider
+CHANNEL_RATE_LIMITS = {
+    "email": float(os.getenv("NOTIFICATION_EMAIL_RATE", "10")),
+    "whatsapp": float(os.getenv("NOTIFICATION_WHATSAPP_RATE", "1")),
+}
+
+OUTBOX_PROCESSED = counter(
+    "notification_outbox_processed", "Claimed notifications by outcome (sent, retried, failed)", ["result"]
+)
+BATCH_DURATION = histogram(
+    "notification_worker_batch_duration_seconds", "Time to deliver one claimed outbox batch"
+)
+OUTBOX_DEPTH = gauge(
+    "notification_outbox_depth", "Notifications in the outbox by status", ["status"]
+)
+OUTBOX_OLDEST_AGE = gauge(
+    "notification_outbox_oldest_pending_age_seconds", "Age of the oldest undelivered notification"
+)
+
+
+def collect_outbox_metrics(db: Session):
+    """Refresh the outbox depth and oldest pending age gauges from the database."""
+    rows = db.query(Notification.status, func.count(Notification.id)).filter(
+        Notification.status.in_(("pending", "processing", "failed"))
+    ).group_by(Notification.status).all()
+    counts = dict(rows)
+    for status in ("pending", "processing", "failed"):
+        OUTBOX_DEPTH.set(counts.get(status, 0), status=status)
+
+    oldest = db.query(func.min(Notification.created_at)).filter(
+        Notification.status.in_(("pending", "processing"))
+    ).scalar()
+    age = (datetime.utcnow() - oldest).total_seconds() if oldest else 0
+    OUTBOX_OLDEST_AGE.set(max(age, 0))
+
+
+@lru_cache(maxsize=1)
+def register_outbox_metrics(session_factory: Callable[[], Session] = SessionLocal,
+                            interval: float = OUTBOX_METRICS_INTERVAL) -> threading.Thread:
+    """Refresh the outbox gauges every interval seconds on a daemon thread.
+
+    Scrapes only read the last values, so scraping never queries the database.
+    """
+
+    def refresh():
+        while True:
+            db = session_factory()
+            try:
+                collect_outbox_metrics(db)
+            except Exception as e:
+                logger.warning(f"Could not collect outbox metrics: {e}")
+            finally:
+                db.close()
+            time.sleep(interval)
+
+    thread = threading.Thread(target=refresh, name="outbox-metrics", daemon=True)
+    thread.start()
+    return thread
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace sends per channel."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter for the given attempt count."""
+    delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)))
+    return delay * random.uniform(0.8, 1.2)
+
+
+class NotificationWorker:
+    """Drains the notification outbox.
+
+    Pending rows are claimed in batches (``FOR UPDATE SKIP LOCKED`` on
+    Postgres, so several workers can run side by side), provider calls are
+    made concurrently on a thread pool under per-channel rate limits, and
+    per-channel ``email_sent``/``whatsapp_sent`` flags are written back in one
+    commit per batch. Failed channels are retried with exponential backoff;
+    channels that already succeeded are never re-sent. Templated emails in a
+    batch are grouped by template and sent as SendGrid personalizations, one
+    request per up to 1000 recipients.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 service: Optional[NotificationService] = None,
+                 concurrency: int = WORKER_CONCURRENCY, batch_size: int = WORKER_BATCH_SIZE,
+                 poll_interval: float = WORKER_POLL_INTERVAL, max_attempts: int = MAX_ATTEMPTS):
+        self.session_factory = session_factory
+        self.service = service or get_notification_service()
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+
+        self.buckets = {channel: TokenBucket(rate) for channel, rate in CHANNEL_RATE_LIMITS.items()}
+        self.executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="notify")
+        self._stop = threading.Event()
+
+    def claim_batch(self, db: Session) -> List[Notification]:
+        """Lock a batch of due notifications and lease them to this worker."""
+        now = datetime.utcnow()
+        due = or_(
+            and_(Notification.status == "pending",
+                 or_(Notification.next_attempt_at.is_(None), Notification.next_attempt_at <= now)),
+            # Leases left behind by a crashed worker
+            and_(Notification.status == "processing", Notification.next_attempt_at <= now)
+        )
+
+        batch = db.query(Notification).filter(due).order_by(Notification.id).limit(
+            self.batch_size
+        ).with_for_update(skip_locked=True).all()
+
+        lease_until = now + timedelta(seconds=CLAIM_LEASE_SECONDS)
+        for notification in batch:
+            notification.status = "processing"
+            notification.next_attempt_at = lease_until
+        db.commit()
+
+        return batch
+
+    def _deliver(self, channel: str, content: Dict[str, Any]) -> bool:
+        bucket = self.buckets.get(channel)
+        if bucket:
+            bucket.acquire()
+        try:
+            return self.service.send_channel(channel, content)
+        except Exception as e:
+            logger.error(f"Unexpected error delivering {channel} notification: {e}")
+            return False
+
+    def _deliver_bulk(self, template_name: str, recipients: List[tuple]) -> Dict[int, bool]:
+        # One provider request per chunk, so one token per chunk
+        self.buckets["email"].acquire()
+        try:
+            return self.service.send_bulk_email(template_name, recipients)
+        except Exception as e:
+            logger.error(f"Unexpected error delivering bulk '{template_name}' email: {e}")
+            return {}
+
+    def process_batch(self, db: Session, batch: List[Notification]) -> Dict[str, int]:
+        """Deliver all outstanding channels of a claimed batch."""
+        with BATCH_DURATION.time():
+            stats = self._process_batch(db, batch)
+        for result, count in stats.items():
+            OUTBOX_PROCESSED.inc(count, result=result)
+        return stats
+
+    def _process_batch(self, db: Session, batch: List[Notification]) -> Dict[str, int]:
+        stats = {'sent': 0, 'retried': 0, 'failed': 0}
+
+        # Fan out provider calls; the session stays on this thread
+        futures = []
+        templated: Dict[str, List[tuple]] = {}
+        by_id = {notification.id: notification for notification in batch}
+        for notification in batch:
+            payload = notification.payload or {}
+            for channel in notification.channels or []:
+                if getattr(notification, f"{channel}_sent", False):
+                    continue
+                content = payload.get(channel)
+                if not content:
+                    continue
+                if channel == "email" and content.get("template"):
+                    # Emails sharing a template go out as SendGrid personalizations
+                    templated.setdefault(content["template"], []).append((notification.id, content))
+                else:
+                    futures.append((notification, channel, self.executor.submit(self._deliver, channel, content)))
+
+        bulk_futures = []
+        chunk_size = self.service.bulk_batch_size
+        for template_name, recipients in templated.items():
+            for start in range(0, len(recipients), chunk_size):
+                chunk = recipients[start:start + chunk_size]
+                bulk_futures.append(self.executor.submit(self._deliver_bulk, template_name, chunk))
+
+        for notification, channel, future in futures:
+            if future.result():
+                setattr(notification, f"{channel}_sent", True)
+
+        for future in bulk_futures:
+            for notification_id, ok in future.result().items():
+                if ok:
+                    by_id[notification_id].email_sent = True
+
+        now = datetime.utcnow()
+        for notification in batch:
+            pending = [c for c in notification.channels or [] if not getattr(notification, f"{c}_sent", False)]
+            if not pending:
+                notification.status = "sent"
+                notification.delivered_at = now
+                notification.last_error = None
+                stats['sent'] += 1
+                continue
+
+            notification.attempts = (notification.attempts or 0) + 1
+            notification.last_error = f"Delivery failed for: {', '.join(pending)}"
+            if notification.attempts >= self.max_attempts:
+                notification.status = "failed"
+                stats['failed'] += 1
+            else:
+                notification.status = "pending"
+                notification.next_attempt_at = now + timedelta(seconds=retry_delay(notification.attempts))
+                stats['retried'] += 1
+
+        db.commit()
+        return stats
+
+    def run_once(self) -> int:
+        """Claim and process one batch; returns the number of notifications handled."""
+        db = self.session_factory()
+        try:
+            batch = self.claim_batch(db)
+            if not batch:
+                return 0
+            stats = self.process_batch(db, batch)
+            logger.info(f"Notification batch: {stats['sent']} sent, {stats['retried']} retrying, "
+                        f"{stats['failed']} failed")
+            return len(batch)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Notification worker batch failed: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def run_forever(self):
+        """Poll the outbox until stop() is called."""
+        logger.info(f"Notification worker started (concurrency={self.concurrency})")
+        while not self._stop.is_set():
+            handled = self.run_once()
+            # Keep draining while there is a backlog
+            if handled < self.batch_size:
+                self._stop.wait(self.poll_interval)
+
+    def start_in_background(self) -> threading.Thread:
+        """Run the worker loop on a daemon thread (for single-process deployments)."""
+        thread = threading.Thread(target=self.run_forever, name="notification-worker", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+        self.executor.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    if WORKER_METRICS_PORT:
+        register_pool_metrics()
+        register_outbox_metrics()
+        serve_metrics(int(WORKER_METRICS_PORT), WORKER_METRICS_HOST)
+    worker = NotificationWorker()
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        worker.stop()
@@ -0,0 +1,107 @@
+import json
+import base64
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+from sqlalchemy import DateTime, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+    has_more: bool
+    total: Optional[int] = None
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Opaque pagination cursor for a dict of keyset values."""
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Inverse of encode_cursor; raises ValueError on malformed cursors."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, dict) or not isinstance(values.get("id"), int):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def after_keyset(columns: Sequence[Any], values: Sequence[Any]):
+    """Rows strictly after ``values`` in descending ``columns`` order.
+
+    Expanded row comparison (a < x OR (a = x AND b < y)), which both Postgres
+    and SQLite plan as a range scan on an index over the columns.
+    """
+    clause = columns[-1] < values[-1]
+    for column, value in zip(reversed(columns[:-1]), reversed(values[:-1])):
+        clause = or_(column < value, and_(column == value, clause))
+    return clause
+
+
+def _dump(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _load(column: Any, value: Any) -> Any:
+    if value is not None and isinstance(column.type, DateTime):
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+    return value
+
+
+async def paginate(db: AsyncSession, query: Select, cursor: Optional[str] = None,
+                   limit: int = DEFAULT_PAGE_LIMIT, order_by: Optional[Sequence[Any]] = None,
+                   include_total: bool = False) -> Page:
+    """Return one page of ``query`` (a select of a single entity), newest first.
+
+    ``order_by`` defaults to the entity's (created_at, id); its last column
+    must be unique. Every page is a LIMIT on an index range after the cursor,
+    so deep pages cost the same as the first. The total needs a COUNT(*) over
+    the whole filter and is only computed when ``include_total`` is set.
+    """
+    if order_by is None:
+        entity = query.column_descriptions[0]["entity"]
+        order_by = (entity.created_at, entity.id)
+    order_by = list(order_by)
+    limit = max(1, min(limit, MAX_PAGE_LIMIT))
+
+    total = None
+    if include_total:
+        total = (await db.execute(select(func.count()).select_from(query.order_by(None).subquery()))).scalar()
+
+    statement = query
+    if cursor:
+        after = decode_cursor(cursor)
+        keys = after.get("k", [])
+        if not isinstance(keys, list) or len(keys) != len(order_by) - 1:
+            raise ValueError("Invalid cursor")
+        values = [_load(column, value) for column, value in zip(order_by, keys)] + [after["id"]]
+        statement = statement.where(after_keyset(order_by, values))
+
+    result = await db.execute(statement.order_by(*(column.desc() for column in order_by)).limit(limit + 1))
+    items = list(result.scalars().all())
+
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = None
+    if has_more:
+        last = items[-1]
+        next_cursor = encode_cursor({
+            "k": [_dump(getattr(last, column.key)) for column in order_by[:-1]],
+            "id": getattr(last, order_by[-1].key)
+        })
+    return Page(items, next_cursor, has_more, total)
@@ -0,0 +1,102 @@
+import os
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from services.metrics import gauge, histogram
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# bcrypt releases the GIL, so this many hashes run truly in parallel
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Hash requests allowed to wait for a worker before new ones are shed with 503
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# Hashes with a different cost are flagged by needs_update and rehashed on login
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+HASH_QUEUE_TIME = histogram(
+    "password_hash_queue_seconds", "Time password hash jobs wait for a worker", ["operation"]
+)
+HASH_DURATION = histogram(
+    "password_hash_duration_seconds", "Time spent hashing or verifying a password", ["operation"]
+)
+HASH_IN_FLIGHT = gauge(
+    "password_hash_in_flight", "Password hash jobs queued or running"
+)
+
+
+class PasswordHasher:
+    """Runs bcrypt off the event loop on a bounded thread pool.
+
+    At most ``max_workers`` hashes run at once; up to ``max_pending`` more may
+    wait, beyond which callers get a 503 instead of queueing without bound.
+    """
+
+    def __init__(self, context: CryptContext = pwd_context, max_workers: int = PASSWORD_HASH_WORKERS,
+                 max_pending: int = PASSWORD_HASH_MAX_PENDING):
+        self.context = context
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self.capacity = threading.BoundedSemaphore(max_workers + max_pending)
+
+    def _timed(self, operation: str, queued_at: float, func, *args):
+        started = time.perf_counter()
+        HASH_QUEUE_TIME.observe(started - queued_at, operation=operation)
+        try:
+            return func(*args)
+        finally:
+            HASH_DURATION.observe(time.perf_counter() - started, operation=operation)
+
+    async def _run(self, operation: str, func, *args):
+        if not self.capacity.acquire(blocking=False):
+            logger.warning(f"Password hashing saturated, shedding {operation}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+
+        HASH_IN_FLIGHT.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, self._timed, operation, time.perf_counter(), func, *args
+            )
+        finally:
+            HASH_IN_FLIGHT.dec()
+            self.capacity.release()
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured cost."""
+        return await self._run("hash", self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", self.context.verify, password, hashed_password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password; also returns a new hash if the stored one uses outdated parameters."""
+        return await self._run("verify", self.context.verify_and_update, password, hashed_password)
+
+
+_hasher: Optional[PasswordHasher] = None
+_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Return the process-wide hasher (created on first use)."""
+    global _hasher
+    if _hasher is None:
+        with _hasher_lock:
+            if _hasher is None:
+                _hasher = PasswordHasher()
+    return _hasher
@@ -0,0 +1,198 @@
+import os
+import math
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from dotenv import load_dotenv
+from fastapi import HTTPException, Request, status
+
+from services.metrics import counter
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration: "<requests>/<seconds>"
+LOGIN_LIMIT_PER_IP = os.getenv("RATE_LIMIT_LOGIN_PER_IP", "20/60")
+LOGIN_LIMIT_PER_EMAIL = os.getenv("RATE_LIMIT_LOGIN_PER_EMAIL", "5/60")
+REGISTER_LIMIT_PER_IP = os.getenv("RATE_LIMIT_REGISTER_PER_IP", "5/3600")
+REGISTER_LIMIT_PER_EMAIL = os.getenv("RATE_LIMIT_REGISTER_PER_EMAIL", "3/3600")
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+RATE_LIMIT_REDIS = os.getenv("RATE_LIMIT_REDIS", "false").lower() == "true"
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Only trust X-Forwarded-For behind a proxy that sets it (e.g. Render, nginx).
+# Without it every client behind the proxy shares its address, and the per-IP
+# limits become global caps
+TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "false").lower() == "true"
+
+RATE_LIMITED = counter("rate_limited_requests", "Requests rejected by the rate limiter", ["limiter"])
+
+# Check and count in one step, so rejected requests are not counted (as in
+# the in-process limiter). KEYS: current, previous window; ARGV: limit,
+# weight of the previous window, TTL of the current one
+_REDIS_HIT_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[2]) + current >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+def parse_limit(spec: str) -> Tuple[int, int]:
+    """Parse "<requests>/<seconds>"."""
+    limit, window = spec.split("/")
+    return int(limit), int(window)
+
+
+class SlidingWindowLimiter:
+    """Sliding window counter limiter keyed by arbitrary strings.
+
+    Each key keeps the counts of the current and previous fixed windows; the
+    previous one is weighted by how much of it still overlaps the sliding
+    window. That needs O(1) memory per key, and keys are kept in an LRU of at
+    most ``max_keys`` entries. With a Redis client the counters live in Redis
+    and are shared by all workers.
+    """
+
+    def __init__(self, name: str, limit: int, window: int, max_keys: int = RATE_LIMIT_MAX_KEYS,
+                 redis_client: Optional[Any] = None):
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self.redis = redis_client
+        self._redis_hit = redis_client.register_script(_REDIS_HIT_SCRIPT) if redis_client is not None else None
+
+        # key -> [window index, current count, previous count]
+        self.counters: "OrderedDict[str, list]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _previous_weight(self, now: float) -> float:
+        return 1 - (now % self.window) / self.window
+
+    def _estimate(self, current: int, previous: int, now: float) -> float:
+        return previous * self._previous_weight(now) + current
+
+    def _retry_after(self, now: float) -> int:
+        # The previous window's weight is fully gone at the next boundary
+        return max(1, math.ceil(self.window - now % self.window))
+
+    def _hit_local(self, key: str, now: float) -> Tuple[bool, int]:
+        index = int(now // self.window)
+        with self.lock:
+            state = self.counters.get(key)
+            if state is None:
+                state = [index, 0, 0]
+                self.counters[key] = state
+                while len(self.counters) > self.max_keys:
+                    self.counters.popitem(last=False)
+            else:
+                self.counters.move_to_end(key)
+                if state[0] != index:
+                    state[2] = state[1] if state[0] == index - 1 else 0
+                    state[0], state[1] = index, 0
+
+            if self._estimate(state[1], state[2], now) >= self.limit:
+                return False, self._retry_after(now)
+            state[1] += 1
+            return True, 0
+
+    def _hit_redis(self, key: str, now: float) -> Tuple[bool, int]:
+        index = int(now // self.window)
+        allowed = self._redis_hit(
+            keys=[f"ratelimit:{self.name}:{key}:{index}", f"ratelimit:{self.name}:{key}:{index - 1}"],
+            args=[self.limit, repr(self._previous_weight(now)), self.window * 2]
+        )
+        if not allowed:
+            return False, self._retry_after(now)
+        return True, 0
+
+    def hit(self, key: str) -> Tuple[bool, int]:
+        """Count a request for key; returns (allowed, retry-after seconds)."""
+        now = time.time()
+        if self.redis is not None:
+            try:
+                return self._hit_redis(key, now)
+            except Exception as e:
+                logger.warning(f"Redis rate limiter failed, using in-process counters: {e}")
+        return self._hit_local(key, now)
+
+    def reset(self, key: str):
+        """Forget a key's history (e.g. after a successful login)."""
+        with self.lock:
+            self.counters.pop(key, None)
+        if self.redis is not None:
+            index = int(time.time() // self.window)
+            try:
+                self.redis.delete(*(f"ratelimit:{self.name}:{key}:{i}" for i in (index, index - 1)))
+            except Exception as e:
+                logger.warning(f"Redis rate limiter reset failed: {e}")
+
+
+def client_ip(request: Request) -> str:
+    """Client address of a request, honoring X-Forwarded-For when trusted."""
+    if TRUST_PROXY_HEADERS:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _create_redis_client() -> Optional[Any]:
+    if not RATE_LIMIT_REDIS:
+        return None
+    try:
+        import redis
+        client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.2, socket_connect_timeout=0.2)
+        client.ping()
+        return client
+    except Exception as e:
+        logger.warning(f"Redis rate limiter unavailable, using in-process counters: {e}")
+        return None
+
+
+_limiters: Dict[str, SlidingWindowLimiter] = {}
+_limiters_lock = threading.Lock()
+_redis_client: Optional[Any] = None
+_redis_checked = False
+
+LIMITS = {
+    "login_ip": LOGIN_LIMIT_PER_IP,
+    "login_email": LOGIN_LIMIT_PER_EMAIL,
+    "register_ip": REGISTER_LIMIT_PER_IP,
+    "register_email": REGISTER_LIMIT_PER_EMAIL,
+}
+
+
+def get_limiter(name: str) -> SlidingWindowLimiter:
+    """Return the process-wide limiter configured for name."""
+    global _redis_client, _redis_checked
+    limiter = _limiters.get(name)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(name)
+            if limiter is None:
+                if not _redis_checked:
+                    _redis_client = _create_redis_client()
+                    _redis_checked = True
+                limit, window = parse_limit(LIMITS[name])
+                limiter = _limiters[name] = SlidingWindowLimiter(name, limit, window, redis_client=_redis_client)
+    return limiter
+
+
+def enforce_rate_limit(name: str, key: str):
+    """Raise 429 with Retry-After if key is over the named limit."""
+    allowed, retry_after = get_limiter(name).hit(key)
+    if not allowed:
+        RATE_LIMITED.inc(limiter=name)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, please try again later",
+            headers={"Retry-After": str(retry_after)},
+        )
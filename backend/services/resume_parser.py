@@ -8,6 +8,8 @@ from dotenv import load_dotenv
 import re
 from datetime import datetime
 
+from services.skill_extractor import extract_skills
+
 load_dotenv()
 
 class ResumeParser:
@@ -137,19 +139,8 @@ class ResumeParser:
         emails = re.findall(email_pattern, resume_text)
         phones = re.findall(phone_pattern, resume_text)
         
-        # Extract skills (common technical skills)
-        common_skills = [
-            'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'Angular', 'Vue.js',
-            'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Docker', 'Kubernetes',
-            'AWS', 'Azure', 'GCP', 'Git', 'Linux', 'HTML', 'CSS', 'TypeScript',
-            'FastAPI', 'Django', 'Flask', 'Spring', 'Express.js', 'TensorFlow',
-            'PyTorch', 'Machine Learning', 'Data Science', 'Pandas', 'NumPy'
-        ]
-        
-        found_skills = []
-        for skill in common_skills:
-            if skill.lower() in resume_text.lower():
-                found_skills.append(skill)
+        # Extract skills with the shared vocabulary matcher
+        found_skills = extract_skills(resume_text)
         
         return {
             "personal_info": {
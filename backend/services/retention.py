@@ -0,0 +1,156 @@
+import os
+import time
+import logging
+import argparse
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from dotenv import load_dotenv
+from sqlalchemy import delete, or_, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from database.models import Job, JobMatch, Notification
+from services.metrics import counter
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+# TTLs in days; 0 disables a policy
+RETENTION_MATCH_DAYS = int(os.getenv("RETENTION_MATCH_DAYS", "60"))
+RETENTION_NOTIFICATION_DAYS = int(os.getenv("RETENTION_NOTIFICATION_DAYS", "90"))
+RETENTION_CHUNK_SIZE = int(os.getenv("RETENTION_CHUNK_SIZE", "1000"))
+RETENTION_CHUNK_PAUSE_MS = int(os.getenv("RETENTION_CHUNK_PAUSE_MS", "50"))
+RETENTION_LOCK_TIMEOUT_MS = int(os.getenv("RETENTION_LOCK_TIMEOUT_MS", "2000"))
+RETENTION_INTERVAL = int(os.getenv("RETENTION_INTERVAL", "3600"))
+
+RETENTION_DELETED = counter("retention_deleted_rows", "Rows removed by retention policies", ["policy"])
+
+
+class RetentionPolicy(NamedTuple):
+    name: str
+    model: Any
+    # now -> WHERE clause selecting the expired rows
+    condition: Callable[[datetime], Any]
+
+
+def default_policies(match_days: int = RETENTION_MATCH_DAYS,
+                     notification_days: int = RETENTION_NOTIFICATION_DAYS) -> List[RetentionPolicy]:
+    policies = [
+        # Matches for postings that closed or were merged into another posting
+        RetentionPolicy("inactive_job_matches", JobMatch, lambda now: JobMatch.job_id.in_(
+            select(Job.id).where(or_(Job.is_active == False, Job.duplicate_of_id.isnot(None)))
+        )),
+    ]
+    if match_days:
+        policies.append(RetentionPolicy("stale_matches", JobMatch, lambda now: (
+            (JobMatch.is_viewed == False) & (JobMatch.created_at < now - timedelta(days=match_days))
+        )))
+    if notification_days:
+        # Undelivered outbox rows are never expired
+        policies.append(RetentionPolicy("old_notifications", Notification, lambda now: (
+            or_(Notification.status.in_(["sent", "failed"]), Notification.status.is_(None))
+            & (Notification.created_at < now - timedelta(days=notification_days))
+        )))
+    return policies
+
+
+class RetentionJob:
+    """Deletes expired job matches and notifications in small committed chunks.
+
+    Each chunk walks the primary key (``id > last id``, so a pass reads every
+    table once) and deletes at most ``chunk_size`` rows in its own short
+    transaction, pausing between chunks so API writes never queue behind a
+    long-held lock. On Postgres each chunk also sets a lock_timeout; a chunk
+    that cannot get its locks gives up and the policy resumes next pass.
+
+    Tables are not partitioned: Postgres requires the partition key in every
+    unique constraint, which would weaken uq_job_matches_user_job.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 policies: Optional[List[RetentionPolicy]] = None, chunk_size: int = RETENTION_CHUNK_SIZE,
+                 chunk_pause: float = RETENTION_CHUNK_PAUSE_MS / 1000.0,
+                 lock_timeout_ms: int = RETENTION_LOCK_TIMEOUT_MS):
+        self.session_factory = session_factory
+        self.policies = default_policies() if policies is None else policies
+        self.chunk_size = chunk_size
+        self.chunk_pause = chunk_pause
+        self.lock_timeout_ms = lock_timeout_ms
+
+    def purge(self, db: Session, policy: RetentionPolicy, now: datetime, dry_run: bool = False) -> int:
+        """Delete (or with dry_run, count) the rows expired under one policy."""
+        model = policy.model
+        condition = policy.condition(now)
+        postgres = db.get_bind().dialect.name == "postgresql"
+
+        deleted = 0
+        last_id = 0
+        while True:
+            if postgres and not dry_run:
+                db.execute(text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"))
+            ids = db.execute(
+                select(model.id).where(model.id > last_id, condition).order_by(model.id).limit(self.chunk_size)
+            ).scalars().all()
+            if not ids:
+                break
+            last_id = ids[-1]
+
+            if not dry_run:
+                db.execute(delete(model).where(model.id.in_(ids)), execution_options={"synchronize_session": False})
+                db.commit()
+                RETENTION_DELETED.inc(len(ids), policy=policy.name)
+            deleted += len(ids)
+
+            if len(ids) < self.chunk_size:
+                break
+            if self.chunk_pause:
+                time.sleep(self.chunk_pause)
+
+        db.rollback()
+        return deleted
+
+    def run_once(self, now: Optional[datetime] = None, dry_run: bool = False) -> Dict[str, int]:
+        """Apply every policy once; returns rows deleted (or expired, with dry_run) per policy."""
+        now = now or datetime.utcnow()
+        results = {}
+        for policy in self.policies:
+            db = self.session_factory()
+            try:
+                results[policy.name] = self.purge(db, policy, now, dry_run)
+            except OperationalError as e:
+                db.rollback()
+                logger.warning(f"Retention policy {policy.name} interrupted, resuming next pass: {e}")
+                results[policy.name] = 0
+            finally:
+                db.close()
+
+        if any(results.values()):
+            logger.info(f"Retention {'dry run' if dry_run else 'pass'}: {results}")
+        return results
+
+    def run_forever(self, interval: int = RETENTION_INTERVAL):
+        """Apply the policies every interval seconds."""
+        logger.info("Retention job started")
+        while True:
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Retention pass failed: {e}")
+            time.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Delete expired job matches and notifications")
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    parser.add_argument("--dry-run", action="store_true", help="Count expired rows without deleting them")
+    args = parser.parse_args()
+
+    job = RetentionJob()
+    if args.once or args.dry_run:
+        print(job.run_once(dry_run=args.dry_run))
+    else:
+        job.run_forever()
@@ -0,0 +1,160 @@
+import os
+import re
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Iterable
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Built-in vocabulary shipped with the service
+DEFAULT_VOCABULARY_PATH = Path(__file__).parent / "data" / "skills_vocabulary.json"
+
+# Optional extra vocabulary (same format), merged on top of the built-in one
+EXTRA_VOCABULARY_PATH = os.getenv("SKILLS_VOCABULARY_PATH")
+
+# A skill must not be glued to other word characters, so "Go" does not match
+# "good" and "Java" does not match "JavaScript". '+' and '#' count as part of a
+# token so "C" does not match inside "C++" or "C#".
+_LEFT_BOUNDARY = r'(?<![\w+#])'
+_RIGHT_BOUNDARY = r'(?![\w+#]|\.\w)'
+
+
+def _normalize_term(term: str) -> str:
+    """Lowercase a term and collapse internal whitespace."""
+    return re.sub(r'\s+', ' ', term.strip()).lower()
+
+
+def _escape(fragment: str) -> str:
+    """Escape a term for the regex, letting any whitespace run match a space."""
+    return r'\s+'.join(re.escape(part) for part in fragment.split(' '))
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """Build a prefix-trie regex so the engine never rescans shared prefixes.
+
+    A flat alternation of thousands of literals is tried one alternative at a
+    time at every text position; folding the terms into a trie keeps each
+    position down to a handful of character comparisons.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict) -> str:
+        terminal = '' in node
+        branches = []
+        for char in sorted(k for k in node if k):
+            branch = r'\s+' if char == ' ' else re.escape(char)
+            branches.append(branch + build(node[char]))
+
+        if not branches:
+            return ''
+
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Greedy optional group: longer terms win over their prefixes
+        return '(?:' + body + ')?' if terminal else body
+
+    return build(trie)
+
+
+class SkillExtractor:
+    """Single-pass, word-boundary-aware skill matcher over a synonym vocabulary.
+
+    All canonical skills and their synonyms are compiled into one regex, so
+    extracting skills from a description is one scan of the text no matter
+    how large the vocabulary is.
+    """
+
+    def __init__(self, vocabulary: Dict[str, List[str]], case_sensitive: Iterable[str] = ()):
+        self.case_sensitive = set(case_sensitive)
+
+        # Map every surface form to its canonical skill name
+        self.lookup: Dict[str, str] = {}
+        insensitive_terms = set()
+        sensitive_terms = set()
+
+        for canonical, synonyms in vocabulary.items():
+            for term in [canonical] + list(synonyms or []):
+                if not term or not term.strip():
+                    continue
+                key = _normalize_term(term)
+                self.lookup.setdefault(key, canonical)
+                if term in self.case_sensitive:
+                    sensitive_terms.add(re.sub(r'\s+', ' ', term.strip()))
+                else:
+                    insensitive_terms.add(key)
+
+        # The trie goes first so longer case-insensitive terms ("Spring Boot")
+        # win over short case-sensitive ones ("Spring")
+        alternatives = []
+        if insensitive_terms:
+            alternatives.append(_trie_pattern(insensitive_terms))
+        if sensitive_terms:
+            # Ambiguous short terms ("Go", "R", "Spark") only match as written
+            sensitive = sorted(sensitive_terms, key=len, reverse=True)
+            alternatives.append('(?-i:' + '|'.join(_escape(t) for t in sensitive) + ')')
+
+        self.pattern = re.compile(
+            _LEFT_BOUNDARY + '(?:' + '|'.join(alternatives or ['(?!)']) + ')' + _RIGHT_BOUNDARY,
+            re.IGNORECASE
+        )
+
+    @classmethod
+    def from_files(cls, *paths) -> "SkillExtractor":
+        """Build an extractor from one or more vocabulary JSON files."""
+        vocabulary: Dict[str, List[str]] = {}
+        case_sensitive: List[str] = []
+
+        for path in paths:
+            if not path:
+                continue
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not load skills vocabulary {path}: {e}")
+                continue
+
+            for canonical, synonyms in data.get("skills", {}).items():
+                vocabulary.setdefault(canonical, [])
+                vocabulary[canonical].extend(synonyms or [])
+            case_sensitive.extend(data.get("case_sensitive", []))
+
+        return cls(vocabulary, case_sensitive)
+
+    def extract(self, text: Optional[str]) -> List[str]:
+        """Return canonical skills found in text, in order of first appearance."""
+        if not text:
+            return []
+
+        found = []
+        seen = set()
+        for match in self.pattern.finditer(text):
+            canonical = self.lookup.get(_normalize_term(match.group(0)))
+            if canonical and canonical not in seen:
+                seen.add(canonical)
+                found.append(canonical)
+
+        return found
+
+    def __len__(self) -> int:
+        return len(self.lookup)
+
+
+@lru_cache(maxsize=1)
+def get_skill_extractor() -> SkillExtractor:
+    """Return the process-wide extractor (compiled once on first use)."""
+    return SkillExtractor.from_files(DEFAULT_VOCABULARY_PATH, EXTRA_VOCABULARY_PATH)
+
+
+def extract_skills(text: Optional[str]) -> List[str]:
+    """Extract canonical skills from free text using the shared extractor."""
+    return get_skill_extractor().extract(text)
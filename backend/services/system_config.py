@@ -0,0 +1,166 @@
+import os
+import json
+import time
+import logging
+import argparse
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from database.models import SystemConfig
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+# Seconds a worker serves cached values before checking the version row
+SYSTEM_CONFIG_TTL = float(os.getenv("SYSTEM_CONFIG_TTL", "15"))
+
+# Bumped by every write through set_value(); workers reload when it changes
+VERSION_KEY = "config_version"
+
+_MISSING = object()
+_INVALID = object()
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class SystemConfigCache:
+    """Typed, cached access to the ``system_config`` key/value table.
+
+    Reads are served from an in-process dict. Once ``ttl`` seconds have
+    passed, the next read looks up the version row (a single-row query) and
+    reloads the table only if another worker changed it, so a write reaches
+    every worker within ``ttl``. Unknown keys, unparsable values and database
+    errors fall back to the caller's default (or the last values loaded).
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal, ttl: float = SYSTEM_CONFIG_TTL):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self._values: Dict[str, str] = {}
+        self._parsed: Dict[Tuple[str, str], Any] = {}
+        self._version: Optional[str] = None
+        self._loaded = False
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        with self._lock:
+            if time.monotonic() - self._checked_at < self.ttl:
+                return
+            db = self.session_factory()
+            try:
+                version = db.execute(
+                    select(SystemConfig.value).where(SystemConfig.key == VERSION_KEY)
+                ).scalar()
+                if version != self._version or not self._loaded:
+                    rows = db.execute(select(SystemConfig.key, SystemConfig.value)).all()
+                    self._values = {key: value for key, value in rows if key != VERSION_KEY}
+                    self._parsed = {}
+                    self._version = version
+                    self._loaded = True
+            except Exception as e:
+                logger.warning(f"Could not refresh system config, keeping cached values: {e}")
+            finally:
+                db.close()
+            self._checked_at = time.monotonic()
+
+    def invalidate(self):
+        """Reload on the next read."""
+        self._loaded = False
+        self._checked_at = float("-inf")
+
+    def get(self, key: str, default: Any = None, parse: Callable[[str], Any] = str) -> Any:
+        """Value of ``key`` converted with ``parse``, or ``default``."""
+        if time.monotonic() - self._checked_at >= self.ttl:
+            self._refresh()
+
+        cache_key = (key, getattr(parse, "__name__", repr(parse)))
+        value = self._parsed.get(cache_key, _MISSING)
+        if value is _MISSING:
+            raw = self._values.get(key)
+            if raw is None:
+                return default
+            try:
+                value = parse(raw)
+            except (TypeError, ValueError) as e:
+                # Logged once per load, not on every read
+                logger.warning(f"Invalid system config value for {key!r}: {e}")
+                value = _INVALID
+            self._parsed[cache_key] = value
+        return default if value is _INVALID else value
+
+    def items(self) -> Dict[str, str]:
+        """Every raw value by key."""
+        if time.monotonic() - self._checked_at >= self.ttl:
+            self._refresh()
+        return dict(self._values)
+
+    def get_int(self, key: str, default: int) -> int:
+        return self.get(key, default, int)
+
+    def get_float(self, key: str, default: float) -> float:
+        return self.get(key, default, float)
+
+    def get_bool(self, key: str, default: bool) -> bool:
+        return self.get(key, default, _parse_bool)
+
+    def get_json(self, key: str, default: Any) -> Any:
+        return self.get(key, default, json.loads)
+
+    def set_value(self, db: Session, key: str, value: Any, description: Optional[str] = None):
+        """Store a value (JSON-encoded unless it is a string) and bump the version; commits."""
+        if key == VERSION_KEY:
+            raise ValueError(f"{VERSION_KEY} is maintained automatically")
+        text = value if isinstance(value, str) else json.dumps(value)
+
+        entry = db.query(SystemConfig).filter(SystemConfig.key == key).first()
+        if entry is None:
+            entry = SystemConfig(key=key)
+            db.add(entry)
+        entry.value = text
+        if description is not None:
+            entry.description = description
+
+        version = db.query(SystemConfig).filter(SystemConfig.key == VERSION_KEY).with_for_update().first()
+        if version is None:
+            db.add(SystemConfig(key=VERSION_KEY, value="1", description="Bumped on every config change"))
+        else:
+            version.value = str(int(version.value or 0) + 1)
+        db.commit()
+        self.invalidate()
+
+
+@lru_cache(maxsize=1)
+def get_system_config() -> SystemConfigCache:
+    """Return the process-wide system config cache."""
+    return SystemConfigCache()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Read or change system config values")
+    parser.add_argument("key", nargs="?", help="Key to show or set; all keys when omitted")
+    parser.add_argument("value", nargs="?", help="New value (JSON for structured values)")
+    parser.add_argument("--description")
+    args = parser.parse_args()
+
+    config = get_system_config()
+    if args.value is not None:
+        db = SessionLocal()
+        try:
+            config.set_value(db, args.key, args.value, args.description)
+        finally:
+            db.close()
+    config.invalidate()
+    for key, value in sorted(config.items().items()):
+        if args.key is None or key == args.key:
+            print(f"{key} = {value}")
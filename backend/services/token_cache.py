@@ -0,0 +1,197 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+# Upper bound on how long a worker trusts a cached token; deactivations made
+# by another worker are seen within this window when Redis is enabled
+TOKEN_CACHE_TTL = int(os.getenv("AUTH_TOKEN_CACHE_TTL", "60"))
+TOKEN_CACHE_REDIS = os.getenv("AUTH_TOKEN_CACHE_REDIS", "false").lower() == "true"
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+REDIS_TOKEN_PREFIX = "auth:token:"
+REDIS_GENERATION_PREFIX = "auth:gen:"
+
+
+def token_key(token: str) -> str:
+    """Cache key for a token; raw tokens are never stored."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class UserSnapshot:
+    """The fields of a User needed to authorize a request without loading it."""
+
+    __slots__ = ("id", "email", "is_active")
+
+    def __init__(self, id: int, email: str, is_active: bool):
+        self.id = id
+        self.email = email
+        self.is_active = is_active
+
+    @classmethod
+    def from_user(cls, user) -> "UserSnapshot":
+        return cls(user.id, user.email, bool(user.is_active))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "email": self.email, "is_active": self.is_active}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UserSnapshot":
+        return cls(data["id"], data["email"], data["is_active"])
+
+
+class TokenCache:
+    """Bounded TTL cache of decoded JWT claims and user snapshots.
+
+    Entries are keyed by the SHA-256 of the token and expire after ``ttl``
+    seconds or at the token's ``exp``, whichever comes first. Each user has a
+    generation counter; bumping it (``invalidate_user``) makes every cached
+    token of that user miss. With Redis enabled, entries and generations are
+    also shared between workers.
+    """
+
+    def __init__(self, maxsize: int = TOKEN_CACHE_SIZE, ttl: int = TOKEN_CACHE_TTL,
+                 redis_client: Optional[Any] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.redis = redis_client
+
+        # key -> (expires_at, claims, snapshot, generation)
+        self.entries: "OrderedDict[str, Tuple[float, Dict[str, Any], UserSnapshot, int]]" = OrderedDict()
+        self.generations: Dict[int, int] = {}
+        self.lock = threading.Lock()
+
+    def _generation(self, user_id: int) -> int:
+        return self.generations.get(user_id, 0)
+
+    def _redis_generation(self, user_id: int) -> int:
+        value = self.redis.get(f"{REDIS_GENERATION_PREFIX}{user_id}")
+        return int(value) if value else 0
+
+    def get(self, token: str) -> Optional[Tuple[Dict[str, Any], UserSnapshot]]:
+        """Return (claims, snapshot) for a cached, unexpired token."""
+        key = token_key(token)
+        now = time.time()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, claims, snapshot, generation = entry
+                if expires_at > now and generation == self._generation(snapshot.id):
+                    self.entries.move_to_end(key)
+                    return claims, snapshot
+                del self.entries[key]
+
+        if self.redis is None:
+            return None
+
+        try:
+            raw = self.redis.get(REDIS_TOKEN_PREFIX + key)
+            if raw is None:
+                return None
+            data = json.loads(raw)
+            snapshot = UserSnapshot.from_dict(data["user"])
+            if data["generation"] != self._redis_generation(snapshot.id):
+                return None
+        except Exception as e:
+            logger.warning(f"Token cache Redis lookup failed: {e}")
+            return None
+
+        claims = data["claims"]
+        self._store_local(key, claims, snapshot, now)
+        return claims, snapshot
+
+    def _expiry(self, claims: Dict[str, Any], now: float) -> float:
+        expires_at = now + self.ttl
+        if claims.get("exp"):
+            expires_at = min(expires_at, float(claims["exp"]))
+        return expires_at
+
+    def _store_local(self, key: str, claims: Dict[str, Any], snapshot: UserSnapshot, now: float):
+        with self.lock:
+            self.entries[key] = (self._expiry(claims, now), claims, snapshot, self._generation(snapshot.id))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def put(self, token: str, claims: Dict[str, Any], snapshot: UserSnapshot):
+        """Cache the decoded claims and user snapshot of a validated token."""
+        key = token_key(token)
+        now = time.time()
+        self._store_local(key, claims, snapshot, now)
+
+        if self.redis is not None and claims.get("exp"):
+            seconds = int(float(claims["exp"]) - now)
+            if seconds <= 0:
+                return
+            try:
+                data = {
+                    "claims": claims,
+                    "user": snapshot.to_dict(),
+                    "generation": self._redis_generation(snapshot.id)
+                }
+                self.redis.set(REDIS_TOKEN_PREFIX + key, json.dumps(data), ex=seconds)
+            except Exception as e:
+                logger.warning(f"Token cache Redis write failed: {e}")
+
+    def invalidate_token(self, token: str):
+        key = token_key(token)
+        with self.lock:
+            self.entries.pop(key, None)
+        if self.redis is not None:
+            try:
+                self.redis.delete(REDIS_TOKEN_PREFIX + key)
+            except Exception as e:
+                logger.warning(f"Token cache Redis delete failed: {e}")
+
+    def invalidate_user(self, user_id: int):
+        """Drop every cached token of a user (deactivation, email change)."""
+        with self.lock:
+            self.generations[user_id] = self._generation(user_id) + 1
+        if self.redis is not None:
+            try:
+                self.redis.incr(f"{REDIS_GENERATION_PREFIX}{user_id}")
+            except Exception as e:
+                logger.warning(f"Token cache Redis invalidation failed: {e}")
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+def _create_redis_client() -> Optional[Any]:
+    if not TOKEN_CACHE_REDIS:
+        return None
+    try:
+        import redis
+        client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.2, socket_connect_timeout=0.2)
+        client.ping()
+        return client
+    except Exception as e:
+        logger.warning(f"Redis token cache tier unavailable, using in-process cache only: {e}")
+        return None
+
+
+_token_cache: Optional[TokenCache] = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache:
+    """Return the process-wide token cache (created on first use)."""
+    global _token_cache
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                _token_cache = TokenCache(redis_client=_create_redis_client())
+    return _token_cache
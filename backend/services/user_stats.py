@@ -0,0 +1,168 @@
+import os
+import logging
+import argparse
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+from dotenv import load_dotenv
+from sqlalchemy import case, delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from database.models import JobApplication, JobMatch, Notification, User, UserProfile, UserStats
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+USER_STATS_REBUILD_BATCH_SIZE = int(os.getenv("USER_STATS_REBUILD_BATCH_SIZE", "500"))
+
+# Counting rules; the triggers in migrations/versions/0005_user_stats.py apply the same ones
+PENDING_APPLICATION_STATUSES = ("applied", "reviewed")
+PROFILE_FIELDS = ["desired_job_title", "desired_location", "desired_salary_min", "experience_level",
+                  "work_type", "skills"]
+
+
+def profile_completion(profile: Optional[UserProfile]) -> float:
+    """Percentage of PROFILE_FIELDS the user has filled in."""
+    if profile is None:
+        return 0.0
+    filled = sum(1 for field in PROFILE_FIELDS if getattr(profile, field) not in (None, "", []))
+    return 100.0 * filled / len(PROFILE_FIELDS)
+
+
+def dashboard_stats(stats: Optional[UserStats], today: Optional[date] = None) -> Dict[str, Any]:
+    """DashboardStats fields from a user's stats row (None for a user with no activity yet)."""
+    today = today or datetime.utcnow().date()
+    if stats is None:
+        stats = UserStats(total_applications=0, pending_applications=0, interviews_scheduled=0,
+                          offers_received=0, total_matches=0, new_matches_today=0,
+                          unread_notifications=0, profile_completion=0.0)
+
+    activity = [
+        {"type": activity_type, "at": at}
+        for activity_type, at in (
+            ("application", stats.last_application_at),
+            ("match", stats.last_match_at),
+            ("notification", stats.last_notification_at),
+        )
+        if at is not None
+    ]
+    activity.sort(key=lambda item: item["at"], reverse=True)
+
+    return {
+        "total_applications": stats.total_applications,
+        "pending_applications": stats.pending_applications,
+        "interviews_scheduled": stats.interviews_scheduled,
+        "offers_received": stats.offers_received,
+        "total_matches": stats.total_matches,
+        # The counter belongs to new_matches_date and goes stale at midnight
+        "new_matches_today": stats.new_matches_today if stats.new_matches_date == today else 0,
+        "unread_notifications": stats.unread_notifications,
+        "profile_completion": round(stats.profile_completion, 1),
+        "recent_activity": activity,
+    }
+
+
+def compute_user_stats(db: Session, user_ids: List[int], now: datetime) -> List[Dict[str, Any]]:
+    """Stats rows for user_ids, aggregated from the source tables."""
+    today_start = datetime(now.year, now.month, now.day)
+    empty = {
+        "total_applications": 0, "pending_applications": 0, "interviews_scheduled": 0, "offers_received": 0,
+        "last_application_at": None, "total_matches": 0, "new_matches_today": 0,
+        "new_matches_date": today_start.date(), "last_match_at": None, "unread_notifications": 0,
+        "last_notification_at": None, "profile_completion": 0.0,
+    }
+    rows = {user_id: dict(empty, user_id=user_id) for user_id in user_ids}
+
+    applications = db.execute(
+        select(
+            JobApplication.user_id,
+            func.count(),
+            func.sum(case((JobApplication.status.in_(PENDING_APPLICATION_STATUSES), 1), else_=0)),
+            func.sum(case((JobApplication.status == "interview", 1), else_=0)),
+            func.sum(case((JobApplication.status == "offered", 1), else_=0)),
+            func.max(JobApplication.created_at),
+        ).where(JobApplication.user_id.in_(user_ids)).group_by(JobApplication.user_id)
+    )
+    for user_id, total, pending, interviews, offers, latest in applications:
+        rows[user_id].update(total_applications=total, pending_applications=pending,
+                             interviews_scheduled=interviews, offers_received=offers, last_application_at=latest)
+
+    open_match = or_(JobMatch.is_dismissed == False, JobMatch.is_dismissed.is_(None))
+    matches = db.execute(
+        select(
+            JobMatch.user_id,
+            func.sum(case((open_match, 1), else_=0)),
+            func.sum(case((JobMatch.created_at >= today_start, 1), else_=0)),
+            func.max(JobMatch.created_at),
+        ).where(JobMatch.user_id.in_(user_ids)).group_by(JobMatch.user_id)
+    )
+    for user_id, total, today, latest in matches:
+        rows[user_id].update(total_matches=total, new_matches_today=today, last_match_at=latest)
+
+    unread = or_(Notification.is_read == False, Notification.is_read.is_(None))
+    notifications = db.execute(
+        select(
+            Notification.user_id,
+            func.sum(case((unread, 1), else_=0)),
+            func.max(Notification.created_at),
+        ).where(Notification.user_id.in_(user_ids)).group_by(Notification.user_id)
+    )
+    for user_id, unread_count, latest in notifications:
+        rows[user_id].update(unread_notifications=unread_count, last_notification_at=latest)
+
+    for profile in db.query(UserProfile).filter(UserProfile.user_id.in_(user_ids)):
+        rows[profile.user_id]["profile_completion"] = profile_completion(profile)
+
+    return list(rows.values())
+
+
+def rebuild_user_stats(session_factory: Callable[[], Session] = SessionLocal,
+                       user_ids: Optional[List[int]] = None,
+                       batch_size: int = USER_STATS_REBUILD_BATCH_SIZE) -> int:
+    """Recompute stats rows for user_ids (default: every user); returns users rebuilt.
+
+    Each batch of users is replaced in its own transaction. Writes racing a
+    batch can be counted before the rebuild read them, so run it when the
+    triggers were missing or after restoring data, not routinely.
+    """
+    db = session_factory()
+    rebuilt = 0
+    last_id = 0
+    try:
+        while True:
+            if user_ids is None:
+                batch = db.execute(
+                    select(User.id).where(User.id > last_id).order_by(User.id).limit(batch_size)
+                ).scalars().all()
+            else:
+                batch = user_ids[rebuilt:rebuilt + batch_size]
+            if not batch:
+                break
+            last_id = batch[-1]
+
+            rows = compute_user_stats(db, batch, datetime.utcnow())
+            db.execute(delete(UserStats).where(UserStats.user_id.in_(batch)))
+            db.execute(insert(UserStats), rows)
+            db.commit()
+            rebuilt += len(batch)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"User stats rebuild failed after {rebuilt} users: {e}")
+        raise
+    finally:
+        db.close()
+
+    logger.info(f"Rebuilt stats for {rebuilt} users")
+    return rebuilt
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Rebuild the per-user dashboard stats table")
+    parser.add_argument("--user-id", type=int, action="append", help="Only rebuild this user (repeatable)")
+    parser.add_argument("--batch-size", type=int, default=USER_STATS_REBUILD_BATCH_SIZE)
+    args = parser.parse_args()
+
+    print(rebuild_user_stats(user_ids=args.user_id, batch_size=args.batch_size))
@@ -0,0 +1,81 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database.database import Base
+import database.models  # noqa: F401  (registers the tables)
+
+
+@pytest.fixture
+def session_factory():
+    """Sessions on a fresh in-memory SQLite database with every table."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+class StubServer:
+    """Local HTTP server answering every request with ``handler``.
+
+    ``handler(method, path, headers, body)`` returns (status, headers, body);
+    dict bodies are sent as JSON. Requests are recorded in ``requests``.
+    """
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+        self.handler: Callable[..., Tuple[int, Dict[str, str], Any]] = lambda *args: (404, {}, "")
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                stub.requests.append({"method": self.command, "path": self.path,
+                                      "headers": dict(self.headers), "body": body})
+                status, headers, payload = stub.handler(self.command, self.path, self.headers, body)
+                if isinstance(payload, (dict, list)):
+                    payload = json.dumps(payload)
+                    headers = dict({"Content-Type": "application/json"}, **headers)
+                data = payload.encode() if isinstance(payload, str) else (payload or b"")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    yield server
+    server.close()
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from database.models import Notification
+from services.notification_clients import SendGridClient
+from services.notification_service import NotificationService
+from services.notification_worker import NotificationWorker
+
+
+def email(index):
+    return {
+        "to": f"user{index}@example.com",
+        "subject": f"{index % 5 + 1} New Job Matches Found - WorkWale.ai",
+        "template": "job_match",
+        "substitutions": {
+            "-name-": f"User &amp; {index}",
+            "-text_name-": f"User & {index}",
+            "-count-": str(index % 5 + 1),
+            "-matches-": f"<div>match for {index}</div>",
+        },
+    }
+
+
+def sendgrid_handler(rejected=(), fail_requests=()):
+    """Mock /v3/mail/send: 400 when a rejected address is in the request, 503 for the nth requests."""
+    calls = []
+
+    def handler(method, path, headers, body):
+        calls.append(body)
+        if path != "/v3/mail/send" or headers.get("Authorization") != "Bearer test-key":
+            return 401, {}, {"errors": [{"message": "unauthorized"}]}
+        if len(calls) in fail_requests:
+            return 503, {}, {"errors": [{"message": "unavailable"}]}
+        addresses = {p["to"][0]["email"] for p in json.loads(body)["personalizations"]}
+        if addresses & set(rejected):
+            return 400, {}, {"errors": [{"message": "invalid email", "field": "personalizations"}]}
+        return 202, {}, ""
+
+    return handler
+
+
+@pytest.fixture
+def service(stub_server):
+    service = NotificationService()
+    service.sendgrid_client = SendGridClient("test-key", host=stub_server.url)
+    yield service
+    service.sendgrid_client.close()
+
+
+def sent_personalizations(stub_server):
+    return [json.loads(request["body"])["personalizations"] for request in stub_server.requests]
+
+
+def test_recipients_are_split_into_batches_of_1000(stub_server, service):
+    stub_server.handler = sendgrid_handler()
+    recipients = [(index, email(index)) for index in range(2500)]
+
+    results = service.send_bulk_email("job_match", recipients)
+
+    assert results == {index: True for index in range(2500)}
+    batches = sent_personalizations(stub_server)
+    assert [len(batch) for batch in batches] == [1000, 1000, 500]
+
+    personalizations = [p for batch in batches for p in batch]
+    for index, personalization in enumerate(personalizations):
+        expected = email(index)
+        assert personalization["to"] == [{"email": expected["to"]}]
+        assert personalization["subject"] == expected["subject"]
+        assert personalization["substitutions"] == expected["substitutions"]
+
+    body = json.loads(stub_server.requests[0]["body"])
+    assert [part["type"] for part in body["content"]] == ["text/plain", "text/html"]
+    assert "-text_name-" in body["content"][0]["value"] and "-name-" in body["content"][1]["value"]
+
+
+def test_rejected_address_is_isolated(stub_server, service):
+    stub_server.handler = sendgrid_handler(rejected={"user5@example.com"})
+    recipients = [(index, email(index)) for index in range(8)]
+
+    results = service.send_bulk_email("job_match", recipients)
+
+    assert results == {index: index != 5 for index in range(8)}
+    # 8 rejected, then halves: 4 ok + 4 rejected, 2 ok + 2 rejected, 1 ok + 1 rejected
+    assert len(stub_server.requests) == 7
+
+
+def test_failed_batch_is_left_for_retry(stub_server, service):
+    stub_server.handler = sendgrid_handler(fail_requests={2})
+    service.bulk_batch_size = 3
+    recipients = [(index, email(index)) for index in range(7)]
+
+    results = service.send_bulk_email("job_match", recipients)
+
+    assert results == {index: index not in (3, 4, 5) for index in range(7)}
+    assert [len(batch) for batch in sent_personalizations(stub_server)] == [3, 3, 1]
+
+
+def test_worker_records_per_user_results(stub_server, service, db):
+    stub_server.handler = sendgrid_handler(rejected={"user2@example.com"})
+    for index in range(4):
+        db.add(Notification(user_id=index + 1, type="job_match", title="Matches", message="",
+                            channels=["email"], payload={"email": email(index)}, status="pending"))
+    db.commit()
+
+    worker = NotificationWorker(session_factory=lambda: db, service=service)
+    try:
+        stats = worker.process_batch(db, worker.claim_batch(db))
+    finally:
+        worker.stop()
+
+    assert stats == {'sent': 3, 'retried': 1, 'failed': 0}
+    rows = {row.payload["email"]["to"]: row for row in db.query(Notification)}
+    rejected = rows.pop("user2@example.com")
+    assert rejected.status == "pending" and not rejected.email_sent and rejected.attempts == 1
+    assert all(row.status == "sent" and row.email_sent for row in rows.values())
@@ -0,0 +1,106 @@
+import pytest
+
+from scrapers.http_fetcher import HttpFetcher
+from scrapers.linkedin_source import LinkedInSource
+
+LISTING_PAGE = '<div class="base-card" data-entity-urn="urn:li:jobPosting:1"><script>track()</script></div>'
+DETAIL_PAGE = '<div class="show-more-less-html__markup">Build APIs</div><script>track()</script>'
+AUTHWALL_PAGE = '<html><body><a href="/authwall?trk=guest">Sign in</a></body></html>'
+JS_SHELL = '<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+
+
+@pytest.fixture
+def fetcher():
+    with HttpFetcher(cache_size=2) as fetcher:
+        yield fetcher
+
+
+def validating_handler(etag=None, last_modified=None, body="<p>v1</p>"):
+    """Serve body with validators and answer 304 when the client revalidates."""
+    def handler(method, path, headers, _):
+        if (etag and headers.get("If-None-Match") == etag) or \
+                (last_modified and headers.get("If-Modified-Since") == last_modified):
+            return 304, {}, ""
+        validators = {"ETag": etag} if etag else {"Last-Modified": last_modified}
+        return 200, validators, f"{body} {path}"
+    return handler
+
+
+@pytest.mark.parametrize("validators", [
+    {"etag": '"abc"'},
+    {"last_modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+])
+def test_revalidation_returns_the_cached_body(stub_server, fetcher, validators):
+    stub_server.handler = validating_handler(**validators)
+    url = f"{stub_server.url}/jobs/1"
+
+    first = fetcher.fetch(url)
+    second = fetcher.fetch(url)
+
+    assert first.status_code == 200 and not first.from_cache
+    assert second.status_code == 304 and second.from_cache and second.ok
+    assert second.text == first.text == "<p>v1</p> /jobs/1"
+    sent = stub_server.requests[1]["headers"]
+    assert sent.get("If-None-Match") == validators.get("etag")
+    assert sent.get("If-Modified-Since") == validators.get("last_modified")
+
+
+def test_cache_evicts_the_least_recently_used_page(stub_server, fetcher):
+    stub_server.handler = validating_handler(etag='"v1"')
+    a, b, c = (f"{stub_server.url}/jobs/{name}" for name in "abc")
+
+    fetcher.fetch(a)
+    fetcher.fetch(b)
+    assert fetcher.fetch(a).from_cache  # a is now the most recently used
+    fetcher.fetch(c)  # evicts b
+
+    assert fetcher.fetch(a).from_cache
+    refetched = fetcher.fetch(b)
+    assert refetched.status_code == 200 and not refetched.from_cache
+    assert "If-None-Match" not in stub_server.requests[-1]["headers"]
+
+
+@pytest.fixture
+def source(stub_server, fetcher, monkeypatch):
+    source = LinkedInSource(base_url=stub_server.url, mode="auto", fetcher=fetcher)
+    source.browser_urls = []
+
+    def browser_get(url):
+        source.browser_urls.append(url)
+        return "<browser/>"
+
+    monkeypatch.setattr(source, "_browser_get", browser_get)
+    yield source
+    source.close()
+
+
+@pytest.mark.parametrize("status", [401, 403, 999])
+def test_refused_requests_fall_back_to_the_browser(stub_server, source, status):
+    stub_server.handler = lambda *args: (status, {}, "denied")
+
+    assert source.fetch_listing_page("python") == "<browser/>"
+    assert source.fetch_detail_page({"external_id": "1"}) == "<browser/>"
+    assert len(source.browser_urls) == 2
+
+
+@pytest.mark.parametrize("page", [AUTHWALL_PAGE, JS_SHELL])
+def test_authwall_or_js_only_pages_fall_back_to_the_browser(stub_server, source, page):
+    stub_server.handler = lambda *args: (200, {}, page)
+
+    assert source.fetch_listing_page("python") == "<browser/>"
+    assert source.browser_urls == [source.listing_url("python")]
+
+
+def test_server_rendered_pages_do_not_start_the_browser(stub_server, source):
+    stub_server.handler = lambda method, path, *_: (200, {}, LISTING_PAGE if "search" in path else DETAIL_PAGE)
+
+    assert source.fetch_listing_page("python") == LISTING_PAGE
+    assert source.fetch_detail_page({"external_id": "1"}) == DETAIL_PAGE
+    assert source.browser_urls == []
+
+
+def test_other_errors_do_not_start_the_browser(stub_server, source):
+    stub_server.handler = lambda *args: (500, {}, "oops")
+
+    assert source.fetch_listing_page("python") is None
+    assert source.browser_urls == []
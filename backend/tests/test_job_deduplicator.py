@@ -0,0 +1,69 @@
+from database.models import Job
+from services.job_deduplicator import JobDeduplicator, MinHasher
+
+DESCRIPTION = (
+    "We are hiring an engineer to design, build and operate the services behind our payments "
+    "platform. You will own APIs written in Python and Go, work with PostgreSQL and Redis, run "
+    "services on Kubernetes, review code, mentor teammates and take part in the on-call rotation. "
+    "Experience with distributed systems, observability and cloud infrastructure is a plus."
+)
+
+
+def make_job(db, title="Backend Engineer", company="Acme Pvt Ltd", location="Bangalore, Karnataka, India",
+             description=DESCRIPTION, source="linkedin"):
+    job = Job(title=title, company=company, location=location, description=description, source=source,
+              is_active=True)
+    db.add(job)
+    db.flush()
+    return job
+
+
+def test_same_posting_on_another_board_is_a_duplicate(db):
+    deduplicator = JobDeduplicator()
+    original = make_job(db)
+    repost = make_job(db, title="Backend engineer", company="ACME", location="Bangalore", source="naukri")
+
+    stats = deduplicator.deduplicate(db, [original, repost])
+
+    assert stats == {'checked': 2, 'duplicates': 1, 'canonical': 1}
+    assert original.is_active and original.duplicate_of_id is None
+    assert not repost.is_active and repost.duplicate_of_id == original.id
+
+
+def test_other_city_or_seniority_stays_active(db):
+    deduplicator = JobDeduplicator()
+    bangalore = make_job(db)
+    pune = make_job(db, location="Pune, Maharashtra, India")
+    senior = make_job(db, title="Senior Backend Engineer")
+
+    # The shared description alone is well over the threshold
+    hasher = deduplicator.hasher
+    similarity = MinHasher.jaccard(
+        hasher.signature(deduplicator.fingerprint(bangalore.title, bangalore.company, bangalore.location,
+                                                  DESCRIPTION)),
+        hasher.signature(deduplicator.fingerprint(pune.title, pune.company, pune.location, DESCRIPTION))
+    )
+    assert similarity >= deduplicator.threshold
+
+    stats = deduplicator.deduplicate(db, [bangalore, pune, senior])
+
+    assert stats['duplicates'] == 0
+    for job in (bangalore, pune, senior):
+        assert job.is_active and job.duplicate_of_id is None
+
+
+def test_inactive_canonical_is_not_joined(db):
+    deduplicator = JobDeduplicator()
+    expired = make_job(db)
+    deduplicator.deduplicate(db, [expired])
+    expired.is_active = False
+    db.commit()
+
+    repost = make_job(db, source="wellfound")
+    deduplicator.deduplicate(db, [repost])
+    assert repost.is_active and repost.duplicate_of_id is None
+
+    # Later reposts join the new active canonical
+    another = make_job(db, source="naukri")
+    deduplicator.deduplicate(db, [another])
+    assert not another.is_active and another.duplicate_of_id == repost.id
@@ -0,0 +1,69 @@
+from database.models import Job, JobSignature, ScrapingJob
+from scrapers.base import JobSource
+from scrapers.runner import ScrapeRunner, ScrapeTask
+
+
+class FailingSource(JobSource):
+    """Yields the given jobs, then fails like a scraper losing its connection."""
+
+    name = "test"
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    def fetch_listing_page(self, query, location="", page=0, filters=None):
+        return None
+
+    def fetch_detail_page(self, listing):
+        return None
+
+    def iter_jobs(self, query, location="", limit=50, filters=None):
+        yield from self.jobs
+        raise ConnectionError("connection reset")
+
+
+def job(external_id, title):
+    return {"title": title, "company": f"Company {external_id}", "location": "Pune", "source": "test",
+            "external_id": external_id, "description": f"{title} role number {external_id}"}
+
+
+def test_failed_scrape_keeps_flushed_batches_and_counts_new_jobs(session_factory, db):
+    db.add(Job(title="Old title", company="Company 1", source="test", external_id="1", is_active=True))
+    db.commit()
+
+    jobs = [job("1", "Data Engineer"), job("2", "Backend Developer"), job("3", "QA Analyst"),
+            job("4", "Product Designer"), {"title": "", "company": "Missing"}, job("5", "SRE")]
+    runner = ScrapeRunner(session_factory=session_factory, batch_size=4)
+
+    result = runner.run_task(ScrapeTask(FailingSource(jobs), "engineer"))
+
+    assert result['status'] == "failed"
+    assert (result['found'], result['created'], result['updated'], result['skipped']) == (6, 4, 1, 1)
+
+    scraping_job = db.query(ScrapingJob).one()
+    assert scraping_job.status == "failed" and "connection reset" in scraping_job.error_message
+    assert scraping_job.jobs_found == 6
+    # Job 1 was only refreshed
+    assert scraping_job.jobs_saved == 4
+
+    rows = {row.external_id: row.title for row in db.query(Job)}
+    assert rows == {"1": "Data Engineer", "2": "Backend Developer", "3": "QA Analyst",
+                    "4": "Product Designer", "5": "SRE"}
+
+
+def test_deduplication_can_be_turned_off(session_factory, db):
+    jobs = [job("1", "Data Engineer"), dict(job("1", "Data Engineer"), external_id="2")]
+
+    ScrapeRunner(session_factory=session_factory, deduplicator=None).run_task(ScrapeTask(FailingSource(jobs), "x"))
+
+    assert db.query(JobSignature).count() == 0
+    assert all(row.is_active and row.duplicate_of_id is None for row in db.query(Job))
+
+
+def test_shared_deduplicator_is_used_by_default(session_factory, db):
+    jobs = [job("1", "Data Engineer"), dict(job("1", "Data Engineer"), external_id="2")]
+
+    ScrapeRunner(session_factory=session_factory).run_task(ScrapeTask(FailingSource(jobs), "x"))
+
+    rows = {row.external_id: row for row in db.query(Job)}
+    assert rows["2"].duplicate_of_id == rows["1"].id and not rows["2"].is_active
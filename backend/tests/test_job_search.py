@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from database.migrate import upgrade_to_head
+from database.models import Job
+from schemas.schemas import JobSearchRequest
+from services.job_search import JobSearch
+from services.pagination import encode_cursor
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    """Migrated SQLite database (with jobs_fts) holding five Python postings."""
+    path = tmp_path / "search.db"
+    upgrade_to_head(f"sqlite:///{path}")
+    engine = create_engine(f"sqlite:///{path}")
+    with Session(engine) as db:
+        db.add_all([
+            Job(title=f"Python Developer {i}", company="Acme", location="Pune", description="Python and SQL",
+                is_active=True)
+            for i in range(5)
+        ])
+        db.commit()
+    engine.dispose()
+    return f"sqlite+aiosqlite:///{path}"
+
+
+def search(database_url, request, cursor=None):
+    async def run():
+        engine = create_async_engine(database_url)
+        try:
+            async with AsyncSession(engine) as db:
+                return await JobSearch(rank_window=3).search(db, request, cursor)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+def test_ranked_pages_follow_the_cursor(database_url):
+    request = JobSearchRequest(query="python", limit=2)
+
+    first = search(database_url, request)
+    second = search(database_url, request, first.next_cursor)
+
+    assert first.truncated and second.truncated
+    assert len(first.items) == 2 and len(second.items) == 1
+    assert not second.has_more
+    assert {job.id for job in first.items}.isdisjoint(job.id for job in second.items)
+
+
+@pytest.mark.parametrize("values", [
+    {"id": 3},  # issued by the same search before a text query was added
+    {"id": 3, "s": "high", "w": 1},
+    {"id": 3, "s": 1.0, "w": "1"},
+    {"id": 3, "s": True, "w": 1},
+    {"id": 3, "s": 1.0, "w": 1, "t": "yes"},
+])
+def test_ranked_search_rejects_malformed_cursors(database_url, values):
+    with pytest.raises(ValueError):
+        search(database_url, JobSearchRequest(query="python"), encode_cursor(values))
+
+
+def test_id_cursor_still_pages_unranked_search(database_url):
+    page = search(database_url, JobSearchRequest(limit=2))
+    rest = search(database_url, JobSearchRequest(limit=10), page.next_cursor)
+    assert len(rest.items) == 3
@@ -0,0 +1,32 @@
+import json
+
+from scrapers.base import JobSource
+
+
+class PagedSource(JobSource):
+    """Serves JSON listing pages from memory."""
+
+    name = "paged"
+    page_size = 3
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def fetch_listing_page(self, query, location="", page=0, filters=None):
+        return json.dumps(self.pages[page]) if page < len(self.pages) else None
+
+    def fetch_detail_page(self, listing):
+        return None
+
+
+def test_paginate_skips_repeated_listings_but_keeps_ones_without_a_key():
+    source = PagedSource([
+        [{"external_id": "1", "title": "A"}, {"title": "No id 1"}, {"title": "No id 2"}],
+        [{"external_id": "1", "title": "A again"}, {"external_url": "https://jobs/9", "title": "B"},
+         {"title": "No id 3"}],
+        [{"external_url": "https://jobs/9", "title": "B again"}],
+    ])
+
+    titles = [listing["title"] for listing in source.paginate("python", limit=50)]
+
+    assert titles == ["A", "No id 1", "No id 2", "B", "No id 3"]
@@ -0,0 +1,45 @@
+import httpx
+import pytest
+
+from services.metrics import counter, serve_metrics
+
+REQUESTS = counter("test_metrics_requests", "Requests seen by the metrics tests")
+
+
+@pytest.fixture
+def metrics_server():
+    servers = []
+
+    def start(token):
+        server = serve_metrics(0, token=token)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def url(server, path="/metrics"):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def test_worker_endpoint_requires_the_token(metrics_server):
+    REQUESTS.inc()
+    server = metrics_server("s3cret")
+
+    assert httpx.get(url(server)).status_code == 401
+    assert httpx.get(url(server), headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = httpx.get(url(server), headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    assert "test_metrics_requests" in response.text
+
+
+def test_worker_endpoint_without_token_listens_on_localhost(metrics_server):
+    server = metrics_server("")
+
+    assert server.server_address[0] == "127.0.0.1"
+    assert httpx.get(url(server)).status_code == 200
+    assert httpx.get(url(server, "/other")).status_code == 404
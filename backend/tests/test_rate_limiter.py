@@ -0,0 +1,58 @@
+import fakeredis
+import pytest
+
+from services import rate_limiter
+from services.rate_limiter import SlidingWindowLimiter
+
+# (seconds since start, key) for a client that keeps retrying past the limit
+REQUESTS = [(0, "a")] * 5 + [(1, "b"), (5, "a"), (9, "a"), (10, "a")] + [(15, "a")] * 3 + [(21, "a"), (30, "a")]
+EXPECTED = [
+    (True, 0), (True, 0), (True, 0), (False, 10), (False, 10),  # limit of 3 per 10 s
+    (True, 0),  # other keys are counted separately
+    (False, 5), (False, 1),
+    (False, 10),  # the 3 allowed requests fully weigh on the next window
+    # Half the window has passed: 3 * 0.5 = 1.5, since the 4 rejections were not counted
+    (True, 0), (True, 0), (False, 5),
+    (True, 0),  # 2 * 0.9 = 1.8
+    (True, 0),
+]
+
+
+def run(limiter, monkeypatch):
+    results = []
+    for offset, key in REQUESTS:
+        monkeypatch.setattr(rate_limiter.time, "time", lambda: 1000.0 + offset)
+        results.append(limiter.hit(key))
+    return results
+
+
+@pytest.mark.parametrize("backend", ["local", "redis"])
+def test_backends_agree_on_a_retrying_client(monkeypatch, backend):
+    redis_client = fakeredis.FakeRedis() if backend == "redis" else None
+    limiter = SlidingWindowLimiter("login_email", 3, 10, redis_client=redis_client)
+
+    assert run(limiter, monkeypatch) == EXPECTED
+
+
+def test_redis_counts_only_allowed_requests(monkeypatch):
+    redis_client = fakeredis.FakeRedis()
+    limiter = SlidingWindowLimiter("login_email", 3, 10, redis_client=redis_client)
+    monkeypatch.setattr(rate_limiter.time, "time", lambda: 1000.0)
+
+    for _ in range(10):
+        limiter.hit("a")
+
+    assert int(redis_client.get("ratelimit:login_email:a:100")) == 3
+    assert 0 < redis_client.ttl("ratelimit:login_email:a:100") <= 20
+
+
+def test_redis_errors_fall_back_to_local_counters(monkeypatch):
+    limiter = SlidingWindowLimiter("login_email", 1, 10, redis_client=fakeredis.FakeRedis())
+
+    def unavailable(**kwargs):
+        raise ConnectionError("redis is down")
+
+    monkeypatch.setattr(limiter, "_redis_hit", unavailable)
+
+    assert limiter.hit("a") == (True, 0)
+    assert limiter.hit("a")[0] is False